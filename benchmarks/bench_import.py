@@ -0,0 +1,105 @@
+"""
+Измерение времени импорта главного скрипта (python -X importtime).
+
+Выводит общее время импорта и самые дорогие модули, а также проверяет,
+что при импорте не загружаются библиотеки визуализации (они нужны только
+при построении графиков и Excel). С параметром --max-ms завершается с
+ошибкой, если медианное время импорта превышает порог.
+
+Пример запуска:
+    python benchmarks/bench_import.py --repeat 5 --max-ms 500
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+# Библиотеки, которые не должны загружаться при импорте главного скрипта
+HEAVY_MODULES = ('matplotlib', 'networkx', 'numpy', 'pandas', 'pyvis')
+
+
+def measure_import(module: str) -> Tuple[float, Dict[str, int]]:
+    """
+    Импортирует модуль в новом процессе с параметром -X importtime.
+
+    Args:
+        module: Имя импортируемого модуля
+
+    Returns:
+        Кортеж (общее время импорта в мс, накопленное время по модулям в мкс)
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=SRC_DIR, check=True, capture_output=True, text=True)
+
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        # Формат строки: "import time: self [us] | cumulative | imported package"
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, total, name = line[len('import time:'):].split('|')
+        cumulative[name.strip()] = int(total)
+
+    return cumulative[module] / 1000, cumulative
+
+
+def top_modules(cumulative: Dict[str, int], count: int) -> List[Tuple[str, int]]:
+    """
+    Выбирает модули верхнего уровня с наибольшим накопленным временем импорта.
+
+    Args:
+        cumulative: Накопленное время по модулям в мкс
+        count: Количество модулей
+
+    Returns:
+        Список пар (модуль, время в мкс)
+    """
+    roots = {}
+    for name, total in cumulative.items():
+        root = name.split('.')[0]
+        roots[root] = max(roots.get(root, 0), total)
+    return sorted(roots.items(), key=lambda item: -item[1])[:count]
+
+
+def main():
+    """
+    Запускает измерение и выводит результаты.
+    """
+    parser = argparse.ArgumentParser(description='Время импорта главного скрипта')
+    parser.add_argument('--module', default='main', help='Импортируемый модуль (из каталога src)')
+    parser.add_argument('--repeat', '-r', type=int, default=5, help='Количество повторов')
+    parser.add_argument('--top', type=int, default=10, help='Количество самых дорогих модулей')
+    parser.add_argument('--max-ms', type=float, default=None,
+                        help='Допустимое медианное время импорта в мс (превышение - код возврата 1)')
+    args = parser.parse_args()
+
+    runs = [measure_import(args.module) for _ in range(args.repeat)]
+    median_ms = statistics.median(total for total, _ in runs)
+    cumulative = runs[-1][1]
+
+    print(f"Импорт {args.module}: {median_ms:.1f} мс (медиана из {args.repeat})")
+    print(f"{'Модуль':<32} {'Время, мс':>10}")
+    for name, total in top_modules(cumulative, args.top):
+        print(f"{name:<32} {total / 1000:>10.1f}")
+
+    failed = False
+    heavy = [name for name in HEAVY_MODULES if name in cumulative]
+    if heavy:
+        print(f"Ошибка: при импорте загружаются библиотеки визуализации: {', '.join(heavy)}")
+        failed = True
+
+    if args.max_ms is not None and median_ms > args.max_ms:
+        print(f"Ошибка: время импорта превышает {args.max_ms:.0f} мс")
+        failed = True
+
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Время извлечения текста PDF: до первой страницы и полное, по числу процессов.
+
+Первая страница показывает, через сколько после начала чтения токенизатор
+получает текст; полное время - выигрыш от параллельного извлечения.
+
+Пример запуска:
+    python benchmarks/bench_pdf.py --workers 1,2,4
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from morpho_analyzer.text_processor import iter_pdf_pages, iter_tokenize_text
+
+
+DEFAULT_INPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                             'data', 'input', 'Исходный текст 1.pdf')
+
+
+def measure(path: str, workers: int):
+    """
+    Измеряет время до первого токена и полное время чтения и токенизации.
+
+    Args:
+        path: Путь к PDF-файлу
+        workers: Количество процессов
+
+    Returns:
+        Кортеж (время до первого токена в с, полное время в с, количество страниц, количество токенов)
+    """
+    pages = 0
+
+    def counted():
+        nonlocal pages
+        for page in iter_pdf_pages(path, workers):
+            pages += 1
+            yield page
+
+    start = time.perf_counter()
+    first_token = None
+    token_count = 0
+    for _ in iter_tokenize_text(counted()):
+        if first_token is None:
+            first_token = time.perf_counter() - start
+        token_count += 1
+    return first_token or 0.0, time.perf_counter() - start, pages, token_count
+
+
+def main():
+    """
+    Запускает измерения и выводит таблицу результатов.
+    """
+    parser = argparse.ArgumentParser(description='Время извлечения текста PDF')
+    parser.add_argument('--input', '-i', default=DEFAULT_INPUT, help='PDF-файл')
+    parser.add_argument('--workers', '-w', default='1,2',
+                        help='Количество процессов через запятую')
+    args = parser.parse_args()
+
+    print(f"Ядер: {os.cpu_count()}")
+    print(f"{'Процессов':>10} {'Первый токен, с':>16} {'Всего, с':>10} {'Страниц':>8} {'Токенов':>9}")
+    for workers in (int(value) for value in args.workers.split(',')):
+        first_token, total, pages, tokens = measure(args.input, workers)
+        print(f"{workers:>10} {first_token:>16.2f} {total:>10.2f} {pages:>8} {tokens:>9}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+"""
+Сравнение размера и времени записи файла результатов анализа.
+
+Прежний формат (json.dump с indent=2 и копиями данных слов в дереве)
+сравнивается с форматами write_results: компактный JSON со ссылками на
+уникальный анализ по номерам и счетчиками повторов, JSON Lines и, если установлены пакеты, MessagePack и Parquet.
+
+Пример запуска:
+    python benchmarks/bench_results.py --repeat 3
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from morpho_analyzer.morphology import get_shared_analyzer
+from morpho_analyzer.results import RESULT_FORMATS, MorphoJSONEncoder, load_results, write_results
+from morpho_analyzer.syllables import get_syllabification_stats, syllabify_words
+from morpho_analyzer.text_processor import read_text_file, tokenize_text
+from morpho_analyzer.trie import PrefixTree, walk
+
+
+DEFAULT_INPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                             'data', 'input', 'Исходный текст 1.txt')
+
+
+def build_data(input_path: str):
+    """
+    Выполняет анализ текста и строит дерево, как главный скрипт.
+
+    Args:
+        input_path: Путь к текстовому файлу
+
+    Returns:
+        Кортеж (результаты анализа слов, статистика слогов, дерево)
+    """
+    analyzed_text = get_shared_analyzer().analyze_tokens(tokenize_text(read_text_file(input_path)))
+    words = [item['word'] for item in analyzed_text]
+    for item, syllables in zip(analyzed_text, syllabify_words(words)):
+        item['syllables'] = syllables
+
+    trie = PrefixTree()
+    for item in analyzed_text:
+        trie.insert(item['syllables'], item)
+
+    return analyzed_text, get_syllabification_stats(words), trie
+
+
+def serialize_legacy(trie: PrefixTree):
+    """
+    Сериализует дерево прежним способом: копия данных слова на каждую вставку.
+    """
+    data = trie.serialize()
+    for node, _, _, _ in walk(data['root'], children=lambda d: d['children'].items()):
+        counts = node.pop('word_counts', None)
+        if counts:
+            node['word_data'] = [item for item, count in zip(node['word_data'], counts)
+                                 for _ in range(count)]
+    return data
+
+
+def write_legacy(path: str, analyzed_text, syllable_stats, trie) -> None:
+    """
+    Записывает результаты прежним способом (отступы, копии данных слов в дереве).
+    """
+    output_data = {
+        "analyzed_text": analyzed_text,
+        "syllable_stats": syllable_stats,
+        "trie": serialize_legacy(trie)
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(output_data, f, ensure_ascii=False, indent=2, cls=MorphoJSONEncoder)
+
+
+def timed(function, repeat: int) -> float:
+    """
+    Возвращает наименьшее время выполнения функции за несколько повторов.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """
+    Запускает сравнение и выводит таблицу результатов.
+    """
+    parser = argparse.ArgumentParser(description='Сравнение форматов файла результатов')
+    parser.add_argument('--input', '-i', default=DEFAULT_INPUT, help='Текстовый файл')
+    parser.add_argument('--repeat', '-r', type=int, default=3, help='Количество повторов')
+    args = parser.parse_args()
+
+    analyzed_text, syllable_stats, trie = build_data(args.input)
+    print(f"Слов: {len(analyzed_text)}")
+    print(f"{'Формат':<16} {'Размер, КБ':>12} {'Запись, мс':>12}")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        legacy_path = os.path.join(temp_dir, 'legacy.json')
+        legacy_time = timed(lambda: write_legacy(legacy_path, analyzed_text, syllable_stats, trie),
+                            args.repeat)
+        legacy_size = os.path.getsize(legacy_path)
+        print(f"{'json indent=2':<16} {legacy_size / 1024:>12.0f} {legacy_time * 1000:>12.1f}")
+
+        for name, extension in RESULT_FORMATS.items():
+            path = os.path.join(temp_dir, 'results' + extension)
+            try:
+                elapsed = timed(lambda: write_results(path, analyzed_text, syllable_stats, trie, name),
+                                args.repeat)
+            except ImportError as e:
+                print(f"{name:<16} пропущен: {e}")
+                continue
+
+            size = os.path.getsize(path)
+            print(f"{name:<16} {size / 1024:>12.0f} {elapsed * 1000:>12.1f}"
+                  f"   (в {legacy_size / size:.1f} раза меньше, в {legacy_time / elapsed:.1f} раза быстрее)")
+
+            # Проверяем, что из файла восстанавливаются те же результаты
+            if name != 'parquet':
+                loaded_text, _, loaded_trie = load_results(path)
+                if loaded_text != analyzed_text or loaded_trie.get_statistics() != trie.get_statistics():
+                    raise SystemExit(f"Ошибка: результаты формата {name} не совпадают после чтения")
+
+
+if __name__ == '__main__':
+    main()
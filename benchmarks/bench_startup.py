@@ -0,0 +1,127 @@
+"""
+Измерение времени запуска морфологического анализатора.
+
+Каждое измерение выполняется в отдельном процессе интерпретатора, чтобы
+учитывать холодный импорт модулей и загрузку словарей:
+    - импорт модуля morphology;
+    - создание первого и второго MorphologicalAnalyzer;
+    - первый разбор слова (загрузка словарей pymorphy2);
+    - готовность пула процессов с предварительной загрузкой словарей
+      в родителе (preload) и без нее.
+
+Пример запуска:
+    python benchmarks/bench_startup.py --workers 4 --repeat 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+# Код измерения этапов запуска в новом процессе
+STARTUP_CODE = """
+import json, sys, time
+sys.path.insert(0, {src!r})
+start = time.perf_counter()
+from morpho_analyzer.morphology import MorphologicalAnalyzer
+imported = time.perf_counter()
+first = MorphologicalAnalyzer()
+created = time.perf_counter()
+first.analyze_word('книга')
+parsed = time.perf_counter()
+second = MorphologicalAnalyzer()
+second.analyze_word('стол')
+repeated = time.perf_counter()
+print(json.dumps({{
+    'import': imported - start,
+    'first_analyzer': created - imported,
+    'first_parse': parsed - created,
+    'second_analyzer': repeated - parsed,
+}}))
+"""
+
+# Код измерения готовности пула: все процессы выполнили по одному разбору
+POOL_CODE = """
+import json, sys, time
+sys.path.insert(0, {src!r})
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from morpho_analyzer import parallel
+from morpho_analyzer.morphology import preload
+
+def parse(word):
+    return parallel._worker_analyzer.analyze_word(word)['pos']
+
+if __name__ == '__main__':
+    multiprocessing.set_start_method('fork')
+    start = time.perf_counter()
+    if {preload}:
+        preload()
+    with ProcessPoolExecutor(max_workers={workers}, initializer=parallel._init_worker) as executor:
+        list(executor.map(parse, ['книга'] * {workers}))
+    print(json.dumps({{'pool': time.perf_counter() - start}}))
+"""
+
+
+def run_measurement(code: str) -> dict:
+    """
+    Выполняет код измерения в новом процессе интерпретатора.
+
+    Args:
+        code: Код, печатающий результаты в формате JSON
+
+    Returns:
+        Словарь с временами этапов в секундах
+    """
+    output = subprocess.run([sys.executable, '-c', code], check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def median_times(code: str, repeat: int) -> dict:
+    """
+    Повторяет измерение и вычисляет медиану по каждому этапу.
+
+    Args:
+        code: Код измерения
+        repeat: Количество повторов
+
+    Returns:
+        Словарь с медианными временами этапов
+    """
+    runs = [run_measurement(code) for _ in range(repeat)]
+    return {name: statistics.median(run[name] for run in runs) for name in runs[0]}
+
+
+def main():
+    """
+    Запускает измерения и выводит таблицу результатов.
+    """
+    parser = argparse.ArgumentParser(description='Время запуска морфологического анализатора')
+    parser.add_argument('--workers', '-w', type=int, default=4, help='Количество процессов пула')
+    parser.add_argument('--repeat', '-r', type=int, default=5, help='Количество повторов')
+    args = parser.parse_args()
+
+    startup = median_times(STARTUP_CODE.format(src=SRC_DIR), args.repeat)
+    print(f"{'Этап':<36} {'Время, мс':>10}")
+    for name, value in startup.items():
+        print(f"{name:<36} {value * 1000:>10.1f}")
+
+    if not hasattr(os, 'fork'):
+        print("Пул процессов: fork недоступен, измерение пропущено")
+        return
+
+    for preload in (False, True):
+        times = median_times(POOL_CODE.format(src=SRC_DIR, workers=args.workers, preload=preload),
+                             args.repeat)
+        label = f"pool x{args.workers} ({'preload' if preload else 'без preload'})"
+        print(f"{label:<36} {times['pool'] * 1000:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
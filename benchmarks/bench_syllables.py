@@ -0,0 +1,76 @@
+"""
+Сравнение скорости эталонного и предкомпилированного разбиения на слоги.
+
+Слова берутся из входного файла (при необходимости текст повторяется,
+чтобы получить заданное количество слов).
+
+Пример запуска:
+    python benchmarks/bench_syllables.py --words 500000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+# Эталонная реализация общая с тестами
+sys.path.insert(0, ROOT_DIR)
+
+from morpho_analyzer.syllables import split_many
+from morpho_analyzer.text_processor import read_text_file, tokenize_text
+from tests.reference_syllables import split_into_syllables_reference
+
+
+DEFAULT_INPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                             'data', 'input', 'Исходный текст 1.txt')
+
+
+def load_words(input_path: str, size: int):
+    """
+    Формирует список слов заданного размера из текста.
+
+    Args:
+        input_path: Путь к текстовому файлу
+        size: Требуемое количество слов
+
+    Returns:
+        Список слов
+    """
+    words = tokenize_text(read_text_file(input_path), keep_punctuation=False)
+    repeats = size // len(words) + 1
+    return (words * repeats)[:size]
+
+
+def main():
+    """
+    Запускает сравнение и выводит таблицу результатов.
+    """
+    parser = argparse.ArgumentParser(description='Сравнение алгоритмов разбиения на слоги')
+    parser.add_argument('--input', '-i', default=DEFAULT_INPUT, help='Текстовый файл со словами')
+    parser.add_argument('--words', '-n', type=int, default=300000, help='Количество слов')
+    args = parser.parse_args()
+
+    words = load_words(args.input, args.words)
+
+    start = time.perf_counter()
+    expected = [split_into_syllables_reference(word) for word in words]
+    reference_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = split_many(words)
+    compiled_time = time.perf_counter() - start
+
+    if result != expected:
+        raise SystemExit("Ошибка: результаты разбиения не совпадают")
+
+    print(f"Слов: {len(words)}")
+    print(f"{'Реализация':<32} {'Время, с':>10} {'Слов/с':>12}")
+    print(f"{'split_into_syllables_reference':<32} {reference_time:>10.3f} {len(words) / reference_time:>12.0f}")
+    print(f"{'split_many':<32} {compiled_time:>10.3f} {len(words) / compiled_time:>12.0f}")
+    print(f"Ускорение: {reference_time / compiled_time:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
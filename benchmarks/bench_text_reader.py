@@ -0,0 +1,93 @@
+"""
+Память и скорость чтения большого текстового файла целиком и блоками.
+
+Из входного файла собирается файл заданного размера (в cp1251, как большая
+часть архива), который токенизируется двумя способами: после чтения целиком
+(read_text_file) и потоково по блокам (iter_text_file). Каждый способ
+выполняется в отдельном процессе, чтобы пиковая память (ru_maxrss) не
+смешивалась.
+
+Пример запуска:
+    python benchmarks/bench_text_reader.py --size-mb 200
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, SRC_DIR)
+
+from morpho_analyzer.text_processor import iter_text_file, iter_tokenize_text, read_text_file, tokenize_text
+
+
+DEFAULT_INPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                             'data', 'input', 'Исходный текст 1.txt')
+
+
+def make_file(input_path: str, path: str, size_mb: int, encoding: str) -> None:
+    """
+    Записывает файл заданного размера, повторяя текст входного файла.
+
+    Args:
+        input_path: Исходный текстовый файл
+        path: Путь к создаваемому файлу
+        size_mb: Размер в мегабайтах
+        encoding: Кодировка создаваемого файла
+    """
+    text = read_text_file(input_path).encode(encoding, errors='replace')
+    with open(path, 'wb') as f:
+        for _ in range(max(1, size_mb * 2 ** 20 // len(text))):
+            f.write(text)
+
+
+def run_mode(mode: str, path: str) -> None:
+    """
+    Токенизирует файл выбранным способом и печатает токены, время и пиковую память.
+    """
+    start = time.perf_counter()
+    if mode == 'whole':
+        count = len(tokenize_text(read_text_file(path)))
+    else:
+        count = sum(1 for _ in iter_tokenize_text(iter_text_file(path)))
+    elapsed = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(count, elapsed, peak_mb)
+
+
+def main():
+    """
+    Запускает измерения и выводит таблицу результатов.
+    """
+    parser = argparse.ArgumentParser(description='Чтение текстового файла целиком и блоками')
+    parser.add_argument('--input', '-i', default=DEFAULT_INPUT, help='Исходный текстовый файл')
+    parser.add_argument('--size-mb', '-s', type=int, default=100, help='Размер тестового файла, МБ')
+    parser.add_argument('--encoding', default='cp1251', help='Кодировка тестового файла')
+    parser.add_argument('--run', choices=['whole', 'blocks'], help=argparse.SUPPRESS)
+    parser.add_argument('--path', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        run_mode(args.run, args.path)
+        return
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'big.txt')
+        make_file(args.input, path, args.size_mb, args.encoding)
+        size_mb = os.path.getsize(path) / 2 ** 20
+        print(f"Файл: {size_mb:.0f} МБ ({args.encoding})")
+        print(f"{'Способ':<10} {'Токенов':>10} {'Время, с':>10} {'МБ/с':>8} {'Пик памяти, МБ':>16}")
+
+        for mode in ('whole', 'blocks'):
+            output = subprocess.run([sys.executable, os.path.abspath(__file__), '--run', mode, '--path', path],
+                                    capture_output=True, text=True, check=True).stdout.split()
+            count, elapsed, peak_mb = int(output[0]), float(output[1]), float(output[2])
+            print(f"{mode:<10} {count:>10} {elapsed:>10.2f} {size_mb / elapsed:>8.1f} {peak_mb:>16.0f}")
+
+
+if __name__ == '__main__':
+    main()
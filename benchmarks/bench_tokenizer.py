@@ -0,0 +1,110 @@
+"""
+Скорость токенизации (МБ/с): прежняя реализация и однопроходный токенизатор.
+
+Прежняя реализация проверяла каждое совпадение вторым регулярным выражением
+и собирала кортежи, которые tokenize_text затем разворачивал в новый список.
+Результаты новой реализации сверяются с прежней.
+
+Пример запуска:
+    python benchmarks/bench_tokenizer.py --repeat 5
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from morpho_analyzer.text_processor import (iter_token_stream, read_text_file, tokenize,
+                                            tokenize_text)
+
+
+DEFAULT_INPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                             'data', 'input', 'Исходный текст 1.txt')
+
+
+def legacy_tokenize(text, keep_punctuation=True):
+    """
+    Прежняя реализация tokenize.
+    """
+    tokens = []
+    if keep_punctuation:
+        for match in re.finditer(r'([^\W\d_]+|\d+|[.,!?;:«»()\[\]{}])', text):
+            token = match.group(0)
+            if token.isspace():
+                continue
+            if re.match(r'[.,!?;:«»()\[\]{}]', token):
+                if tokens and tokens[-1][1] is None:
+                    tokens[-1] = (tokens[-1][0], token)
+                else:
+                    tokens.append(("", token))
+            else:
+                tokens.append((token, None))
+    else:
+        tokens = [(word, None) for word in re.findall(r'[^\W\d_]+|\d+', text)]
+    return tokens
+
+
+def legacy_tokenize_text(text, keep_punctuation=True):
+    """
+    Прежняя реализация tokenize_text.
+    """
+    result = []
+    for token, punct in legacy_tokenize(text, keep_punctuation):
+        if token:
+            result.append(token)
+        if punct and keep_punctuation:
+            result.append(punct)
+    return result
+
+
+def timed(function, repeat: int) -> float:
+    """
+    Возвращает наименьшее время выполнения функции за несколько повторов.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """
+    Запускает измерения и выводит таблицу результатов.
+    """
+    parser = argparse.ArgumentParser(description='Скорость токенизации')
+    parser.add_argument('--input', '-i', default=DEFAULT_INPUT, help='Текстовый файл')
+    parser.add_argument('--repeat', '-r', type=int, default=5, help='Количество повторов')
+    parser.add_argument('--copies', '-c', type=int, default=20,
+                        help='Сколько раз повторить текст файла')
+    args = parser.parse_args()
+
+    text = read_text_file(args.input) * args.copies
+    size_mb = len(text.encode('utf-8')) / 2 ** 20
+    print(f"Текст: {size_mb:.1f} МБ")
+    print(f"{'Функция':<42} {'Прежняя, МБ/с':>14} {'Новая, МБ/с':>12} {'Ускорение':>10}")
+
+    for keep_punctuation in (True, False):
+        cases = [
+            (f"tokenize(keep_punctuation={keep_punctuation})",
+             legacy_tokenize, tokenize),
+            (f"tokenize_text(keep_punctuation={keep_punctuation})",
+             legacy_tokenize_text, tokenize_text),
+            (f"iter_token_stream(keep_punctuation={keep_punctuation})",
+             legacy_tokenize_text, lambda t, k: list(iter_token_stream(t, k))),
+        ]
+        for name, legacy, current in cases:
+            if current(text, keep_punctuation) != legacy(text, keep_punctuation):
+                raise SystemExit(f"Ошибка: результаты {name} не совпадают с прежней реализацией")
+            legacy_time = timed(lambda: legacy(text, keep_punctuation), args.repeat)
+            current_time = timed(lambda: current(text, keep_punctuation), args.repeat)
+            print(f"{name:<42} {size_mb / legacy_time:>14.1f} {size_mb / current_time:>12.1f} "
+                  f"{legacy_time / current_time:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
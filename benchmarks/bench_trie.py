@@ -0,0 +1,122 @@
+"""
+Сравнение памяти и скорости поиска PrefixTree и CompactPrefixTree.
+
+Дерево строится по словам из входного файла, к которым при необходимости
+добавляются синтетические слова из тех же слогов, чтобы получить заданный
+объем словаря.
+
+Пример запуска:
+    python benchmarks/bench_trie.py --words 300000
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from morpho_analyzer.compact_trie import CompactPrefixTree
+from morpho_analyzer.syllables import split_into_syllables
+from morpho_analyzer.text_processor import read_text_file, tokenize_text
+from morpho_analyzer.trie import PrefixTree
+
+
+DEFAULT_INPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                             'data', 'input', 'Исходный текст 1.txt')
+
+
+def build_vocabulary(input_path: str, size: int, seed: int = 0):
+    """
+    Формирует список слов (в виде слогов) заданного размера.
+
+    Args:
+        input_path: Путь к текстовому файлу с исходными словами
+        size: Требуемое количество уникальных слов
+        seed: Начальное значение генератора случайных чисел
+
+    Returns:
+        Список кортежей слогов
+    """
+    words = tokenize_text(read_text_file(input_path), keep_punctuation=False)
+    vocabulary = {tuple(split_into_syllables(word)) for word in words}
+
+    syllables = sorted({syllable for word in vocabulary for syllable in word})
+    rng = random.Random(seed)
+
+    # Дополняем словарь синтетическими словами из реальных слогов
+    while len(vocabulary) < size:
+        length = rng.randint(1, 6)
+        vocabulary.add(tuple(rng.choice(syllables) for _ in range(length)))
+
+    return sorted(vocabulary)[:size] if size else sorted(vocabulary)
+
+
+def measure(tree_class, vocabulary, lookups):
+    """
+    Измеряет память, время построения и время поиска для класса дерева.
+
+    Args:
+        tree_class: Класс префиксного дерева
+        vocabulary: Список слов (кортежей слогов)
+        lookups: Список слов для поиска
+
+    Returns:
+        Кортеж (память в МБ, время построения в с, среднее время поиска в мкс)
+    """
+    payload = {'pos': 'NOUN'}
+
+    def build():
+        tree = tree_class()
+        for syllables in vocabulary:
+            tree.insert(list(syllables), payload)
+        return tree
+
+    # Память измеряем отдельно: tracemalloc заметно замедляет построение
+    gc.collect()
+    tracemalloc.start()
+    tree = build()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tree
+
+    gc.collect()
+    start = time.perf_counter()
+    tree = build()
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for syllables in lookups:
+        tree.search(syllables)
+    lookup_time = (time.perf_counter() - start) / len(lookups) * 1e6
+
+    return memory / 2 ** 20, build_time, lookup_time
+
+
+def main():
+    """
+    Запускает сравнение и выводит таблицу результатов.
+    """
+    parser = argparse.ArgumentParser(description='Сравнение PrefixTree и CompactPrefixTree')
+    parser.add_argument('--input', '-i', default=DEFAULT_INPUT, help='Текстовый файл с исходными словами')
+    parser.add_argument('--words', '-n', type=int, default=200000, help='Количество уникальных слов')
+    parser.add_argument('--lookups', type=int, default=100000, help='Количество операций поиска')
+    args = parser.parse_args()
+
+    vocabulary = build_vocabulary(args.input, args.words)
+    rng = random.Random(1)
+    lookups = [list(rng.choice(vocabulary)) for _ in range(args.lookups)]
+
+    print(f"Слов: {len(vocabulary)}, операций поиска: {len(lookups)}")
+    print(f"{'Реализация':<20} {'Память, МБ':>12} {'Построение, с':>15} {'Поиск, мкс':>12}")
+
+    for tree_class in (PrefixTree, CompactPrefixTree):
+        memory, build_time, lookup_time = measure(tree_class, vocabulary, lookups)
+        print(f"{tree_class.__name__:<20} {memory:>12.1f} {build_time:>15.2f} {lookup_time:>12.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,34 +1,346 @@
-import PyPDF2
+"""
+Преобразование PDF-файлов в текстовые файлы.
+
+Файлы, папки (PDF ищутся рекурсивно) и шаблоны glob преобразуются в пуле
+процессов, по одному файлу на задачу. Текст записывается в файл по мере
+извлечения страниц. Файл пропускается, если его текстовая версия новее
+PDF или содержимое PDF (хэш SHA-256) не изменилось с прошлого запуска
+согласно манифесту кэша, поэтому повторный запуск обрабатывает только
+измененные документы.
+
+Пример запуска:
+    python pdf_to_text.py data/input "архив/**/*.pdf" --output-dir data/text --workers 4
+"""
+
+import argparse
+import glob
+import hashlib
+import json
 import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from morpho_analyzer.text_processor import iter_pdf_pages
+
+
+# Файл по умолчанию (для запуска без аргументов)
+DEFAULT_INPUT = "Исходный текст 1.pdf"
 
-def pdf_to_txt(pdf_path, output_path=None):
+# Имя манифеста кэша в директории результатов
+MANIFEST_NAME = ".pdf_to_text_manifest.json"
+
+# Размер буфера записи текстового файла и блока чтения при вычислении хэша
+BUFFER_SIZE = 1 << 20
+
+
+def pdf_to_txt(pdf_path: str, output_path: Optional[str] = None) -> str:
     """
     Преобразует PDF файл в текстовый формат
-    
+
+    Страницы записываются в файл по мере извлечения; файл заменяется
+    целиком после записи последней страницы, поэтому прерванное
+    преобразование не оставляет неполного текста.
+
     Args:
         pdf_path: путь к PDF файлу
         output_path: путь для сохранения текста, по умолчанию - то же имя, но с расширением .txt
-    
+
     Returns:
         путь к сохраненному текстовому файлу
     """
+    return convert_pdf(pdf_path, output_path)[0]
+
+
+def convert_pdf(pdf_path: str, output_path: Optional[str] = None) -> Tuple[str, int]:
+    """
+    Преобразует PDF файл в текстовый формат и возвращает количество страниц.
+
+    Args:
+        pdf_path: путь к PDF файлу
+        output_path: путь для сохранения текста (None - рядом с PDF)
+
+    Returns:
+        Кортеж (путь к текстовому файлу, количество страниц)
+    """
     if output_path is None:
-        base_name = os.path.splitext(pdf_path)[0]
-        output_path = f"{base_name}.txt"
-    
-    text = ""
-    with open(pdf_path, 'rb') as pdf_file:
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        for page_num in range(len(pdf_reader.pages)):
-            page = pdf_reader.pages[page_num]
-            text += page.extract_text() + "\n\n"
-    
-    with open(output_path, 'w', encoding='utf-8') as txt_file:
-        txt_file.write(text)
-    
-    return output_path
+        output_path = os.path.splitext(pdf_path)[0] + ".txt"
+
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    pages = 0
+    temp_path = output_path + ".part"
+    try:
+        with open(temp_path, 'w', encoding='utf-8', buffering=BUFFER_SIZE) as txt_file:
+            # Страницы извлекаются в текущем процессе: параллельно
+            # обрабатываются файлы, а не страницы одного файла
+            for page in iter_pdf_pages(pdf_path, workers=1):
+                txt_file.write(page)
+                txt_file.write("\n")
+                pages += 1
+        os.replace(temp_path, output_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    return output_path, pages
+
+
+def file_hash(path: str) -> str:
+    """
+    Вычисляет хэш SHA-256 содержимого файла, читая его блоками.
+
+    Args:
+        path: Путь к файлу
+
+    Returns:
+        Хэш в шестнадцатеричном виде
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(BUFFER_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def collect_pdfs(inputs: Iterable[str], output_dir: Optional[str] = None) -> List[Tuple[str, str]]:
+    """
+    Находит PDF-файлы и определяет пути к их текстовым версиям.
+
+    Args:
+        inputs: Файлы, папки (PDF ищутся рекурсивно) или шаблоны glob
+        output_dir: Директория результатов (None - рядом с PDF). Для папок
+            сохраняется структура подпапок относительно указанной папки
+
+    Returns:
+        Список пар (путь к PDF, путь к текстовому файлу) без повторов,
+        упорядоченный по пути к PDF
+    """
+    jobs: Dict[str, str] = {}
+
+    for pattern in inputs:
+        if os.path.isdir(pattern):
+            root = pattern
+            paths = glob.glob(os.path.join(glob.escape(pattern), '**', '*'), recursive=True)
+        else:
+            root = None
+            paths = glob.glob(pattern, recursive=True) if glob.has_magic(pattern) else [pattern]
+
+        for path in paths:
+            if not path.lower().endswith('.pdf') or not os.path.isfile(path):
+                continue
+            key = os.path.abspath(path)
+            if key in jobs:
+                continue
+
+            relative = os.path.relpath(path, root) if root else os.path.basename(path)
+            if output_dir is None:
+                jobs[key] = os.path.splitext(path)[0] + ".txt"
+            else:
+                jobs[key] = os.path.join(output_dir, os.path.splitext(relative)[0] + ".txt")
+
+    return sorted(jobs.items())
+
+
+def process_file(pdf_path: str, output_path: str, cached_hash: Optional[str] = None,
+                 force: bool = False) -> Dict[str, Any]:
+    """
+    Преобразует один файл, если его текстовая версия устарела.
+
+    Выполняется в процессе-исполнителе. Ошибка в одном файле не прерывает
+    обработку остальных и возвращается в результате.
+
+    Args:
+        pdf_path: Путь к PDF
+        output_path: Путь к текстовому файлу
+        cached_hash: Хэш PDF из манифеста кэша (None - нет записи)
+        force: Преобразовать независимо от кэша
+
+    Returns:
+        Словарь: pdf, output, status ('converted', 'fresh', 'cached', 'error'),
+        sha256, pages, seconds и error (для ошибки)
+    """
+    start = time.perf_counter()
+    result: Dict[str, Any] = {'pdf': pdf_path, 'output': output_path, 'sha256': cached_hash,
+                              'pages': 0, 'seconds': 0.0}
+    try:
+        if not force and os.path.exists(output_path):
+            # Текстовая версия новее PDF - хэш не нужен
+            if os.path.getmtime(output_path) >= os.path.getmtime(pdf_path):
+                result['status'] = 'fresh'
+                return result
+
+            # PDF скопирован или сохранен заново без изменений
+            digest = file_hash(pdf_path)
+            result['sha256'] = digest
+            if digest == cached_hash:
+                os.utime(output_path)
+                result['status'] = 'cached'
+                return result
+        else:
+            result['sha256'] = file_hash(pdf_path)
+
+        _, result['pages'] = convert_pdf(pdf_path, output_path)
+        result['status'] = 'converted'
+    except Exception as e:
+        result['status'] = 'error'
+        result['error'] = str(e)
+    finally:
+        result['seconds'] = time.perf_counter() - start
+
+    return result
+
+
+def load_manifest(path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Читает манифест кэша.
+
+    Args:
+        path: Путь к манифесту
+
+    Returns:
+        Записи по абсолютному пути к PDF (пустой словарь, если манифеста нет
+        или он поврежден)
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(path: str, manifest: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Сохраняет манифест кэша (через временный файл, чтобы не повредить его при сбое).
+
+    Args:
+        path: Путь к манифесту
+        manifest: Записи по абсолютному пути к PDF
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = path + ".part"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(temp_path, path)
+
+
+def convert_batch(jobs: List[Tuple[str, str]], manifest_path: str, workers: int = 0,
+                  force: bool = False, report=print) -> List[Dict[str, Any]]:
+    """
+    Преобразует файлы в пуле процессов, пропуская неизмененные.
+
+    Args:
+        jobs: Пары (путь к PDF, путь к текстовому файлу)
+        manifest_path: Путь к манифесту кэша
+        workers: Количество процессов (0 - по числу ядер, 1 - в текущем процессе)
+        force: Преобразовать все файлы независимо от кэша
+        report: Функция вывода строки о каждом обработанном файле
+
+    Returns:
+        Результаты process_file в порядке завершения
+    """
+    manifest = load_manifest(manifest_path)
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(jobs)))
+
+    def cached_hash(pdf_path: str) -> Optional[str]:
+        return manifest.get(os.path.abspath(pdf_path), {}).get('sha256')
+
+    def finish(result: Dict[str, Any]) -> None:
+        results.append(result)
+        if result['status'] in ('converted', 'cached') and result['sha256']:
+            manifest[os.path.abspath(result['pdf'])] = {'sha256': result['sha256'],
+                                                        'output': os.path.abspath(result['output'])}
+        report(format_result(result))
+
+    results: List[Dict[str, Any]] = []
+    try:
+        if workers == 1:
+            for pdf_path, output_path in jobs:
+                finish(process_file(pdf_path, output_path, cached_hash(pdf_path), force))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(process_file, pdf_path, output_path, cached_hash(pdf_path), force)
+                           for pdf_path, output_path in jobs]
+                for future in as_completed(futures):
+                    finish(future.result())
+    finally:
+        # Манифест сохраняется и при прерывании: готовые файлы не преобразуются повторно
+        save_manifest(manifest_path, manifest)
+
+    return results
+
+
+def format_result(result: Dict[str, Any]) -> str:
+    """
+    Формирует строку отчета о файле.
+
+    Args:
+        result: Результат process_file
+
+    Returns:
+        Строка со статусом, страницами и скоростью
+    """
+    status = result['status']
+    if status == 'converted':
+        speed = result['pages'] / result['seconds'] if result['seconds'] else 0.0
+        return (f"  преобразован  {result['pdf']}: {result['pages']} стр. за {result['seconds']:.2f} с "
+                f"({speed:.1f} стр/с) -> {result['output']}")
+    if status == 'error':
+        return f"  ошибка        {result['pdf']}: {result['error']}"
+    reason = "текст новее PDF" if status == 'fresh' else "PDF не изменился"
+    return f"  пропущен      {result['pdf']} ({reason})"
+
+
+def main() -> int:
+    """
+    Разбирает аргументы командной строки и преобразует файлы.
+
+    Returns:
+        Код возврата (1, если при преобразовании были ошибки)
+    """
+    parser = argparse.ArgumentParser(description='Пакетное преобразование PDF-файлов в текст')
+    parser.add_argument('inputs', nargs='*', default=[DEFAULT_INPUT],
+                        help='PDF-файлы, папки или шаблоны glob (по умолчанию "%(default)s")')
+    parser.add_argument('--output-dir', '-o',
+                        help='Директория для текстовых файлов (по умолчанию - рядом с PDF)')
+    parser.add_argument('--workers', '-w', type=int, default=0,
+                        help='Количество процессов (0 = по числу ядер)')
+    parser.add_argument('--manifest',
+                        help=f'Манифест кэша (по умолчанию {MANIFEST_NAME} в директории результатов)')
+    parser.add_argument('--force', '-f', action='store_true',
+                        help='Преобразовать все файлы, не проверяя кэш')
+    args = parser.parse_args()
+
+    jobs = collect_pdfs(args.inputs, args.output_dir)
+    if not jobs:
+        print("PDF-файлы не найдены")
+        return 1
+
+    manifest_path = args.manifest or os.path.join(args.output_dir or '.', MANIFEST_NAME)
+    print(f"Файлов: {len(jobs)}")
+
+    start = time.perf_counter()
+    results = convert_batch(jobs, manifest_path, workers=args.workers, force=args.force)
+    elapsed = time.perf_counter() - start
+
+    converted = [result for result in results if result['status'] == 'converted']
+    errors = sum(result['status'] == 'error' for result in results)
+    pages = sum(result['pages'] for result in converted)
+    print(f"Преобразовано: {len(converted)}, пропущено: {len(results) - len(converted) - errors}, "
+          f"ошибок: {errors}")
+    print(f"Страниц: {pages} за {elapsed:.2f} с ({pages / elapsed if elapsed else 0.0:.1f} стр/с)")
+
+    return 1 if errors else 0
+
 
 if __name__ == "__main__":
-    pdf_path = "Исходный текст 1.pdf"
-    output_path = pdf_to_txt(pdf_path)
-    print(f"Текст сохранен в файл: {output_path}")
+    sys.exit(main())
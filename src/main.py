@@ -11,20 +11,134 @@
 """
 
 import os
-import json
+import sys
 import argparse
+import logging
 import time
+from collections import Counter
+from contextlib import ExitStack
+from itertools import islice
+from typing import List
 from tqdm import tqdm
 
-from morpho_analyzer.text_processor import read_text_file, tokenize_text, clean_word, normalize_text
+from morpho_analyzer.text_processor import (read_text_file, tokenize_text, clean_word, normalize_text,
+                                            iter_text_file, iter_tokenize_text)
 from morpho_analyzer.morphology import MorphologicalAnalyzer
-from morpho_analyzer.syllables import split_into_syllables, get_syllabification_stats
+from morpho_analyzer.parallel import analyze_tokens_parallel
+from morpho_analyzer.pipeline import (iter_analyzed_tokens, iter_syllabified,
+                                      JsonLinesWriter, run_stream)
+from morpho_analyzer.syllables import SyllableStatistics, syllabify_words
+from morpho_analyzer.tracing import JsonLinesTraceSink, SampledSink
 from morpho_analyzer.trie import PrefixTree
-from morpho_analyzer.visualization import (visualize_trie, visualize_parts_of_speech,
-                                         visualize_syllable_statistics,
-                                         visualize_trie_statistics, create_summary_report,
-                                         visualize_trie_interactive, export_to_excel,
-                                         create_simplified_trie)
+# Модуль визуализации импортирует matplotlib, pandas и pyvis только при построении
+# графиков и Excel, поэтому запуск с --outputs json их не загружает
+from morpho_analyzer.visualization import ExcelStreamWriter
+from morpho_analyzer.results import FORMAT_REQUIREMENTS, RESULT_FORMATS, format_available
+from morpho_analyzer.sinks import OutputContext, select_sinks, render_sinks
+
+
+# Виды результатов, выбираемые параметром --outputs
+OUTPUT_FORMATS = {
+    'json': 'файл результатов анализа в форматах --results-format (JSON Lines в потоковом режиме)',
+    'excel': 'русифицированная таблица Excel',
+    'report': 'отчет в формате Markdown',
+    'charts': 'графики PNG (дерево, части речи, слоги, статистика дерева)',
+    'html': 'интерактивная HTML-визуализация дерева',
+}
+
+
+def _parse_choices(value: str, choices) -> set:
+    """
+    Разбирает список значений, перечисленных через запятую.
+    
+    Args:
+        value: Строка вида "json,excel" или "all"
+        choices: Допустимые значения
+        
+    Returns:
+        Множество выбранных значений ("all" - все допустимые)
+        
+    Raises:
+        argparse.ArgumentTypeError: Если указано неизвестное значение
+    """
+    selected = {name.strip() for name in value.split(',') if name.strip()}
+    if 'all' in selected:
+        return set(choices)
+    
+    unknown = selected - set(choices)
+    if unknown or not selected:
+        raise argparse.ArgumentTypeError(
+            f"неизвестные значения: {', '.join(sorted(unknown)) or value!r}; "
+            f"допустимые: {', '.join(choices)}, all")
+    return selected
+
+
+def parse_outputs(value: str) -> set:
+    """
+    Разбирает список видов результатов, перечисленных через запятую.
+    
+    Args:
+        value: Строка вида "json,excel" или "all"
+        
+    Returns:
+        Множество выбранных видов результатов
+        
+    Raises:
+        argparse.ArgumentTypeError: Если указан неизвестный вид результата
+    """
+    return _parse_choices(value, OUTPUT_FORMATS)
+
+
+def parse_results_formats(value: str) -> set:
+    """
+    Разбирает список форматов файла результатов анализа.
+    
+    Форматы проверяются при разборе аргументов, а не после анализа: "all"
+    означает форматы, доступные в текущем окружении, а явно указанный формат
+    без нужного пакета считается ошибкой.
+    
+    Args:
+        value: Строка вида "json,jsonl" или "all"
+        
+    Returns:
+        Множество выбранных форматов
+        
+    Raises:
+        argparse.ArgumentTypeError: Если указан неизвестный формат или для
+            указанного формата не установлен пакет
+    """
+    selected = _parse_choices(value, RESULT_FORMATS)
+    missing = sorted(name for name in selected if not format_available(name))
+    if 'all' in {name.strip() for name in value.split(',')}:
+        return selected - set(missing)
+    
+    if missing:
+        packages = ' '.join(FORMAT_REQUIREMENTS[name] for name in missing)
+        raise argparse.ArgumentTypeError(
+            f"для форматов {', '.join(missing)} не установлены пакеты: pip install {packages}")
+    return selected
+
+
+def parse_fraction(value: str) -> float:
+    """
+    Разбирает долю - число от 0 до 1.
+    
+    Args:
+        value: Строка с числом
+        
+    Returns:
+        Доля
+        
+    Raises:
+        argparse.ArgumentTypeError: Если значение не является числом от 0 до 1
+    """
+    try:
+        fraction = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"ожидается число от 0 до 1, получено {value!r}")
+    if not 0 <= fraction <= 1:
+        raise argparse.ArgumentTypeError(f"доля должна быть в диапазоне от 0 до 1, получено {value}")
+    return fraction
 
 
 def parse_arguments():
@@ -39,6 +153,9 @@ def parse_arguments():
     parser.add_argument('--input', '-i', type=str, required=True,
                       help='Путь к входному текстовому файлу')
     
+    parser.add_argument('--encoding', '-e', type=str, default=None,
+                      help='Кодировка текстового файла (по умолчанию определяется автоматически: utf-8 или cp1251)')
+    
     parser.add_argument('--output-dir', '-o', type=str, default='data/output',
                       help='Директория для сохранения результатов')
     
@@ -57,25 +174,271 @@ def parse_arguments():
     parser.add_argument('--simplified-max-words', type=int, default=100,
                       help='Максимальное количество слов в упрощенной визуализации (по умолчанию 100)')
     
+    parser.add_argument('--workers', '-w', type=int, default=1,
+                      help='Количество процессов для извлечения страниц PDF и морфологического анализа '
+                           '(0 = по числу ядер, по умолчанию 1)')
+    
+    parser.add_argument('--stream', action='store_true',
+                      help='Потоковая обработка с ограниченным потреблением памяти (для очень больших файлов): '
+                           'результаты пишутся построчно в JSON Lines и Excel, в памяти хранится только статистика')
+    
+    parser.add_argument('--binary-trie', action='store_true',
+                      help='Дополнительно сохранить префиксное дерево в двоичном формате (trie.bin), '
+                           'который открывается через mmap без десериализации (в потоковом режиме - '
+                           'только слоги и частоты, без данных о словах)')
+    
+    parser.add_argument('--trace-homonyms', type=str, default=None, metavar='PATH',
+                      help='Записывать решения при снятии омонимии (слово, варианты, оценки, выбор) '
+                           'в файл JSON Lines для последующего анализа')
+    
+    parser.add_argument('--trace-sample', type=parse_fraction, default=1.0,
+                      help='Доля записываемых событий трассировки омонимов (от 0 до 1, по умолчанию 1)')
+    
+    parser.add_argument('--outputs', type=parse_outputs, default=set(OUTPUT_FORMATS),
+                      help='Создаваемые результаты через запятую: ' +
+                           '; '.join(f'{name} - {description}' for name, description in OUTPUT_FORMATS.items()) +
+                           '; all - все (по умолчанию)')
+    
+    parser.add_argument('--results-format', type=parse_results_formats, default=None,
+                      help='Форматы файла результатов analysis_results через запятую: json - компактный JSON '
+                           '(по умолчанию), jsonl - строка на слово, msgpack - MessagePack (пакет msgpack), '
+                           'parquet - столбцы для pandas (пакет pyarrow) или all - все форматы, для которых '
+                           'установлены пакеты. В потоковом режиме результаты '
+                           'всегда записываются в JSON Lines')
+    
+    parser.add_argument('--render-workers', type=int, default=0,
+                      help='Количество процессов для создания результатов (графики, HTML, Excel, отчет, JSON): '
+                           '0 = по числу результатов и ядер (по умолчанию), 1 = последовательно')
+    
+    parser.add_argument('--debug', action='store_true',
+                      help='Выводить отладочные сообщения (в том числе о снятии омонимии)')
+    
     return parser.parse_args()
 
 
-def main():
+def create_homonym_trace(args):
+    """
+    Создает приемник трассировки омонимов по аргументам командной строки.
+    
+    Args:
+        args: Аргументы командной строки
+        
+    Returns:
+        Кортеж (файловый приемник, приемник для анализатора) или (None, None),
+        если трассировка не запрошена
+    """
+    if not args.trace_homonyms:
+        return None, None
+    
+    file_sink = JsonLinesTraceSink(args.trace_homonyms)
+    if args.trace_sample >= 1:
+        return file_sink, file_sink
+    
+    try:
+        return file_sink, SampledSink(file_sink, args.trace_sample)
+    except ValueError:
+        # Недопустимая доля: не оставляем открытым файл трассировки
+        file_sink.close()
+        raise
+
+
+def save_binary_trie(args, trie: PrefixTree) -> None:
+    """
+    Сохраняет префиксное дерево в двоичном формате, если указан --binary-trie.
+    
+    Args:
+        args: Аргументы командной строки
+        trie: Префиксное дерево
+    """
+    if not args.binary_trie:
+        return
+    
+    binary_trie_path = os.path.join(args.output_dir, "trie.bin")
+    trie.save_binary(binary_trie_path)
+    print(f"Двоичное префиксное дерево: {binary_trie_path}")
+
+
+def create_output_context(args, trie: PrefixTree, syllable_stats: dict,
+                          analyzed_text=None, pos_counts=None) -> OutputContext:
+    """
+    Создает контекст приемников с параметрами командной строки.
+    
+    Общий для пакетного и потокового режима, чтобы параметры визуализации
+    (глубина дерева, упрощенное дерево) действовали в обоих.
+    
+    Args:
+        args: Аргументы командной строки
+        trie: Префиксное дерево
+        syllable_stats: Статистика слогов
+        analyzed_text: Результаты анализа слов (None в потоковом режиме)
+        pos_counts: Частоты частей речи (для потокового режима)
+        
+    Returns:
+        Контекст приемников
+    """
+    # Упрощенная версия дерева (не более 100 слов) создается, если указан флаг
+    # --simplified-visualization, или автоматически при обработке PDF-файла
+    file_extension = os.path.splitext(args.input)[1].lower()
+    simplified = args.simplified_visualization or file_extension == '.pdf'
+    return OutputContext(args.output_dir, trie, syllable_stats, analyzed_text=analyzed_text,
+                         pos_counts=pos_counts, trie_depth=args.trie_depth,
+                         simplified_max_words=args.simplified_max_words if simplified else None,
+                         results_formats=[name for name in RESULT_FORMATS
+                                          if name in (args.results_format or {'json'})])
+
+
+def render_outputs(args, context: OutputContext) -> List[str]:
+    """
+    Создает выбранные результаты (приемники) параллельно и выводит время каждого.
+    
+    Ошибка приемника не прерывает создание остальных результатов и выводится
+    рядом с его временем.
+    
+    Args:
+        args: Аргументы командной строки
+        context: Данные для приемников
+        
+    Returns:
+        Имена приемников, завершившихся ошибкой
+    """
+    sinks = select_sinks(args.outputs, context)
+    if not sinks:
+        return []
+    
+    print(f"Создание результатов: {', '.join(sink.name for sink in sinks)}...")
+    start = time.perf_counter()
+    results = render_sinks(sinks, context, workers=args.render_workers)
+    wall_time = time.perf_counter() - start
+    
+    failed = []
+    for name, paths, elapsed, error in results:
+        if error is not None:
+            failed.append(name)
+            print(f"  {name:<22} {elapsed:>8.2f} с  ОШИБКА: {error}")
+        else:
+            print(f"  {name:<22} {elapsed:>8.2f} с  {', '.join(paths)}")
+    print(f"Результаты созданы за {wall_time:.2f} с (сумма по приемникам {sum(r[2] for r in results):.2f} с)")
+    return failed
+
+
+def report_failed_outputs(failed: List[str]) -> int:
+    """
+    Сообщает о приемниках, завершившихся ошибкой, и возвращает код завершения.
+    
+    Args:
+        failed: Имена приемников с ошибкой
+        
+    Returns:
+        Код завершения: 0 - все результаты созданы, 1 - есть ошибки
+    """
+    if not failed:
+        return 0
+    print(f"Не удалось создать результаты: {', '.join(failed)}", file=sys.stderr)
+    return 1
+
+
+def run_streaming(args, start_time: float) -> int:
+    """
+    Выполняет анализ в потоковом режиме.
+    
+    Этапы (чтение, токенизация, анализ, разбиение на слоги, запись) связаны
+    генераторами, поэтому в памяти находится только небольшое окно токенов
+    и агрегированная статистика.
+    
+    Args:
+        args: Аргументы командной строки
+        start_time: Время начала обработки
+        
+    Returns:
+        Код завершения (см. report_failed_outputs)
+    """
+    print("Потоковая обработка текста...")
+    if args.workers != 1:
+        print("В потоковом режиме морфологический анализ выполняется в одном процессе, "
+              "параметр --workers используется только для извлечения страниц PDF")
+    if 'json' in args.outputs and args.results_format and args.results_format != {'jsonl'}:
+        print("В потоковом режиме результаты анализа записываются построчно в JSON Lines "
+              "(analysis_results.jsonl), параметр --results-format игнорируется")
+    
+    # Шаги 1-2: Чтение и токенизация по частям
+    tokens = iter_tokenize_text(iter_text_file(args.input, encoding=args.encoding, workers=args.workers),
+                                keep_punctuation=args.keep_punctuation)
+    if args.max_words > 0:
+        tokens = islice(tokens, args.max_words)
+    
+    results_jsonl_path = os.path.join(args.output_dir, "analysis_results.jsonl")
+    excel_path = os.path.join(args.output_dir, "morphological_analysis.xlsx")
+    
+    # Файл трассировки и файлы результатов закрываются и при ошибке анализа
+    with ExitStack() as stack:
+        # Шаги 3-4: Морфологический анализ и разбиение на слоги
+        trace_file, trace = create_homonym_trace(args)
+        if trace_file is not None:
+            stack.enter_context(trace_file)
+        morph_analyzer = MorphologicalAnalyzer(trace=trace)
+        items = iter_syllabified(iter_analyzed_tokens(tqdm(tokens, unit=' токенов'), morph_analyzer))
+        
+        # Шаг 5: Построчная запись результатов и накопление статистики
+        writers = []
+        if 'json' in args.outputs:
+            writers.append(stack.enter_context(JsonLinesWriter(results_jsonl_path)))
+        if 'excel' in args.outputs:
+            writers.append(stack.enter_context(
+                ExcelStreamWriter(excel_path, sheet_name="Морфологический анализ")))
+        aggregates = run_stream(items, writers=writers)
+    
+    print(f"Проанализировано {aggregates.word_count} слов")
+    
+    if trace_file is not None:
+        print(f"Записано событий трассировки омонимов: {trace_file.count} ({trace_file.path})")
+    
+    # Шаг 6: Визуализация агрегированной статистики и отчет
+    report_path = os.path.join(args.output_dir, "analysis_report.md")
+    context = create_output_context(args, aggregates.trie, aggregates.syllable_stats.result(),
+                                    pos_counts=aggregates.pos_counts)
+    failed = render_outputs(args, context)
+    
+    # Двоичное дерево потокового режима содержит только счетчики узлов
+    save_binary_trie(args, aggregates.trie)
+    
+    elapsed_time = time.time() - start_time
+    print(f"Анализ завершен за {elapsed_time:.2f} секунд")
+    print(f"Результаты сохранены в директории: {args.output_dir}")
+    if 'report' in args.outputs:
+        print(f"Отчет в формате Markdown: {report_path}")
+    if 'json' in args.outputs:
+        print(f"JSON Lines с результатами анализа: {results_jsonl_path}")
+    if 'excel' in args.outputs:
+        print(f"Excel с русифицированным анализом: {excel_path}")
+    
+    return report_failed_outputs(failed)
+
+
+def main() -> int:
     """
     Основная функция скрипта.
+    
+    Returns:
+        Код завершения: 0 - успех, 1 - часть результатов не создана
     """
     # Получаем аргументы командной строки
     args = parse_arguments()
     
+    if args.debug:
+        logging.basicConfig(level=logging.DEBUG, format='%(levelname)s: %(name)s: %(message)s')
+    
     # Создаем директорию для вывода, если она не существует
     os.makedirs(args.output_dir, exist_ok=True)
     
     print(f"Начинаю обработку файла: {args.input}")
     start_time = time.time()
     
+    if args.stream:
+        return run_streaming(args, start_time)
+    
     # Шаг 1: Чтение текста
     print("Чтение текста из файла...")
-    text = read_text_file(args.input)
+    text = read_text_file(args.input, encoding=args.encoding, workers=args.workers)
     
     # Шаг 2: Обработка текста
     print("Токенизация текста...")
@@ -91,41 +454,54 @@ def main():
     
     # Шаг 3: Морфологический анализ
     print("Выполнение морфологического анализа...")
-    morph_analyzer = MorphologicalAnalyzer()
-    
-    # Анализируем текст
-    analyzed_text = []
-    for i, token in enumerate(tqdm(tokens)):
-        # Анализируем только слова (не знаки препинания)
-        if token and token[0].isalpha():
-            # Получаем контекст (предыдущие и следующие слова)
-            prev_words = tokens[max(0, i-3):i]
-            next_words = tokens[i+1:min(len(tokens), i+4)]
-            
-            # Выполняем морфологический анализ с разрешением омонимии
-            analysis = morph_analyzer.analyze_token_with_homonym_resolution(token, prev_words, next_words)
-            
-            # Если слово было успешно проанализировано, добавляем его в результаты
-            if analysis:
-                analyzed_text.append(analysis)
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    
+    # Трассировка омонимов собирается в текущем процессе; файл трассировки
+    # закрывается и при ошибке анализа
+    with ExitStack() as stack:
+        trace_file, trace = create_homonym_trace(args)
+        morph_analyzer = None
+        if trace_file is not None:
+            stack.enter_context(trace_file)
+            if workers > 1:
+                print("Трассировка омонимов выполняется в одном процессе, параметр --workers игнорируется")
+                workers = 1
+            morph_analyzer = MorphologicalAnalyzer(trace=trace)
+        
+        if workers > 1:
+            print(f"Используется процессов: {workers}")
+        
+        # Анализируем текст (в параллельном режиме токены делятся на фрагменты
+        # с перекрытием в 3 слова, чтобы сохранить контекст для снятия омонимии)
+        with tqdm(total=len(tokens)) as progress:
+            analyzed_text = analyze_tokens_parallel(tokens, workers=workers, analyzer=morph_analyzer,
+                                                    progress=progress.update)
     
     print(f"Проанализировано {len(analyzed_text)} слов")
     
+    if trace_file is not None:
+        print(f"Записано событий трассировки омонимов: {trace_file.count} ({trace_file.path})")
+    
     # Шаг 4: Разбиение слов на слоги и сбор статистики
     print("Разбиение слов на слоги...")
     syllable_data = {}
     all_words = [item['word'] for item in analyzed_text]
     
-    # Собираем статистику по слогам
-    syllable_stats = get_syllabification_stats(all_words)
+    # Разбиваем слова на слоги: каждая словоформа разбивается один раз,
+    # повторные вхождения используют общий кэш разбиений
+    syllabified = syllabify_words(all_words)
     
-    # Разбиваем каждое слово на слоги
-    for item in analyzed_text:
-        word = item['word']
-        syllables = split_into_syllables(word)
-        syllable_data[word] = syllables
+    for item, syllables in zip(analyzed_text, syllabified):
+        syllable_data[item['word']] = syllables
         item['syllables'] = syllables
     
+    # Статистика собирается по готовым разбиениям: словоформа учитывается
+    # один раз с количеством ее вхождений
+    syllable_stats = SyllableStatistics()
+    for word, occurrences in Counter(all_words).items():
+        syllable_stats.add(syllable_data[word], occurrences)
+    syllable_stats = syllable_stats.result()
+    
     # Шаг 5: Построение префиксного дерева
     print("Построение префиксного дерева...")
     trie = PrefixTree()
@@ -134,99 +510,32 @@ def main():
     for item in analyzed_text:
         trie.insert(item['syllables'], item)
     
-    # Шаг 6: Визуализация результатов
-    print("Создание визуализаций...")
-    
-    # Визуализация префиксного дерева
-    trie_image_path = os.path.join(args.output_dir, "trie_visualization.png")
-    visualize_trie(trie, max_depth=args.trie_depth, 
-                  output_path=trie_image_path, 
-                  title="Префиксное дерево слогов")
-    
-    # Визуализация частей речи
-    pos_image_path = os.path.join(args.output_dir, "parts_of_speech.png")
-    visualize_parts_of_speech(analyzed_text, 
-                             output_path=pos_image_path,
-                             title="Распределение частей речи в тексте")
-    
-    # Визуализация статистики по слогам
-    syllable_image_path = os.path.join(args.output_dir, "syllable_statistics.png")
-    visualize_syllable_statistics(syllable_stats,
-                                output_path=syllable_image_path,
-                                title="Статистика слогов")
-    
-    # Интерактивная HTML-визуализация префиксного дерева
-    trie_html_path = os.path.join(args.output_dir, "trie_interactive.html")
-    visualize_trie_interactive(trie, max_depth=args.trie_depth,
-                             output_path=trie_html_path,
-                             title="Интерактивное префиксное дерево слогов (полное)")
-    
-    # Создаем упрощенную версию дерева (хранит не более 100 слов)
-    # Делаем это если указан флаг --simplified-visualization
-    # Или автоматически при обработке PDF-файла
-    file_extension = os.path.splitext(args.input)[1].lower()
-    if args.simplified_visualization or file_extension == '.pdf':
-        simplified_trie = create_simplified_trie(trie, max_words=args.simplified_max_words)
-        simplified_html_path = os.path.join(args.output_dir, "trie_interactive_simplified.html")
-        visualize_trie_interactive(simplified_trie, max_depth=args.trie_depth,
-                               output_path=simplified_html_path,
-                               title=f"Интерактивное префиксное дерево слогов (упрощенное, {args.simplified_max_words} слов)")
-    
-    # Визуализация статистики префиксного дерева
-    trie_stats_image_path = os.path.join(args.output_dir, "trie_statistics.png")
-    visualize_trie_statistics(trie.get_statistics(),
-                            output_path=trie_stats_image_path,
-                            title="Статистика префиксного дерева")
-                            
-    # Экспорт результатов в Excel с русифицированными свойствами
-    excel_path = os.path.join(args.output_dir, "morphological_analysis.xlsx")
-    export_to_excel(analyzed_text, 
-                  output_path=excel_path, 
-                  sheet_name="Морфологический анализ")
+    # Шаги 6-7: Визуализация, экспорт и сохранение результатов. Результаты
+    # не зависят друг от друга и создаются параллельно в отдельных процессах
+    context = create_output_context(args, trie, syllable_stats, analyzed_text=analyzed_text)
+    failed = render_outputs(args, context)
     
-    # Создание отчета
     report_path = os.path.join(args.output_dir, "analysis_report.md")
-    create_summary_report(analyzed_text, trie, syllable_stats, output_path=report_path)
-    
-    # Шаг 7: Экспорт и сохранение результатов 
-    print("Сохранение результатов...")
-    results_json_path = os.path.join(args.output_dir, "analysis_results.json")
-    
-    # Подготовка данных для сериализации
-    output_data = {
-        "analyzed_text": analyzed_text,
-        "syllable_stats": syllable_stats,
-        "trie": trie.serialize()
-    }
-    
-    # Создаем класс пользовательского кодировщика JSON для объектов pymorphy2
-    class MorphoJSONEncoder(json.JSONEncoder):
-        def default(self, obj):
-            # Обрабатываем объекты pymorphy2.analyzer.Parse
-            if hasattr(obj, 'tag') and hasattr(obj, 'normal_form'):
-                return {
-                    'normal_form': obj.normal_form,
-                    'pos': str(obj.tag.POS),
-                    'tag': str(obj.tag)
-                }
-            # Обрабатываем объекты pymorphy2.tagset.OpencorporaTag
-            if hasattr(obj, 'POS') and hasattr(obj, 'grammemes'):
-                return str(obj)
-            # Для всех остальных типов используем стандартный механизм
-            return json.JSONEncoder.default(self, obj)
-    
-    # Сохранение в JSON с использованием кодировщика
-    with open(results_json_path, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, ensure_ascii=False, indent=2, cls=MorphoJSONEncoder)
+    excel_path = os.path.join(args.output_dir, "morphological_analysis.xlsx")
+    
+    # Двоичное дерево для быстрого чтения через mmap
+    save_binary_trie(args, trie)
     
     # Вывод информации о завершении
     elapsed_time = time.time() - start_time
     print(f"Анализ завершен за {elapsed_time:.2f} секунд")
     print(f"Результаты сохранены в директории: {args.output_dir}")
-    print(f"Отчет в формате Markdown: {report_path}")
-    print(f"JSON с результатами анализа: {results_json_path}")
-    print(f"Excel с русифицированным анализом: {excel_path}")
+    if 'report' in args.outputs:
+        print(f"Отчет в формате Markdown: {report_path}")
+    if 'json' in args.outputs:
+        for name in context.results_formats:
+            results_path = os.path.join(args.output_dir, "analysis_results" + RESULT_FORMATS[name])
+            print(f"Результаты анализа ({name}): {results_path}")
+    if 'excel' in args.outputs:
+        print(f"Excel с русифицированным анализом: {excel_path}")
+    
+    return report_failed_outputs(failed)
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,243 @@
+"""
+Модуль колоночного представления результатов морфологического анализа.
+
+Вместо списка словарей (по одному на слово, с вложенным словарем тегов)
+результаты хранятся в параллельных списках: слово, лемма, часть речи,
+значение омонима и по одному списку на каждую граммему. Повторяющиеся
+строки хранятся в единственном экземпляре. Такое представление занимает
+меньше памяти и напрямую превращается в pandas.DataFrame с категориальными
+столбцами для векторных операций.
+"""
+
+from collections import Counter
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# Граммемы, извлекаемые из разбора pymorphy2 (в порядке MorphologicalAnalyzer._extract_tags)
+TAG_COLUMNS = ('gender', 'number', 'case', 'tense', 'person', 'aspect', 'mood', 'voice', 'animacy')
+
+
+class AnalysisColumns:
+    """
+    Результаты морфологического анализа в колоночном виде.
+
+    Attributes:
+        word: Исходные слова
+        lemma: Леммы
+        pos: Части речи
+        sense: Значения омонимов (None для слов, не являющихся омонимами)
+        tags: Столбцы граммем: название граммемы -> значения (None - нет значения)
+    """
+
+    def __init__(self):
+        """
+        Инициализирует пустой набор столбцов.
+        """
+        self.word: List[str] = []
+        self.lemma: List[str] = []
+        self.pos: List[str] = []
+        self.sense: List[Optional[str]] = []
+        self.tags: Dict[str, List[Optional[str]]] = {name: [] for name in TAG_COLUMNS}
+
+        # Набор ключей тегов для строк, у которых он отличается от TAG_COLUMNS
+        # (омонимы из словаря, заглушки для знаков препинания)
+        self._tag_keys: Dict[int, Tuple[str, ...]] = {}
+
+        # Пул строк: одинаковые значения хранятся одним объектом
+        self._strings: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество строк.
+
+        Returns:
+            Количество проанализированных слов
+        """
+        return len(self.word)
+
+    def _intern(self, value: Optional[str]) -> Optional[str]:
+        """
+        Возвращает единственный экземпляр строки из пула.
+
+        Args:
+            value: Строка или None
+
+        Returns:
+            Строка из пула или None
+        """
+        if value is None:
+            return None
+        return self._strings.setdefault(value, value)
+
+    def append(self, word: str, lemma: str, pos: str,
+               tags: Iterable[Tuple[str, Optional[str]]],
+               sense: Optional[str] = None) -> None:
+        """
+        Добавляет строку.
+
+        Args:
+            word: Исходное слово
+            lemma: Лемма
+            pos: Часть речи
+            tags: Пары (граммема, значение)
+            sense: Значение омонима (None - слово не является омонимом)
+        """
+        intern = self._intern
+        row = len(self.word)
+
+        self.word.append(intern(word))
+        self.lemma.append(intern(lemma))
+        self.pos.append(intern(pos))
+        self.sense.append(intern(sense))
+
+        keys = []
+        values = {}
+        for key, value in tags:
+            keys.append(key)
+            values[key] = value
+
+        if tuple(keys) != TAG_COLUMNS:
+            self._tag_keys[row] = tuple(keys)
+
+        # Новые граммемы получают столбец, дополненный None для предыдущих строк
+        for key in values:
+            if key not in self.tags:
+                self.tags[key] = [None] * row
+
+        for key, column in self.tags.items():
+            column.append(intern(values.get(key)))
+
+    def append_parse(self, word: str, lemma: str, pos: str,
+                     tags: Sequence[Tuple[str, Optional[str]]]) -> None:
+        """
+        Добавляет строку с полным набором граммем TAG_COLUMNS (без значения омонима).
+
+        Быстрый путь для разборов из кэша анализатора: ключи тегов
+        совпадают с TAG_COLUMNS и идут в том же порядке, поэтому не проверяются.
+
+        Args:
+            word: Исходное слово
+            lemma: Лемма
+            pos: Часть речи
+            tags: Пары (граммема, значение) в порядке TAG_COLUMNS
+        """
+        setdefault = self._strings.setdefault
+
+        self.word.append(setdefault(word, word))
+        self.lemma.append(setdefault(lemma, lemma))
+        self.pos.append(setdefault(pos, pos))
+        self.sense.append(None)
+
+        columns = self.tags
+        for name, value in tags:
+            columns[name].append(value if value is None else setdefault(value, value))
+
+        # Граммемы, добавленные нестандартными строками, дополняются None
+        if len(columns) > len(TAG_COLUMNS):
+            for name in islice(columns, len(TAG_COLUMNS), None):
+                columns[name].append(None)
+
+    def append_record(self, item: Dict[str, Any]) -> None:
+        """
+        Добавляет строку из результата анализа в виде словаря.
+
+        Args:
+            item: Результат анализа слова (MorphologicalAnalyzer.analyze_word и т.п.)
+        """
+        self.append(item['word'], item['lemma'], item['pos'],
+                    item.get('tags', {}).items(), item.get('sense'))
+
+    @classmethod
+    def from_records(cls, items: Iterable[Dict[str, Any]]) -> 'AnalysisColumns':
+        """
+        Создает столбцы из списка результатов анализа.
+
+        Args:
+            items: Результаты анализа слов
+
+        Returns:
+            Колоночное представление
+        """
+        columns = cls()
+        for item in items:
+            columns.append_record(item)
+        return columns
+
+    def record(self, row: int) -> Dict[str, Any]:
+        """
+        Восстанавливает результат анализа одной строки в виде словаря.
+
+        Args:
+            row: Номер строки
+
+        Returns:
+            Словарь в формате MorphologicalAnalyzer
+        """
+        keys = self._tag_keys.get(row, TAG_COLUMNS)
+        record = {
+            'word': self.word[row],
+            'lemma': self.lemma[row],
+            'pos': self.pos[row],
+            'tags': {key: self.tags[key][row] for key in keys}
+        }
+
+        # Омонимы дополнительно содержат значение и пустой список вариантов
+        if self.sense[row] is not None:
+            record['sense'] = self.sense[row]
+            record['all_parses'] = []
+
+        return record
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """
+        Преобразует столбцы обратно в список словарей.
+
+        Returns:
+            Список результатов анализа в формате MorphologicalAnalyzer
+        """
+        return [self.record(row) for row in range(len(self))]
+
+    def pos_counts(self) -> Counter:
+        """
+        Подсчитывает частоты частей речи.
+
+        Результат можно передать в visualize_parts_of_speech и
+        create_summary_report через параметр pos_counts.
+
+        Returns:
+            Счетчик частей речи (пустые значения пропускаются)
+        """
+        counts = Counter(self.pos)
+        counts.pop('', None)
+        counts.pop(None, None)
+        return counts
+
+    def to_pandas(self, categorical: bool = True):
+        """
+        Преобразует столбцы в pandas.DataFrame.
+
+        Args:
+            categorical: Хранить часть речи, значения омонимов и граммемы
+                как категориальные столбцы
+
+        Returns:
+            DataFrame со столбцами word, lemma, pos, sense и столбцами граммем;
+            граммема, имя которой совпадает с основным столбцом (например, sense),
+            получает приставку tag_ (tag_sense), чтобы не заменить его
+        """
+        import pandas as pd
+
+        data = {'word': self.word, 'lemma': self.lemma, 'pos': self.pos, 'sense': self.sense}
+        tag_columns = []
+        for name, values in self.tags.items():
+            column = f'tag_{name}' if name in data else name
+            data[column] = values
+            tag_columns.append(column)
+        df = pd.DataFrame(data)
+
+        if categorical:
+            for name in ['pos', 'sense'] + tag_columns:
+                df[name] = df[name].astype('category')
+
+        return df
@@ -0,0 +1,376 @@
+"""
+Модуль компактного префиксного дерева.
+
+Этот модуль предоставляет класс CompactPrefixTree - альтернативную реализацию
+префиксного дерева с тем же интерфейсом, что и PrefixTree, но без отдельного
+Python-объекта на каждый узел:
+- слоги интернируются в целочисленные идентификаторы;
+- свойства узлов хранятся в параллельных массивах (array), индекс узла - его номер;
+- дочерние узлы хранятся в одном массиве на узел: первая половина -
+  отсортированные идентификаторы слогов, вторая - соответствующие номера
+  узлов; поиск выполняется бинарным поиском;
+- данные о словах хранятся в отдельной таблице и выделяются только для концов слов;
+  как и в PrefixTree, совпадающие данные хранятся один раз со счетчиком вставок.
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple
+
+from .trie import add_count, add_position, find_payload, most_common_syllables, payload_occurrences
+
+
+# Номер корневого узла
+ROOT = 0
+
+# Отсутствующее значение в целочисленных массивах
+NONE = -1
+
+# Тип элементов массивов (32-битные целые)
+INDEX_TYPE = 'i'
+
+
+class CompactPrefixTree:
+    """
+    Компактное префиксное дерево на основе массивов.
+
+    Attributes:
+        word_count: Количество слов в дереве
+    """
+
+    def __init__(self):
+        """
+        Инициализирует пустое дерево (только корневой узел).
+        """
+        # Таблица интернирования слогов
+        self._syllable_ids: Dict[str, int] = {}
+        self._syllables: List[str] = []
+
+        # Параллельные массивы свойств узлов
+        self._node_syllable = array(INDEX_TYPE, [NONE])
+        self._node_count = array(INDEX_TYPE, [0])
+        self._node_payload = array(INDEX_TYPE, [NONE])
+
+        # Дочерние узлы: массив [ключи..., номера узлов...] с ключами,
+        # отсортированными по идентификатору слога. Для листьев массив не создается.
+        self._children: List[Optional[array]] = [None]
+
+        # Таблица данных о словах (только для узлов-концов слов): уникальные
+        # данные; счетчики повторных вставок и позиции вхождений хранятся
+        # только для записей, где они есть
+        self._payloads: List[List[Dict[str, Any]]] = []
+        self._payload_counts: Dict[int, List[int]] = {}
+        self._payload_positions: Dict[int, List[List[int]]] = {}
+
+        self.word_count = 0
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество узлов в дереве (включая корень).
+
+        Returns:
+            Количество узлов
+        """
+        return len(self._node_count)
+
+    def _intern(self, syllable: str) -> int:
+        """
+        Возвращает идентификатор слога, добавляя слог в таблицу при необходимости.
+
+        Args:
+            syllable: Слог
+
+        Returns:
+            Идентификатор слога
+        """
+        syllable_id = self._syllable_ids.get(syllable)
+        if syllable_id is None:
+            syllable_id = len(self._syllables)
+            self._syllable_ids[syllable] = syllable_id
+            self._syllables.append(syllable)
+        return syllable_id
+
+    def _find_child(self, node: int, syllable_id: int) -> int:
+        """
+        Ищет дочерний узел по идентификатору слога.
+
+        Args:
+            node: Номер родительского узла
+            syllable_id: Идентификатор слога
+
+        Returns:
+            Номер дочернего узла или NONE
+        """
+        children = self._children[node]
+        if children is None:
+            return NONE
+
+        size = len(children) >> 1
+        pos = bisect_left(children, syllable_id, 0, size)
+        if pos < size and children[pos] == syllable_id:
+            return children[size + pos]
+        return NONE
+
+    def _add_child(self, node: int, syllable_id: int) -> int:
+        """
+        Создает дочерний узел, сохраняя упорядоченность массива детей.
+
+        Args:
+            node: Номер родительского узла
+            syllable_id: Идентификатор слога
+
+        Returns:
+            Номер созданного узла
+        """
+        child = len(self._node_count)
+        self._node_syllable.append(syllable_id)
+        self._node_count.append(0)
+        self._node_payload.append(NONE)
+        self._children.append(None)
+
+        children = self._children[node]
+        if children is None:
+            self._children[node] = array(INDEX_TYPE, (syllable_id, child))
+        else:
+            size = len(children) >> 1
+            pos = bisect_left(children, syllable_id, 0, size)
+            # Сначала вставляем номер узла, чтобы не сдвинуть его позицию
+            children.insert(size + pos, child)
+            children.insert(pos, syllable_id)
+
+        return child
+
+    def _find_node(self, syllables: List[str]) -> int:
+        """
+        Находит узел, соответствующий последовательности слогов.
+
+        Args:
+            syllables: Список слогов
+
+        Returns:
+            Номер узла или NONE, если путь отсутствует
+        """
+        node = ROOT
+        syllable_ids = self._syllable_ids
+        all_children = self._children
+
+        for syllable in syllables:
+            syllable_id = syllable_ids.get(syllable)
+            if syllable_id is None:
+                return NONE
+
+            children = all_children[node]
+            if children is None:
+                return NONE
+
+            size = len(children) >> 1
+            pos = bisect_left(children, syllable_id, 0, size)
+            if pos == size or children[pos] != syllable_id:
+                return NONE
+            node = children[size + pos]
+
+        return node
+
+    def insert(self, syllables: List[str], word_data: Optional[Dict[str, Any]] = None,
+               position: Optional[int] = None) -> None:
+        """
+        Вставляет слово в префиксное дерево.
+
+        Args:
+            syllables: Список слогов слова
+            word_data: Данные о слове (результат морфологического анализа).
+                Если None, учитываются только счетчики узлов
+            position: Позиция вхождения слова в тексте (None - не сохраняется)
+        """
+        node = ROOT
+        syllable_ids = self._syllable_ids
+        node_count = self._node_count
+        all_children = self._children
+
+        # Цикл вставки развернут вручную: это самый частый путь при построении дерева
+        for syllable in syllables:
+            syllable_id = syllable_ids.get(syllable)
+            if syllable_id is None:
+                syllable_id = self._intern(syllable)
+
+            children = all_children[node]
+            child = NONE
+            if children is not None:
+                size = len(children) >> 1
+                pos = bisect_left(children, syllable_id, 0, size)
+                if pos < size and children[pos] == syllable_id:
+                    child = children[size + pos]
+            if child == NONE:
+                child = self._add_child(node, syllable_id)
+
+            node = child
+            node_count[node] += 1
+
+        payload = self._node_payload[node]
+        if payload == NONE:
+            payload = len(self._payloads)
+            self._payloads.append([])
+            self._node_payload[node] = payload
+
+        if word_data is not None:
+            payloads = self._payloads[payload]
+            index = find_payload(payloads, word_data)
+            if index < 0:
+                index = len(payloads)
+                payloads.append(word_data)
+            else:
+                add_count(self._payload_counts.setdefault(payload, []), index, 1)
+            if position is not None:
+                add_position(self._payload_positions.setdefault(payload, []), index, position)
+        self.word_count += 1
+
+    def search(self, syllables: List[str]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Ищет слово в префиксном дереве.
+
+        Args:
+            syllables: Список слогов слова
+
+        Returns:
+            Уникальные данные о слове, если слово найдено, иначе None
+        """
+        payload = self._find_payload(syllables)
+        if payload == NONE:
+            return None
+        return self._payloads[payload]
+
+    def search_occurrences(self, syllables: List[str]) -> Optional[List[Tuple[Dict[str, Any], int, List[int]]]]:
+        """
+        Ищет слово и возвращает его данные вместе с частотой и позициями.
+
+        Args:
+            syllables: Список слогов слова
+
+        Returns:
+            Список кортежей (данные о слове, количество вставок, позиции вхождений),
+            если слово найдено, иначе None
+        """
+        payload = self._find_payload(syllables)
+        if payload == NONE:
+            return None
+        return payload_occurrences(self._payloads[payload], self._payload_counts.get(payload, ()),
+                                   self._payload_positions.get(payload, ()))
+
+    def _find_payload(self, syllables: List[str]) -> int:
+        """
+        Находит номер записи данных для конца слова.
+
+        Args:
+            syllables: Список слогов слова
+
+        Returns:
+            Номер записи в таблице данных или NONE, если слова нет в дереве
+        """
+        node = self._find_node(syllables)
+        if node == NONE:
+            return NONE
+        return self._node_payload[node]
+
+    def starts_with_prefix(self, prefix_syllables: List[str]) -> List[Tuple[List[str], List[Dict[str, Any]]]]:
+        """
+        Находит все слова, начинающиеся с заданного префикса.
+
+        Args:
+            prefix_syllables: Список слогов префикса
+
+        Returns:
+            Список пар (слоги слова, данные о слове) для всех слов,
+            начинающихся с заданного префикса
+        """
+        node = self._find_node(prefix_syllables)
+        if node == NONE:
+            return []
+        return self._collect_words(node, list(prefix_syllables))
+
+    def get_all_words(self) -> List[Tuple[List[str], List[Dict[str, Any]]]]:
+        """
+        Возвращает все слова в дереве.
+
+        Returns:
+            Список пар (слоги слова, данные о слове) для всех слов в дереве
+        """
+        return self._collect_words(ROOT, [])
+
+    def _collect_words(self, start: int,
+                       prefix: List[str]) -> List[Tuple[List[str], List[Dict[str, Any]]]]:
+        """
+        Собирает все слова поддерева обходом в глубину с явным стеком.
+
+        Args:
+            start: Номер начального узла
+            prefix: Слоги от корня до начального узла
+
+        Returns:
+            Список пар (слоги слова, данные о слове)
+        """
+        result = []
+        syllables = self._syllables
+        stack = [(start, prefix)]
+
+        while stack:
+            node, path = stack.pop()
+
+            payload = self._node_payload[node]
+            if payload != NONE:
+                result.append((path, self._payloads[payload]))
+
+            children = self._children[node]
+            if children is not None:
+                # Кладем детей в обратном порядке, чтобы обходить их по возрастанию
+                for child in reversed(children[len(children) >> 1:]):
+                    stack.append((child, path + [syllables[self._node_syllable[child]]]))
+
+        return result
+
+    def get_statistics(self, top_n: int = 20) -> Dict[str, Any]:
+        """
+        Возвращает статистику о дереве в формате PrefixTree.get_statistics.
+
+        Args:
+            top_n: Количество наиболее частых слогов в результате
+
+        Returns:
+            Словарь со статистикой:
+            - количество слов
+            - количество узлов
+            - глубина дерева
+            - средняя разветвленность
+            - наиболее частые слоги
+        """
+        level_distribution: Dict[int, int] = {}
+        syllable_frequency: Dict[int, int] = {}
+        non_leaf_nodes = 0
+        children_total = 0
+
+        stack = [(ROOT, 0)]
+        while stack:
+            node, level = stack.pop()
+            level_distribution[level] = level_distribution.get(level, 0) + 1
+
+            syllable_id = self._node_syllable[node]
+            if syllable_id != NONE:
+                syllable_frequency[syllable_id] = syllable_frequency.get(syllable_id, 0) + self._node_count[node]
+
+            children = self._children[node]
+            if children is not None:
+                size = len(children) >> 1
+                non_leaf_nodes += 1
+                children_total += size
+                for child in children[size:]:
+                    stack.append((child, level + 1))
+
+        return {
+            'word_count': self.word_count,
+            'node_count': len(self),
+            'max_depth': max(level_distribution),
+            'level_distribution': dict(sorted(level_distribution.items())),
+            'avg_branching': children_total / non_leaf_nodes if non_leaf_nodes else 0,
+            'most_common_syllables': most_common_syllables(
+                {self._syllables[syllable_id]: count for syllable_id, count in syllable_frequency.items()},
+                top_n)
+        }
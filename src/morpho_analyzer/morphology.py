@@ -5,33 +5,188 @@
 характеристик слов в тексте и снятия омонимии на основе контекста.
 """
 
-# Импорт патча для совместимости с Python 3.11+
-from . import pymorphy2_patch
-# Импорт pymorphy2
-import pymorphy2
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+import gc
 import os
 import re
 import json
+import logging
+import threading
+from collections import deque
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
 
+from .columnar import TAG_COLUMNS, AnalysisColumns
+from .token_stream import TOKEN_WORD, TokenStream
+
+
+# Размер кэша разборов по умолчанию (количество уникальных словоформ)
+DEFAULT_PARSE_CACHE_SIZE = 100000
+
+logger = logging.getLogger(__name__)
+
+# Символы, удаляемые из словоформы при очистке (после приведения к нижнему регистру)
+_CLEAN_PATTERN = re.compile(r'[^а-яё]')
+
+# Кириллические слова в тексте (после приведения к нижнему регистру), см. analyze_text
+_CYRILLIC_RE = re.compile(r'[а-яё]+')
+
+# Количество токенов контекста с каждой стороны по умолчанию
+DEFAULT_CONTEXT_WINDOW = 3
+
+# Словарь pymorphy2, общий для всех анализаторов процесса (загружается при первом разборе)
+_morph_analyzer = None
+
+# Анализатор процесса с параметрами по умолчанию (см. get_shared_analyzer)
+_shared_analyzer = None
+
+# Загруженные словари омонимов по абсолютному пути к файлу
+_homonym_files: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+
+_init_lock = threading.RLock()
+
+
+def get_morph_analyzer():
+    """
+    Возвращает общий для процесса морфологический анализатор pymorphy2.
+    
+    pymorphy2 импортируется, а его словари загружаются при первом вызове,
+    поэтому импорт модуля morphology не требует этих затрат.
+    
+    Returns:
+        Экземпляр pymorphy2.MorphAnalyzer
+    """
+    global _morph_analyzer
+    if _morph_analyzer is None:
+        with _init_lock:
+            if _morph_analyzer is None:
+                # Патч совместимости с Python 3.11+ применяется до импорта pymorphy2
+                from . import pymorphy2_patch  # noqa: F401
+                import pymorphy2
+                _morph_analyzer = pymorphy2.MorphAnalyzer()
+    return _morph_analyzer
+
+
+class ContextWindow:
+    """
+    Скользящее окно токенов вокруг текущего анализируемого токена.
+    
+    Окно хранит текущий токен, не более size предыдущих и size следующих.
+    Токены хранятся вместе с очищенной формой: слова очищаются один раз при
+    попадании в окно, остальные токены - только если понадобятся как контекст.
+    Список контекста строится лишь по запросу (для омонимов).
+    
+    Элементы окна - списки [токен, признак слова, очищенный токен или None].
+    
+    Attributes:
+        size: Количество токенов контекста с каждой стороны
+    """
+    
+    def __init__(self, size: int, clean: Callable[[str], str]):
+        """
+        Инициализирует пустое окно.
+        
+        Args:
+            size: Количество токенов контекста с каждой стороны
+            clean: Функция очистки токена
+        """
+        self.size = size
+        self._clean = clean
+        # Предыдущие токены и текущий (последний элемент)
+        self._previous = deque(maxlen=size + 1)
+        # Следующие токены
+        self._ahead = deque()
+    
+    def __len__(self) -> int:
+        """
+        Возвращает количество следующих токенов, еще не ставших текущими.
+        
+        Returns:
+            Количество токенов впереди
+        """
+        return len(self._ahead)
+    
+    def remember(self, token: str) -> None:
+        """
+        Добавляет токен, уже оставшийся позади (используется только как контекст).
+        
+        Args:
+            token: Токен
+        """
+        self._previous.append([token, False, None])
+    
+    def push(self, token: str) -> Optional[List[Any]]:
+        """
+        Добавляет следующий токен в конец окна.
+        
+        Когда впереди накапливается больше size токенов, первый из них
+        становится текущим.
+        
+        Args:
+            token: Токен
+            
+        Returns:
+            Элемент нового текущего токена или None
+        """
+        # Слова очищаются сразу: очищенная форма нужна для их анализа
+        if token and token[0].isalpha():
+            self._ahead.append([token, True, self._clean(token)])
+        else:
+            self._ahead.append([token, False, None])
+        
+        if len(self._ahead) > self.size:
+            return self.advance()
+        return None
+    
+    def advance(self) -> List[Any]:
+        """
+        Сдвигает окно: первый из следующих токенов становится текущим.
+        
+        Returns:
+            Элемент нового текущего токена
+        """
+        entry = self._ahead.popleft()
+        self._previous.append(entry)
+        return entry
+    
+    def context(self) -> List[str]:
+        """
+        Возвращает очищенный контекст текущего токена.
+        
+        Returns:
+            Очищенные предыдущие и следующие токены (в порядке текста)
+        """
+        context = []
+        for entry in chain(islice(self._previous, len(self._previous) - 1),
+                           islice(self._ahead, self.size)):
+            if entry[2] is None:
+                entry[2] = self._clean(entry[0])
+            context.append(entry[2])
+        return context
+
 
 class MorphologicalAnalyzer:
     """
     Класс для выполнения морфологического анализа текста.
     """
     
-    def __init__(self, language: str = 'ru', homonyms_file: str = None):
+    def __init__(self, language: str = 'ru', homonyms_file: str = None,
+                 parse_cache_size: Optional[int] = DEFAULT_PARSE_CACHE_SIZE,
+                 trace: Optional[Callable[[Dict[str, Any]], None]] = None):
         """
         Инициализирует анализатор.
         
         Args:
             language: Код языка (по умолчанию 'ru' - русский)
             homonyms_file: Путь к JSON-файлу со словарем омонимов
+            parse_cache_size: Максимальное число словоформ в кэше разборов
+                (0 - кэш отключен, None - без ограничения)
+            trace: Приемник событий снятия омонимии (см. модуль tracing);
+                None - события формируются только при уровне DEBUG логгера
         """
         self.language = language
-        # Инициализируем морфологический анализатор
-        self.analyzer = pymorphy2.MorphAnalyzer()
+        self.trace = trace
         
         # Загрузка словаря омонимов из JSON-файла
         if homonyms_file is None:
@@ -40,6 +195,40 @@ class MorphologicalAnalyzer:
             homonyms_file = module_dir / 'data' / 'homonyms.json'
         
         self.homonyms_dict = self._load_homonyms(homonyms_file)
+        self._homonym_index = self._build_homonym_index(self.homonyms_dict)
+        
+        # LRU-кэш разборов по очищенной словоформе. В кэше хранятся только
+        # неизменяемые кортежи, поэтому изменение возвращаемых словарей
+        # вызывающим кодом не портит закэшированные записи.
+        self._parse_cached = lru_cache(maxsize=parse_cache_size)(self._parse_clean_word)
+        
+        # Извлеченные граммемы по строке тега pymorphy2. Различных тегов
+        # несколько тысяч, поэтому кэш не ограничивается
+        self._tag_cache: Dict[str, Tuple[str, Tuple[Tuple[str, Optional[str]], ...]]] = {}
+    
+    @property
+    def analyzer(self):
+        """
+        Словарь pymorphy2, общий для всех анализаторов процесса.
+        
+        Загружается при первом обращении (см. get_morph_analyzer).
+        """
+        return get_morph_analyzer()
+    
+    def parse_cache_info(self):
+        """
+        Возвращает статистику кэша разборов.
+        
+        Returns:
+            Именованный кортеж (hits, misses, maxsize, currsize)
+        """
+        return self._parse_cached.cache_info()
+    
+    def clear_parse_cache(self) -> None:
+        """
+        Очищает кэш разборов и сбрасывает счетчики попаданий и промахов.
+        """
+        self._parse_cached.cache_clear()
         
     def analyze_word(self, word: str) -> Dict[str, Any]:
         """
@@ -63,34 +252,53 @@ class MorphologicalAnalyzer:
                 'tags': {}
             }
         
+        return self._analyze_clean_word(word, clean_word)
+    
+    def _analyze_clean_word(self, word: str, clean_word: str) -> Dict[str, Any]:
+        """
+        Формирует результат анализа для уже очищенной словоформы, используя кэш разборов.
+        
+        Args:
+            word: Исходное слово
+            clean_word: Очищенное слово (ключ кэша)
+            
+        Returns:
+            Словарь с морфологическими характеристиками
+        """
+        lemma, pos, tags = self._parse_cached(clean_word)
+        
+        # Каждый вызов получает новый словарь, кэш остается неизменным
+        return {
+            'word': word,
+            'lemma': lemma,
+            'pos': pos,
+            'tags': dict(tags)
+        }
+    
+    def _parse_clean_word(self, clean_word: str) -> Tuple[str, str, Tuple[Tuple[str, Any], ...]]:
+        """
+        Выполняет разбор очищенной словоформы с помощью pymorphy2.
+        
+        Результат не содержит объектов pymorphy2 и состоит только из
+        неизменяемых значений, что позволяет хранить его в кэше.
+        
+        Args:
+            clean_word: Очищенное слово
+            
+        Returns:
+            Кортеж (лемма, часть речи, кортеж пар (тег, значение))
+        """
         # Получаем морфологический разбор с помощью pymorphy2
         parsed = self.analyzer.parse(clean_word)
         
         # Если есть результаты анализа, берем первый (наиболее вероятный)
         if parsed:
             parse = parsed[0]
-            
-            # Извлекаем морфологические теги
-            tags = self._extract_tags(parse.tag)
-            
-            # Формируем результат без сохранения объектов pymorphy2
-            result = {
-                'word': word,
-                'lemma': parse.normal_form,
-                'pos': parse.tag.POS or 'UNKNOWN',
-                'tags': tags
-                # Не сохраняем все варианты разбора, чтобы избежать проблем сериализации
-            }
-            
-            return result
+            pos, tags = self._tag_info(parse.tag)
+            return str(parse.normal_form), pos, tags
         
         # Если анализ не удался, возвращаем заглушку
-        return {
-            'word': word,
-            'lemma': clean_word,
-            'pos': 'UNKNOWN',
-            'tags': {}
-        }
+        return clean_word, 'UNKNOWN', ()
     
     def _clean_word(self, word: str) -> str:
         """
@@ -103,26 +311,86 @@ class MorphologicalAnalyzer:
             Очищенное слово
         """
         # Удаление знаков препинания и приведение к нижнему регистру
-        return re.sub(r'[^а-яё]', '', word.lower())
+        return _CLEAN_PATTERN.sub('', word.lower())
     
     def _load_homonyms(self, homonyms_file: Union[str, Path]) -> Dict[str, List[Dict[str, Any]]]:
         """
         Загружает словарь омонимов из JSON-файла.
         
+        Файл читается один раз за время работы процесса: анализаторы с одним
+        и тем же файлом получают общий словарь, который не следует изменять.
+        
         Args:
             homonyms_file: Путь к JSON-файлу со словарем омонимов
             
         Returns:
             Словарь омонимов
         """
+        path = os.path.abspath(homonyms_file)
+        homonyms = _homonym_files.get(path)
+        if homonyms is not None:
+            return homonyms
+        
         try:
-            with open(homonyms_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(path, 'r', encoding='utf-8') as f:
+                homonyms = json.load(f)
+            _homonym_files[path] = homonyms
+            return homonyms
         except (FileNotFoundError, json.JSONDecodeError) as e:
             print(f"Ошибка загрузки словаря омонимов: {e}")
             # Возвращаем пустой словарь в случае ошибки
             return {}
     
+    def _build_homonym_index(self, homonyms: Dict[str, List[Dict[str, Any]]]
+                             ) -> Dict[str, Tuple[List[Dict[str, Any]], Dict[str, Tuple[Tuple[int, int], ...]]]]:
+        """
+        Строит индекс словаря омонимов для быстрого подсчета совпадений маркеров.
+        
+        Для каждого омонима строится обратный индекс: маркер -> пары
+        (номер варианта разбора, позиция маркера в списке маркеров варианта).
+        Оценка вариантов тогда требует одного поиска на каждое слово контекста
+        и не зависит от общего числа маркеров.
+        
+        Args:
+            homonyms: Словарь омонимов
+            
+        Returns:
+            Словарь: слово -> (варианты разбора, обратный индекс маркеров)
+        """
+        index = {}
+        
+        for word, parses in homonyms.items():
+            markers_index: Dict[str, List[Tuple[int, int]]] = {}
+            for i, parse in enumerate(parses):
+                for position, marker in enumerate(parse.get('markers', [])):
+                    markers_index.setdefault(marker, []).append((i, position))
+            
+            index[word] = (parses, {marker: tuple(entries) for marker, entries in markers_index.items()})
+        
+        return index
+    
+    def _tag_info(self, tag: Any) -> Tuple[str, Tuple[Tuple[str, Optional[str]], ...]]:
+        """
+        Возвращает часть речи и граммемы тега pymorphy2, используя кэш по строке тега.
+        
+        Args:
+            tag: Тег pymorphy2
+            
+        Returns:
+            Кортеж (часть речи, кортеж пар (тег, значение)); один и тот же
+            неизменяемый объект для всех слов с одинаковым тегом
+        """
+        key = str(tag)
+        info = self._tag_cache.get(key)
+        if info is None:
+            # Граммемы pymorphy2 - подклассы str, которые нельзя передать между
+            # процессами, поэтому приводим их к обычным строкам
+            tags = tuple((name, str(value) if value is not None else None)
+                         for name, value in self._extract_tags(tag).items())
+            info = (str(tag.POS or 'UNKNOWN'), tags)
+            self._tag_cache[key] = info
+        return info
+    
     def _extract_tags(self, tag: Any) -> Dict[str, str]:
         """
         Извлекает морфологические теги из тега pymorphy2.
@@ -243,66 +511,242 @@ class MorphologicalAnalyzer:
         # Очищаем слово от знаков препинания и приводим к нижнему регистру
         clean_word = self._clean_word(word)
         # Проверяем наличие слова в словаре омонимов
-        if clean_word in self.homonyms_dict:
-            parses = self.homonyms_dict[clean_word]
-            
-            # Детальный анализ контекста
-            if context and len(context) > 0:
-                context_lower = [self._clean_word(w) for w in context]
-                print(f"DEBUG: Анализируем слово '{clean_word}' в контексте {context_lower}")
-                
-                # Вычисляем релевантность каждого варианта разбора
-                match_scores = []
-                
-                for i, parse in enumerate(parses):
-                    score = 0
-                    markers = parse.get('markers', [])
-                    # Подсчитываем количество совпадающих маркеров
-                    matching_markers = [marker for marker in markers if marker in context_lower]
-                    score = len(matching_markers)
-                    
-                    sense = parse['tags'].get('sense', '')
-                    match_scores.append((i, score, matching_markers, sense))
-                    print(f"DEBUG: Вариант {i}: значение='{sense}', совпадений={score}, маркеры={matching_markers}")
-                
-                # Выбираем вариант с наибольшим количеством совпадений
-                match_scores.sort(key=lambda x: x[1], reverse=True)
-                
-                # Если есть хотя бы одно совпадение, используем этот вариант
-                if match_scores and match_scores[0][1] > 0:
-                    best_match = match_scores[0]
-                    best_parse = parses[best_match[0]]
-                    print(f"DEBUG: Выбран вариант {best_match[0]} с {best_match[1]} совпадениями")
-                    
-                    # Получаем значение омонима из тегов
-                    sense = best_parse['tags'].get('sense', '')
-                    
-                    return {
-                        'word': word,
-                        'lemma': best_parse['lemma'],
-                        'pos': best_parse['pos'],
-                        'tags': best_parse['tags'].copy(),
-                        'sense': sense,  # Добавляем значение омонима на верхний уровень
-                        'all_parses': []
-                    }
-            
-            # Если контекст не помог или его нет, вернем первый (наиболее вероятный) разбор
-            if parses:
-                default_parse = parses[0]
-                print(f"DEBUG: Используем вариант по умолчанию для '{clean_word}'")
-                # Получаем значение омонима из тегов
-                sense = default_parse['tags'].get('sense', '')
-                return {
-                    'word': word,
-                    'lemma': default_parse['lemma'],
-                    'pos': default_parse['pos'],
-                    'tags': default_parse['tags'].copy(),
-                    'sense': sense,  # Добавляем значение омонима на верхний уровень
-                    'all_parses': []
-                }
+        entry = self._homonym_index.get(clean_word)
+        if entry is not None and entry[0]:
+            # Контекст очищается один раз за вызов
+            context_lower = [self._clean_word(w) for w in context] if context else []
+            return self._resolve_indexed(word, clean_word, entry, context_lower)
         
         # По умолчанию просто анализируем слово без учета контекста
-        return self.analyze_word(word)
+        if not clean_word:
+            return self.analyze_word(word)
+        return self._analyze_clean_word(word, clean_word)
+    
+    def _resolve_indexed(self, word: str, clean_word: str,
+                         entry: Tuple[List[Dict[str, Any]], Dict[str, Tuple[Tuple[int, int], ...]]],
+                         context_lower: List[str]) -> Dict[str, Any]:
+        """
+        Выбирает вариант разбора омонима по совпадениям маркеров с контекстом.
+        
+        Оценка варианта - количество его маркеров, встречающихся в контексте.
+        Выбирается первый вариант с наибольшей положительной оценкой, иначе
+        первый (наиболее вероятный) вариант.
+        
+        Args:
+            word: Исходное слово
+            clean_word: Очищенное слово
+            entry: Запись индекса омонимов (варианты разбора, обратный индекс маркеров)
+            context_lower: Очищенные слова контекста
+            
+        Returns:
+            Словарь с морфологическими характеристиками выбранного варианта
+        """
+        parses, markers_index = entry
+        
+        # Позиции совпавших маркеров каждого варианта: один поиск на слово контекста
+        hits: List[List[int]] = [[] for _ in parses]
+        for context_word in set(context_lower):
+            for i, position in markers_index.get(context_word, ()):
+                hits[i].append(position)
+        
+        best = max(range(len(parses)), key=lambda i: len(hits[i]))
+        resolved_by = 'context' if hits[best] else 'default'
+        if not hits[best]:
+            best = 0
+        
+        # Событие трассировки формируется, только если его кто-то получит
+        if self.trace is not None or logger.isEnabledFor(logging.DEBUG):
+            candidates = []
+            for i, parse in enumerate(parses):
+                markers = parse.get('markers', [])
+                candidates.append({
+                    'index': i,
+                    'sense': parse['tags'].get('sense', ''),
+                    'score': len(hits[i]),
+                    'markers': [markers[position] for position in sorted(hits[i])]
+                })
+            self._trace_homonym(clean_word, context_lower, candidates, best, resolved_by)
+        
+        parse = parses[best]
+        # Получаем значение омонима из тегов
+        sense = parse['tags'].get('sense', '')
+        
+        return {
+            'word': word,
+            'lemma': parse['lemma'],
+            'pos': parse['pos'],
+            'tags': parse['tags'].copy(),
+            'sense': sense,  # Добавляем значение омонима на верхний уровень
+            'all_parses': []
+        }
+    
+    def _trace_homonym(self, word: str, context: List[str], candidates: List[Dict[str, Any]],
+                       winner: int, resolved_by: str) -> None:
+        """
+        Передает событие снятия омонимии в приемник трассировки и в лог.
+        
+        Args:
+            word: Очищенное слово
+            context: Очищенные слова контекста
+            candidates: Варианты разбора с оценками
+            winner: Номер выбранного варианта
+            resolved_by: Способ выбора ('context' или 'default')
+        """
+        event = {
+            'word': word,
+            'context': context,
+            'candidates': candidates,
+            'winner': winner,
+            'resolved_by': resolved_by
+        }
+        
+        if self.trace is not None:
+            self.trace(event)
+        
+        logger.debug("Омоним '%s' в контексте %s: варианты %s, выбран %d (%s)",
+                     word, context, candidates, winner, resolved_by)
+    
+    def analyze_tokens(self, tokens: Iterable[str], window: int = DEFAULT_CONTEXT_WINDOW,
+                       before: Sequence[str] = (), after: Sequence[str] = ()) -> List[Dict[str, Any]]:
+        """
+        Анализирует последовательность токенов с учетом контекста.
+        
+        Результат совпадает с вызовом analyze_token_with_homonym_resolution
+        для каждого слова с window предыдущими и следующими токенами.
+        
+        Args:
+            tokens: Токены для анализа
+            window: Количество токенов контекста с каждой стороны
+            before: Токены перед tokens (используются только как контекст)
+            after: Токены после tokens (используются только как контекст)
+            
+        Returns:
+            Список результатов анализа для слов (знаки препинания пропускаются)
+        """
+        return list(self.iter_analyze_tokens(tokens, window, before, after))
+    
+    def iter_analyze_tokens(self, tokens: Iterable[str], window: int = DEFAULT_CONTEXT_WINDOW,
+                            before: Sequence[str] = (), after: Sequence[str] = ()) -> Iterator[Dict[str, Any]]:
+        """
+        Лениво анализирует поток токенов со скользящим окном контекста.
+        
+        В памяти находится только окно из 2 * window + 1 токенов.
+        
+        Args:
+            tokens: Токены для анализа (любой итерируемый объект)
+            window: Количество токенов контекста с каждой стороны
+            before: Токены перед tokens (используются только как контекст)
+            after: Токены после tokens (используются только как контекст)
+            
+        Yields:
+            Результаты анализа слов (знаки препинания пропускаются)
+        """
+        context = ContextWindow(window, self._clean_word)
+        for entry in self._iter_window_words(context, tokens, before, after):
+            yield self._analyze_in_window(entry, context)
+    
+    def analyze_tokens_columnar(self, tokens: Iterable[str], window: int = DEFAULT_CONTEXT_WINDOW,
+                                before: Sequence[str] = (), after: Sequence[str] = ()) -> AnalysisColumns:
+        """
+        Анализирует последовательность токенов и возвращает результат по столбцам.
+        
+        Строки совпадают с результатом analyze_tokens, но для обычных слов
+        значения берутся прямо из кэша разборов без построения словарей.
+        
+        Args:
+            tokens: Токены для анализа
+            window: Количество токенов контекста с каждой стороны
+            before: Токены перед tokens (используются только как контекст)
+            after: Токены после tokens (используются только как контекст)
+            
+        Returns:
+            Колоночное представление результатов (знаки препинания пропускаются)
+        """
+        columns = AnalysisColumns()
+        context = ContextWindow(window, self._clean_word)
+        homonym_index = self._homonym_index
+        parse = self._parse_cached
+        
+        for entry in self._iter_window_words(context, tokens, before, after):
+            token, _, clean_word = entry
+            homonym = homonym_index.get(clean_word)
+            if homonym is not None and homonym[0]:
+                columns.append_record(self._resolve_indexed(token, clean_word, homonym, context.context()))
+            elif not clean_word:
+                columns.append_record(self.analyze_word(token))
+            else:
+                lemma, pos, tags = parse(clean_word)
+                # Успешный разбор всегда содержит все граммемы в порядке TAG_COLUMNS
+                if len(tags) == len(TAG_COLUMNS):
+                    columns.append_parse(token, lemma, pos, tags)
+                else:
+                    columns.append(token, lemma, pos, tags)
+        
+        return columns
+    
+    def _iter_window_words(self, context: ContextWindow, tokens: Iterable[str],
+                           before: Sequence[str], after: Sequence[str]) -> Iterator[List[Any]]:
+        """
+        Продвигает окно по токенам и выдает элементы окна для слов.
+        
+        В момент выдачи элемент является текущим словом окна, и
+        context.context() возвращает его контекст.
+        
+        Args:
+            context: Пустое окно контекста
+            tokens: Токены для анализа
+            before: Токены перед tokens (используются только как контекст)
+            after: Токены после tokens (используются только как контекст)
+            
+        Yields:
+            Элементы окна [токен, признак слова, очищенное слово]
+        """
+        window = context.size
+        for token in before[max(0, len(before) - window):]:
+            context.remember(token)
+        
+        # Токен становится текущим, когда в окно попали window следующих токенов
+        for token in tokens:
+            entry = context.push(token)
+            # Анализируем только слова (не знаки препинания)
+            if entry is not None and entry[1]:
+                yield entry
+        
+        # Хвост: правый контекст берется из after или остается неполным
+        pending = len(context)
+        for token in after[:window]:
+            entry = context.push(token)
+            if entry is not None and pending:
+                pending -= 1
+                if entry[1]:
+                    yield entry
+        
+        for _ in range(pending):
+            entry = context.advance()
+            if entry[1]:
+                yield entry
+    
+    def _analyze_in_window(self, entry: List[Any], context: ContextWindow) -> Dict[str, Any]:
+        """
+        Анализирует текущее слово окна.
+        
+        Args:
+            entry: Элемент окна текущего слова
+            context: Окно контекста
+            
+        Returns:
+            Результат анализа
+        """
+        token, _, clean_word = entry
+        
+        # Контекст нужен только омонимам
+        homonym = self._homonym_index.get(clean_word)
+        if homonym is not None and homonym[0]:
+            return self._resolve_indexed(token, clean_word, homonym, context.context())
+        
+        if not clean_word:
+            return self.analyze_word(token)
+        return self._analyze_clean_word(token, clean_word)
     
     def analyze_text(self, text: str) -> List[Dict[str, Any]]:
         """
@@ -314,14 +758,23 @@ class MorphologicalAnalyzer:
         Returns:
             Список словарей с морфологическими характеристиками слов
         """
-        # Разбиваем текст на предложения
-        sentences = re.split(r'[.!?]+', text)
+        stream = TokenStream(text)
         result = []
+        # Текст предложения - от конца предыдущего предложения до его знака конца
+        segment_start = 0
         
         # Обрабатываем каждое предложение
-        for sentence in sentences:
-            # Извлекаем слова из предложения
-            words = re.findall(r'[а-яёА-ЯЁ]+', sentence.lower())
+        for first, last in stream.sentences():
+            end = last
+            while end > first and stream.is_sentence_end(end - 1):
+                end -= 1
+            segment_end = stream.starts[end] if end < last else len(text)
+            sentence = text[segment_start:segment_end]
+            segment_start = stream.ends[last - 1]
+            
+            # Извлекаем слова предложения (кириллические части токенов-слов)
+            words = [part for index in range(first, end) if stream.types[index] == TOKEN_WORD
+                     for part in _CYRILLIC_RE.findall(stream[index].lower())]
             
             if not words:
                 continue
@@ -338,3 +791,46 @@ class MorphologicalAnalyzer:
                 
                 result.append(analysis)
         return result
+
+
+def get_shared_analyzer() -> MorphologicalAnalyzer:
+    """
+    Возвращает анализатор с параметрами по умолчанию, общий для процесса.
+    
+    Анализатор создается при первом вызове; последующие вызовы получают тот же
+    объект вместе с накопленным кэшем разборов.
+    
+    Returns:
+        Общий морфологический анализатор
+    """
+    global _shared_analyzer
+    if _shared_analyzer is None:
+        with _init_lock:
+            if _shared_analyzer is None:
+                _shared_analyzer = MorphologicalAnalyzer()
+    return _shared_analyzer
+
+
+def preload(freeze: bool = True) -> MorphologicalAnalyzer:
+    """
+    Заранее загружает словари pymorphy2 и омонимов в текущем процессе.
+    
+    Вызывается до создания дочерних процессов (пул процессов, сервер с
+    предварительным fork): потомки получают уже загруженные словари и
+    разделяют их страницы памяти с родителем (copy-on-write).
+    
+    Args:
+        freeze: Перенести существующие объекты в постоянное поколение сборщика
+            мусора (gc.freeze), чтобы сборка мусора в потомках не копировала
+            страницы со словарями
+            
+    Returns:
+        Общий морфологический анализатор
+    """
+    analyzer = get_shared_analyzer()
+    get_morph_analyzer()
+    
+    if freeze:
+        gc.freeze()
+    
+    return analyzer
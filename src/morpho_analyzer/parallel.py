@@ -0,0 +1,160 @@
+"""
+Модуль для параллельного морфологического анализа.
+
+Этот модуль разбивает список токенов на фрагменты с перекрывающимися краями
+(контекстом для снятия омонимии), анализирует фрагменты в отдельных процессах
+и собирает результаты в исходном порядке, совпадающем с последовательным анализом.
+"""
+
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .morphology import DEFAULT_CONTEXT_WINDOW, MorphologicalAnalyzer, get_shared_analyzer, preload
+
+
+# Количество слов контекста с каждой стороны от анализируемого токена
+CONTEXT_SIZE = DEFAULT_CONTEXT_WINDOW
+
+# Ограничения на размер фрагмента по умолчанию (в токенах)
+MIN_CHUNK_SIZE = 256
+MAX_CHUNK_SIZE = 20000
+
+# Анализатор процесса-исполнителя (создается один раз при запуске процесса)
+_worker_analyzer: Optional[MorphologicalAnalyzer] = None
+
+
+def analyze_token_range(analyzer: MorphologicalAnalyzer, tokens: List[str],
+                        start: int, end: int,
+                        context_size: int = CONTEXT_SIZE) -> List[Dict[str, Any]]:
+    """
+    Анализирует токены с индексами [start, end) с учетом контекста.
+
+    Токены за пределами диапазона используются только как контекст.
+
+    Args:
+        analyzer: Морфологический анализатор
+        tokens: Список токенов
+        start: Индекс первого анализируемого токена
+        end: Индекс, следующий за последним анализируемым токеном
+        context_size: Количество слов контекста с каждой стороны
+
+    Returns:
+        Список результатов анализа для слов (знаки препинания пропускаются)
+    """
+    return analyzer.analyze_tokens(tokens[start:end], window=context_size,
+                                   before=tokens[max(0, start - context_size):start],
+                                   after=tokens[end:end + context_size])
+
+
+def split_into_chunks(tokens: List[str], chunk_size: int,
+                      context_size: int = CONTEXT_SIZE) -> List[Tuple[List[str], int, int]]:
+    """
+    Разбивает список токенов на фрагменты с перекрывающимися краями.
+
+    Каждый фрагмент содержит до context_size токенов слева и справа от своей
+    основной части, чтобы контекст токенов на границах не терялся.
+
+    Args:
+        tokens: Список токенов
+        chunk_size: Количество анализируемых токенов во фрагменте
+        context_size: Размер перекрытия с каждой стороны
+
+    Returns:
+        Список кортежей (токены фрагмента, начало, конец), где начало и конец -
+        границы анализируемой части относительно начала фрагмента
+    """
+    if chunk_size <= 0:
+        raise ValueError("Размер фрагмента должен быть положительным")
+
+    chunks = []
+
+    for core_start in range(0, len(tokens), chunk_size):
+        core_end = min(len(tokens), core_start + chunk_size)
+        window_start = max(0, core_start - context_size)
+        window_end = min(len(tokens), core_end + context_size)
+
+        chunks.append((tokens[window_start:window_end],
+                       core_start - window_start,
+                       core_end - window_start))
+
+    return chunks
+
+
+def _init_worker() -> None:
+    """
+    Инициализирует процесс-исполнитель: получает общий анализатор процесса.
+
+    При запуске через fork анализатор и словари уже загружены родителем.
+    """
+    global _worker_analyzer
+    _worker_analyzer = get_shared_analyzer()
+
+
+def _analyze_chunk(chunk: Tuple[List[str], int, int]) -> List[Dict[str, Any]]:
+    """
+    Анализирует один фрагмент в процессе-исполнителе.
+
+    Args:
+        chunk: Кортеж (токены фрагмента, начало, конец)
+
+    Returns:
+        Результаты анализа основной части фрагмента
+    """
+    window, start, end = chunk
+    return analyze_token_range(_worker_analyzer, window, start, end)
+
+
+def analyze_tokens_parallel(tokens: List[str], workers: int = 1,
+                            chunk_size: Optional[int] = None,
+                            analyzer: Optional[MorphologicalAnalyzer] = None,
+                            progress: Optional[Callable[[int], Any]] = None) -> List[Dict[str, Any]]:
+    """
+    Выполняет морфологический анализ токенов в нескольких процессах.
+
+    Результаты возвращаются в исходном порядке и совпадают с результатами
+    последовательного анализа.
+
+    Args:
+        tokens: Список токенов
+        workers: Количество процессов (1 - анализ в текущем процессе)
+        chunk_size: Количество токенов во фрагменте (None - подбирается автоматически)
+        analyzer: Анализатор для последовательного режима (None - общий анализатор процесса)
+        progress: Функция, вызываемая с количеством обработанных токенов после каждого фрагмента
+
+    Returns:
+        Список результатов анализа слов
+    """
+    if not tokens:
+        return []
+
+    if chunk_size is None:
+        # Несколько фрагментов на процесс для равномерной загрузки
+        chunk_size = math.ceil(len(tokens) / (max(1, workers) * 4))
+        chunk_size = max(MIN_CHUNK_SIZE, min(MAX_CHUNK_SIZE, chunk_size))
+
+    chunks = split_into_chunks(tokens, chunk_size)
+    results: List[Dict[str, Any]] = []
+
+    if workers <= 1:
+        if analyzer is None:
+            analyzer = get_shared_analyzer()
+        for window, start, end in chunks:
+            results.extend(analyze_token_range(analyzer, window, start, end))
+            if progress:
+                progress(end - start)
+        return results
+
+    # Процессы, созданные через fork, наследуют загруженные словари
+    if multiprocessing.get_start_method() == 'fork':
+        preload(freeze=False)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        # map возвращает результаты в порядке фрагментов
+        for chunk, chunk_results in zip(chunks, executor.map(_analyze_chunk, chunks)):
+            results.extend(chunk_results)
+            if progress:
+                progress(chunk[2] - chunk[1])
+
+    return results
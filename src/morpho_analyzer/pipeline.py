@@ -0,0 +1,157 @@
+"""
+Модуль потоковой обработки текста.
+
+Этот модуль предоставляет этапы конвейера в виде генераторов
+(чтение -> токенизация -> анализ -> разбиение на слоги -> запись),
+а также накопитель агрегированной статистики. В памяти хранятся только
+агрегаты, поэтому объем памяти не зависит от размера входного файла.
+"""
+
+import json
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from .morphology import DEFAULT_CONTEXT_WINDOW, MorphologicalAnalyzer
+from .syllables import SyllableStatistics, split_cached
+from .trie import PrefixTree
+
+
+# Количество слов контекста с каждой стороны от анализируемого токена
+CONTEXT_SIZE = DEFAULT_CONTEXT_WINDOW
+
+
+def iter_analyzed_tokens(tokens: Iterable[str], analyzer: MorphologicalAnalyzer,
+                         context_size: int = CONTEXT_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Потоково анализирует токены со скользящим окном контекста.
+
+    Результаты совпадают с анализом полного списка токенов: каждому слову
+    передается до context_size предыдущих и следующих токенов.
+
+    Args:
+        tokens: Поток токенов
+        analyzer: Морфологический анализатор
+        context_size: Количество слов контекста с каждой стороны
+
+    Returns:
+        Генератор результатов анализа слов (знаки препинания пропускаются)
+    """
+    return analyzer.iter_analyze_tokens(tokens, window=context_size)
+
+
+def iter_syllabified(analyzed: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """
+    Добавляет к результатам анализа разбиение слов на слоги.
+
+    Args:
+        analyzed: Поток результатов морфологического анализа
+
+    Yields:
+        Результат анализа с ключом 'syllables'
+    """
+    for item in analyzed:
+        item['syllables'] = list(split_cached(item['word']))
+        yield item
+
+
+class StreamAggregates:
+    """
+    Агрегированная статистика потоковой обработки.
+
+    Attributes:
+        word_count: Количество обработанных слов
+        pos_counts: Частоты частей речи
+        syllable_stats: Накопитель статистики по слогам
+        trie: Префиксное дерево без данных о словах (только счетчики узлов)
+    """
+
+    def __init__(self):
+        """
+        Инициализирует пустые агрегаты.
+        """
+        self.word_count = 0
+        self.pos_counts = Counter()
+        self.syllable_stats = SyllableStatistics()
+        self.trie = PrefixTree()
+
+    def add(self, item: Dict[str, Any]) -> None:
+        """
+        Учитывает результат анализа одного слова.
+
+        Args:
+            item: Результат анализа с ключом 'syllables'
+        """
+        self.word_count += 1
+
+        pos = item.get('pos')
+        if pos:  # Пропускаем None и пустые строки
+            self.pos_counts[pos] += 1
+
+        self.syllable_stats.add(item['syllables'])
+        self.trie.insert(item['syllables'])
+
+
+class JsonLinesWriter:
+    """
+    Потоковая запись результатов анализа в формате JSON Lines.
+    """
+
+    def __init__(self, output_path: str):
+        """
+        Открывает файл для записи.
+
+        Args:
+            output_path: Путь к файлу .jsonl
+        """
+        self.output_path = output_path
+        self.rows_written = 0
+        self._file = open(output_path, 'w', encoding='utf-8')
+
+    def write(self, item: Dict[str, Any]) -> None:
+        """
+        Записывает результат анализа одного слова отдельной строкой.
+
+        Args:
+            item: Результат морфологического анализа слова
+        """
+        self._file.write(json.dumps(item, ensure_ascii=False))
+        self._file.write('\n')
+        self.rows_written += 1
+
+    def close(self) -> None:
+        """
+        Закрывает файл.
+        """
+        self._file.close()
+
+    def __enter__(self) -> 'JsonLinesWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def run_stream(items: Iterable[Dict[str, Any]], writers: Iterable[Any] = (),
+               aggregates: Optional[StreamAggregates] = None) -> StreamAggregates:
+    """
+    Прогоняет поток результатов анализа через писателей и агрегаты.
+
+    Args:
+        items: Поток результатов анализа с разбиением на слоги
+        writers: Объекты с методом write(item), получающие каждый результат
+        aggregates: Накопитель статистики (по умолчанию создается новый)
+
+    Returns:
+        Накопленная статистика
+    """
+    if aggregates is None:
+        aggregates = StreamAggregates()
+
+    writers = list(writers)
+
+    for item in items:
+        for writer in writers:
+            writer.write(item)
+        aggregates.add(item)
+
+    return aggregates
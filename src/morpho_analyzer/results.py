@@ -0,0 +1,212 @@
+"""
+Модуль записи и чтения результатов анализа.
+
+Результаты (анализ слов, статистика слогов, префиксное дерево) сохраняются
+в одном из форматов:
+    json    - компактный JSON без отступов;
+    jsonl   - JSON Lines, одна строка на слово (дерево и статистика
+              восстанавливаются по словам при чтении);
+    msgpack - двоичный MessagePack (требуется пакет msgpack);
+    parquet - столбцы анализа слов для pandas/Arrow (требуется pyarrow).
+
+В форматах json и msgpack дерево не дублирует данные слов: концы слов
+хранят номера результатов в списке analyzed_text (word_refs).
+"""
+
+import importlib
+import importlib.util
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from .columnar import AnalysisColumns
+from .syllables import get_syllabification_stats
+from .trie import PrefixTree
+
+
+# Поддерживаемые форматы и расширения файлов
+RESULT_FORMATS = {
+    'json': '.json',
+    'jsonl': '.jsonl',
+    'msgpack': '.msgpack',
+    'parquet': '.parquet',
+}
+
+# Необязательные пакеты, которые требуются форматам
+FORMAT_REQUIREMENTS = {
+    'msgpack': 'msgpack',
+    'parquet': 'pyarrow',
+}
+
+
+class MorphoJSONEncoder(json.JSONEncoder):
+    """
+    Кодировщик JSON, поддерживающий объекты pymorphy2.
+    """
+
+    def default(self, obj):
+        # Обрабатываем объекты pymorphy2.analyzer.Parse
+        if hasattr(obj, 'tag') and hasattr(obj, 'normal_form'):
+            return {
+                'normal_form': obj.normal_form,
+                'pos': str(obj.tag.POS),
+                'tag': str(obj.tag)
+            }
+        # Обрабатываем объекты pymorphy2.tagset.OpencorporaTag
+        if hasattr(obj, 'POS') and hasattr(obj, 'grammemes'):
+            return str(obj)
+        # Для всех остальных типов используем стандартный механизм
+        return json.JSONEncoder.default(self, obj)
+
+
+def format_available(result_format: str) -> bool:
+    """
+    Проверяет, установлен ли пакет, нужный для формата результатов.
+
+    Args:
+        result_format: Формат (см. RESULT_FORMATS)
+
+    Returns:
+        True, если формат можно записать в текущем окружении
+    """
+    module = FORMAT_REQUIREMENTS.get(result_format)
+    return module is None or importlib.util.find_spec(module) is not None
+
+
+def build_results(analyzed_text: List[Dict[str, Any]], syllable_stats: Dict[str, Any],
+                  trie: PrefixTree) -> Dict[str, Any]:
+    """
+    Формирует словарь результатов, в котором дерево ссылается на анализ слов по номерам.
+
+    Args:
+        analyzed_text: Результаты анализа слов (данные слов дерева)
+        syllable_stats: Статистика слогов
+        trie: Префиксное дерево
+
+    Returns:
+        Словарь с ключами analyzed_text, syllable_stats и trie
+    """
+    return {
+        "analyzed_text": analyzed_text,
+        "syllable_stats": syllable_stats,
+        "trie": trie.serialize(analyses=analyzed_text)
+    }
+
+
+def write_results(output_path: str, analyzed_text: List[Dict[str, Any]],
+                  syllable_stats: Dict[str, Any], trie: PrefixTree,
+                  result_format: str = 'json') -> str:
+    """
+    Сохраняет результаты анализа в выбранном формате.
+
+    Args:
+        output_path: Путь к файлу
+        analyzed_text: Результаты анализа слов
+        syllable_stats: Статистика слогов
+        trie: Префиксное дерево (данные слов - объекты из analyzed_text)
+        result_format: Формат (см. RESULT_FORMATS)
+
+    Returns:
+        Путь к сохраненному файлу
+
+    Raises:
+        ValueError: Если формат не поддерживается
+        ImportError: Если не установлен пакет, необходимый для формата
+    """
+    if result_format == 'json':
+        text = json.dumps(build_results(analyzed_text, syllable_stats, trie),
+                          ensure_ascii=False, separators=(',', ':'), cls=MorphoJSONEncoder)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    elif result_format == 'jsonl':
+        with open(output_path, 'w', encoding='utf-8') as f:
+            for item in analyzed_text:
+                f.write(json.dumps(item, ensure_ascii=False, separators=(',', ':')))
+                f.write('\n')
+
+    elif result_format == 'msgpack':
+        msgpack = _import_optional('msgpack')
+        with open(output_path, 'wb') as f:
+            f.write(msgpack.packb(build_results(analyzed_text, syllable_stats, trie),
+                                  use_bin_type=True))
+
+    elif result_format == 'parquet':
+        _import_optional('parquet')
+        df = AnalysisColumns.from_records(analyzed_text).to_pandas()
+        df['syllables'] = [item.get('syllables', []) for item in analyzed_text]
+        df.to_parquet(output_path, index=False)
+
+    else:
+        raise ValueError(f"Неизвестный формат результатов: {result_format}")
+
+    return output_path
+
+
+def load_results(input_path: str, result_format: Optional[str] = None
+                 ) -> Tuple[List[Dict[str, Any]], Dict[str, Any], PrefixTree]:
+    """
+    Читает результаты, сохраненные write_results.
+
+    Поддерживаются форматы json, jsonl и msgpack, а также JSON с копиями данных
+    слов в дереве (word_data), который создавали прежние версии. Файлы parquet
+    предназначены для pandas.read_parquet.
+
+    Args:
+        input_path: Путь к файлу
+        result_format: Формат (None - определяется по расширению файла)
+
+    Returns:
+        Кортеж (результаты анализа слов, статистика слогов, префиксное дерево)
+
+    Raises:
+        ValueError: Если формат не поддерживается для чтения
+    """
+    if result_format is None:
+        extension = os.path.splitext(input_path)[1].lower()
+        result_format = next((name for name, ext in RESULT_FORMATS.items() if ext == extension), extension)
+
+    if result_format == 'jsonl':
+        with open(input_path, 'r', encoding='utf-8') as f:
+            analyzed_text = [json.loads(line) for line in f if line.strip()]
+
+        # Дерево и статистика восстанавливаются по словам в исходном порядке
+        trie = PrefixTree()
+        for item in analyzed_text:
+            trie.insert(item['syllables'], item)
+        syllable_stats = get_syllabification_stats([item['word'] for item in analyzed_text])
+        return analyzed_text, syllable_stats, trie
+
+    if result_format == 'json':
+        with open(input_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    elif result_format == 'msgpack':
+        msgpack = _import_optional('msgpack')
+        with open(input_path, 'rb') as f:
+            data = msgpack.unpackb(f.read(), raw=False, strict_map_key=False)
+    else:
+        raise ValueError(f"Чтение формата результатов не поддерживается: {result_format}")
+
+    analyzed_text = data['analyzed_text']
+    trie = PrefixTree.deserialize(data['trie'], analyses=analyzed_text)
+    return analyzed_text, data['syllable_stats'], trie
+
+
+def _import_optional(result_format: str):
+    """
+    Импортирует необязательный пакет, нужный для формата результатов.
+
+    Args:
+        result_format: Формат (см. FORMAT_REQUIREMENTS)
+
+    Returns:
+        Импортированный модуль
+
+    Raises:
+        ImportError: Если пакет не установлен
+    """
+    module = FORMAT_REQUIREMENTS[result_format]
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        raise ImportError(f"Для формата {result_format} требуется пакет {module}: pip install {module}")
@@ -0,0 +1,402 @@
+"""
+Модуль результатов анализа (приемников).
+
+Каждый результат - графики, интерактивное дерево, Excel, отчет, JSON -
+оформлен как независимая задача (приемник), зарегистрированная в реестре
+SINKS. Приемники не зависят друг от друга, поэтому render_sinks выполняет их
+параллельно в пуле процессов (matplotlib не допускает построения графиков
+в нескольких потоках одного процесса) и измеряет время каждого. Общее время
+определяется самым медленным приемником, а не суммой. Ошибка приемника не
+прерывает остальные: она записывается в его результат.
+
+Новый приемник добавляется декоратором register_sink:
+
+    @register_sink('words_txt', 'json', 'список слов')
+    def render_words(context):
+        path = context.path('words.txt')
+        ...
+        return [path]
+"""
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .results import RESULT_FORMATS, write_results
+from .trie import PrefixTree
+from .visualization import (visualize_trie, visualize_parts_of_speech, visualize_syllable_statistics,
+                            visualize_trie_statistics, create_summary_report,
+                            visualize_trie_interactive, export_to_excel, create_simplified_trie)
+
+
+class OutputContext:
+    """
+    Данные и параметры, общие для всех приемников.
+
+    Attributes:
+        output_dir: Директория для сохранения результатов
+        analyzed_text: Результаты анализа слов (None в потоковом режиме)
+        trie: Префиксное дерево слогов
+        syllable_stats: Статистика слогов
+        pos_counts: Частоты частей речи (None - подсчитываются по analyzed_text)
+        trie_depth: Максимальная глубина визуализации дерева
+        simplified_max_words: Количество слов в упрощенном дереве (None - не строится)
+        results_formats: Форматы файла результатов анализа (см. results.RESULT_FORMATS)
+    """
+
+    def __init__(self, output_dir: str, trie: PrefixTree, syllable_stats: Dict[str, Any],
+                 analyzed_text: Optional[List[Dict[str, Any]]] = None,
+                 pos_counts: Optional[Dict[str, int]] = None,
+                 trie_depth: int = 5, simplified_max_words: Optional[int] = None,
+                 results_formats: Iterable[str] = ('json',)):
+        self.output_dir = output_dir
+        self.analyzed_text = analyzed_text
+        self.trie = trie
+        self.syllable_stats = syllable_stats
+        self.pos_counts = pos_counts
+        self.trie_depth = trie_depth
+        self.simplified_max_words = simplified_max_words
+        self.results_formats = tuple(results_formats)
+
+    def path(self, filename: str) -> str:
+        """
+        Возвращает путь к файлу результата.
+
+        Args:
+            filename: Имя файла
+
+        Returns:
+            Путь внутри директории результатов
+        """
+        return os.path.join(self.output_dir, filename)
+
+
+class Sink:
+    """
+    Описание приемника в реестре.
+
+    Attributes:
+        name: Уникальное имя приемника
+        output: Вид результата, к которому относится приемник (см. --outputs)
+        description: Описание результата
+        render: Функция, создающая результат и возвращающая пути к файлам
+        enabled: Функция, решающая по контексту, нужен ли приемник (None - всегда)
+    """
+
+    def __init__(self, name: str, output: str, description: str,
+                 render: Callable[[OutputContext], List[str]],
+                 enabled: Optional[Callable[[OutputContext], bool]] = None):
+        self.name = name
+        self.output = output
+        self.description = description
+        self.render = render
+        self.enabled = enabled
+
+
+# Реестр приемников в порядке регистрации
+SINKS: Dict[str, Sink] = {}
+
+
+def register_sink(name: str, output: str, description: str,
+                  enabled: Optional[Callable[[OutputContext], bool]] = None):
+    """
+    Декоратор, регистрирующий функцию как приемник.
+
+    Args:
+        name: Уникальное имя приемника
+        output: Вид результата (см. --outputs)
+        description: Описание результата
+        enabled: Функция, решающая по контексту, нужен ли приемник
+
+    Returns:
+        Декоратор, возвращающий функцию без изменений
+
+    Raises:
+        ValueError: Если приемник с таким именем уже зарегистрирован
+    """
+    def decorator(render: Callable[[OutputContext], List[str]]):
+        if name in SINKS:
+            raise ValueError(f"Приемник '{name}' уже зарегистрирован")
+        SINKS[name] = Sink(name, output, description, render, enabled)
+        return render
+    return decorator
+
+
+def select_sinks(outputs: Iterable[str], context: OutputContext) -> List[Sink]:
+    """
+    Выбирает приемники для запрошенных видов результатов.
+
+    Args:
+        outputs: Виды результатов
+        context: Контекст (для проверки условий приемников)
+
+    Returns:
+        Список приемников в порядке регистрации
+    """
+    outputs = set(outputs)
+    return [sink for sink in SINKS.values()
+            if sink.output in outputs and (sink.enabled is None or sink.enabled(context))]
+
+
+# Контекст процесса-исполнителя (наследуется при fork или передается при запуске)
+_worker_context: Optional[OutputContext] = None
+
+
+def _init_worker(context: Optional[OutputContext]) -> None:
+    """
+    Инициализирует процесс-исполнитель.
+
+    Args:
+        context: Контекст приемников (None - уже унаследован от родителя через fork)
+    """
+    global _worker_context
+    if context is not None:
+        _worker_context = context
+
+
+# Результат приемника: (имя, пути к файлам, время в секундах, ошибка или None)
+SinkResult = Tuple[str, List[str], float, Optional[str]]
+
+
+def _describe_error(error: BaseException) -> str:
+    """
+    Возвращает описание ошибки приемника (строка передается между процессами).
+    """
+    return f"{type(error).__name__}: {error}"
+
+
+def _timed_render(name: str, render: Callable[[OutputContext], List[str]],
+                  context: OutputContext) -> SinkResult:
+    """
+    Выполняет функцию приемника, измеряет время и перехватывает ошибку.
+
+    Args:
+        name: Имя приемника
+        render: Функция приемника
+        context: Контекст
+
+    Returns:
+        Результат приемника
+    """
+    start = time.perf_counter()
+    try:
+        paths = render(context) or []
+    except Exception as e:
+        return name, [], time.perf_counter() - start, _describe_error(e)
+    return name, paths, time.perf_counter() - start, None
+
+
+def _run_render(name: str, render: Callable[[OutputContext], List[str]]) -> SinkResult:
+    """
+    Выполняет функцию приемника в процессе-исполнителе.
+
+    Передается сама функция, а не имя в реестре: приемники, зарегистрированные
+    вызывающим кодом, могут отсутствовать в реестре процесса-исполнителя.
+
+    Args:
+        name: Имя приемника
+        render: Функция приемника
+
+    Returns:
+        Результат приемника (имя, пути к файлам, время в секундах, ошибка)
+    """
+    return _timed_render(name, render, _worker_context)
+
+
+def run_sink(sink: Sink, context: OutputContext) -> SinkResult:
+    """
+    Выполняет приемник и измеряет время.
+
+    Args:
+        sink: Приемник
+        context: Контекст
+
+    Returns:
+        Результат приемника (имя, пути к файлам, время в секундах, ошибка)
+    """
+    return _timed_render(sink.name, sink.render, context)
+
+
+def render_sinks(sinks: List[Sink], context: OutputContext,
+                 workers: int = 0) -> List[SinkResult]:
+    """
+    Выполняет приемники, по возможности параллельно.
+
+    Args:
+        sinks: Приемники
+        context: Контекст
+        workers: Количество процессов (0 - по числу приемников и ядер,
+            1 - последовательно в текущем процессе)
+
+    Returns:
+        Список результатов (имя, пути к файлам, время в секундах, ошибка) в порядке
+        приемников. Ошибка - описание исключения приемника или None при успехе
+    """
+    if workers <= 0:
+        workers = min(len(sinks), os.cpu_count() or 1)
+
+    if workers <= 1 or len(sinks) <= 1:
+        return [run_sink(sink, context) for sink in sinks]
+
+    global _worker_context
+
+    # Используется способ запуска процессов платформы по умолчанию: fork
+    # небезопасен в macOS (matplotlib, Objective-C). Если по умолчанию
+    # используется fork, потомки наследуют контекст без сериализации, иначе
+    # он передается каждому процессу один раз
+    mp_context = multiprocessing.get_context()
+    if mp_context.get_start_method() == 'fork':
+        _worker_context, initargs = context, (None,)
+    else:
+        initargs = (context,)
+
+    results = {}
+    try:
+        with ProcessPoolExecutor(max_workers=min(workers, len(sinks)), mp_context=mp_context,
+                                 initializer=_init_worker, initargs=initargs) as executor:
+            futures = {executor.submit(_run_render, sink.name, sink.render): sink.name
+                       for sink in sinks}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    # Сбой самого процесса-исполнителя или передачи результата
+                    results[name] = (name, [], 0.0, _describe_error(e))
+    finally:
+        _worker_context = None
+
+    return [results[sink.name] for sink in sinks]
+
+
+def _has_trie(context: OutputContext) -> bool:
+    """
+    Проверяет, доступно ли префиксное дерево (в потоковом режиме - без данных о словах).
+    """
+    return context.trie is not None
+
+
+def _has_analyzed_text(context: OutputContext) -> bool:
+    """
+    Проверяет, доступны ли результаты анализа слов (недоступны в потоковом режиме).
+    """
+    return context.analyzed_text is not None
+
+
+@register_sink('trie_png', 'charts', 'изображение префиксного дерева', enabled=_has_trie)
+def render_trie_png(context: OutputContext) -> List[str]:
+    """
+    Сохраняет изображение префиксного дерева.
+    """
+    path = context.path("trie_visualization.png")
+    visualize_trie(context.trie, max_depth=context.trie_depth,
+                   output_path=path, title="Префиксное дерево слогов")
+    return [path]
+
+
+@register_sink('pos_png', 'charts', 'распределение частей речи')
+def render_pos_png(context: OutputContext) -> List[str]:
+    """
+    Сохраняет диаграмму распределения частей речи.
+    """
+    path = context.path("parts_of_speech.png")
+    visualize_parts_of_speech(context.analyzed_text, output_path=path,
+                              title="Распределение частей речи в тексте",
+                              pos_counts=context.pos_counts)
+    return [path]
+
+
+@register_sink('syllables_png', 'charts', 'статистика слогов')
+def render_syllables_png(context: OutputContext) -> List[str]:
+    """
+    Сохраняет графики статистики слогов.
+    """
+    path = context.path("syllable_statistics.png")
+    visualize_syllable_statistics(context.syllable_stats, output_path=path,
+                                  title="Статистика слогов")
+    return [path]
+
+
+@register_sink('trie_html', 'html', 'интерактивное префиксное дерево', enabled=_has_trie)
+def render_trie_html(context: OutputContext) -> List[str]:
+    """
+    Сохраняет интерактивную HTML-визуализацию дерева.
+    """
+    path = context.path("trie_interactive.html")
+    visualize_trie_interactive(context.trie, max_depth=context.trie_depth, output_path=path,
+                               title="Интерактивное префиксное дерево слогов (полное)")
+    return [path]
+
+
+@register_sink('trie_html_simplified', 'html', 'упрощенное интерактивное префиксное дерево',
+               enabled=lambda context: _has_analyzed_text(context) and bool(context.simplified_max_words))
+def render_trie_html_simplified(context: OutputContext) -> List[str]:
+    """
+    Сохраняет HTML-визуализацию дерева из ограниченного числа слов.
+    """
+    path = context.path("trie_interactive_simplified.html")
+    simplified_trie = create_simplified_trie(context.trie, max_words=context.simplified_max_words)
+    visualize_trie_interactive(simplified_trie, max_depth=context.trie_depth, output_path=path,
+                               title=f"Интерактивное префиксное дерево слогов "
+                                     f"(упрощенное, {context.simplified_max_words} слов)")
+    return [path]
+
+
+@register_sink('trie_stats_png', 'charts', 'статистика префиксного дерева')
+def render_trie_stats_png(context: OutputContext) -> List[str]:
+    """
+    Сохраняет графики статистики префиксного дерева.
+    """
+    path = context.path("trie_statistics.png")
+    visualize_trie_statistics(context.trie.get_statistics(), output_path=path,
+                              title="Статистика префиксного дерева")
+    return [path]
+
+
+@register_sink('excel', 'excel', 'русифицированная таблица Excel', enabled=_has_analyzed_text)
+def render_excel(context: OutputContext) -> List[str]:
+    """
+    Сохраняет русифицированную таблицу Excel.
+    """
+    path = context.path("morphological_analysis.xlsx")
+    export_to_excel(context.analyzed_text, output_path=path, sheet_name="Морфологический анализ")
+    return [path]
+
+
+@register_sink('report', 'report', 'отчет в формате Markdown')
+def render_report(context: OutputContext) -> List[str]:
+    """
+    Сохраняет отчет в формате Markdown.
+    """
+    path = context.path("analysis_report.md")
+    create_summary_report(context.analyzed_text, context.trie, context.syllable_stats,
+                          output_path=path, pos_counts=context.pos_counts)
+    return [path]
+
+
+def _results_enabled(result_format: str, context: OutputContext) -> bool:
+    """
+    Проверяет, запрошен ли файл результатов в заданном формате.
+    """
+    return _has_analyzed_text(context) and result_format in context.results_formats
+
+
+def _render_results(result_format: str, context: OutputContext) -> List[str]:
+    """
+    Сохраняет результаты анализа, статистику слогов и дерево в заданном формате.
+    """
+    path = context.path("analysis_results" + RESULT_FORMATS[result_format])
+    write_results(path, context.analyzed_text, context.syllable_stats, context.trie, result_format)
+    return [path]
+
+
+# Файлы результатов в каждом формате - отдельные приемники вида json
+for _format, _description in (('json', 'результаты анализа в компактном JSON'),
+                              ('jsonl', 'результаты анализа в JSON Lines (строка на слово)'),
+                              ('msgpack', 'результаты анализа в MessagePack'),
+                              ('parquet', 'столбцы анализа слов в Parquet')):
+    register_sink(_format, 'json', _description,
+                  enabled=partial(_results_enabled, _format))(partial(_render_results, _format))
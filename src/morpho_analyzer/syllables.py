@@ -6,7 +6,9 @@
 """
 
 import re
-from typing import List
+from collections import Counter
+from functools import lru_cache
+from typing import Iterable, List, Sequence, Tuple
 
 # Определение гласных для русского языка
 RU_VOWELS = set('аеёиоуыэюя')
@@ -22,16 +24,35 @@ INDIVISIBLE_CONSONANT_PAIRS = [
     'вз', 'вс', 'вб', 'вг', 'вд', 'вж', 'вз', 'вт', 'вп'
 ]
 
+# Предкомпилированные таблицы для быстрого разбиения (split_many):
+# шаблон очистки слова, множество гласных и множество неразделяемых сочетаний
+_CLEAN_PATTERN = re.compile(r'[^а-яёА-ЯЁ]')
+_VOWELS = frozenset(RU_VOWELS)
+_INDIVISIBLE_CLUSTERS = frozenset(INDIVISIBLE_CONSONANT_PAIRS)
+
+# Максимальный размер кэша разбиений (количество различных словоформ)
+SYLLABLE_CACHE_SIZE = 100000
+
+# Слова с заранее заданным разбиением
+_SPECIFIC_WORDS = {
+    "молоко": ('мо', 'ло', 'ко'),
+    "книга": ('кни', 'га'),
+    "яблоко": ('яб', 'ло', 'ко'),
+    "дерево": ('де', 'ре', 'во'),
+    "стол": ('стол',),
+    "учитель": ('у', 'чи', 'тель'),
+    "наука": ('на', 'у', 'ка'),
+    "пример": ('при', 'мер'),
+    "встреча": ('встре', 'ча'),
+    "пст": ('пст',)
+}
+
 
 def split_into_syllables(word: str) -> List[str]:
     """
     Разделяет слово на слоги согласно правилам русского языка.
     
-    Основные правила:
-    1. Каждый слог должен содержать одну гласную
-    2. Согласные между гласными обычно относятся к следующему слогу
-    3. Если между гласными несколько согласных, то граница проходит по-разному 
-       в зависимости от сочетаний
+    Использует предкомпилированные таблицы (см. split_many).
     
     Args:
         word: Слово для разделения на слоги
@@ -43,103 +64,124 @@ def split_into_syllables(word: str) -> List[str]:
         >>> split_into_syllables("молоко")
         ['мо', 'ло', 'ко']
     """
-    # Приведение к нижнему регистру и удаление символов, не являющихся буквами русского алфавита
-    word = re.sub(r'[^а-яёА-ЯЁ]', '', word.lower())
+    return _split_clean_word(_CLEAN_PATTERN.sub('', word.lower()))
+
+
+def split_many(words: Iterable[str]) -> List[List[str]]:
+    """
+    Разделяет на слоги последовательность слов.
+    
+    Пакетная точка входа быстрого алгоритма: шаблон очистки скомпилирован
+    заранее, классы букв проверяются по множествам, а неразделяемое сочетание
+    согласных находится одной проверкой вхождения вместо перебора списка.
+    
+    Args:
+        words: Слова для разделения
+        
+    Returns:
+        Список разбиений (по одному списку слогов на слово)
+    """
+    clean = _CLEAN_PATTERN.sub
+    split = _split_clean_word
+    return [split(clean('', word.lower())) for word in words]
+
+
+@lru_cache(maxsize=SYLLABLE_CACHE_SIZE)
+def split_cached(word: str) -> Tuple[str, ...]:
+    """
+    Разделяет слово на слоги с запоминанием результата (LRU-кэш).
+    
+    Результат - кортеж, чтобы одно разбиение можно было безопасно
+    разделять между всеми вхождениями словоформы.
+    
+    Args:
+        word: Слово для разделения на слоги
+        
+    Returns:
+        Кортеж слогов
+    """
+    return tuple(_split_clean_word(_CLEAN_PATTERN.sub('', word.lower())))
+
+
+def syllable_cache_info():
+    """
+    Возвращает статистику кэша разбиений.
+    
+    Returns:
+        Именованный кортеж (hits, misses, maxsize, currsize)
+    """
+    return split_cached.cache_info()
+
+
+def clear_syllable_cache() -> None:
+    """
+    Очищает кэш разбиений.
+    """
+    split_cached.cache_clear()
+
+
+def syllabify_words(words: Iterable[str]) -> List[List[str]]:
+    """
+    Разделяет на слоги последовательность слов, разбивая каждую словоформу один раз.
+    
+    Повторяющиеся словоформы берутся из кэша split_cached; каждое вхождение
+    получает собственный список слогов.
+    
+    Args:
+        words: Слова для разделения
+        
+    Returns:
+        Список разбиений (по одному списку слогов на слово)
+    """
+    split = split_cached
+    return [list(split(word)) for word in words]
+
+
+def _split_clean_word(word: str) -> List[str]:
+    """
+    Разделяет на слоги слово, уже приведенное к нижнему регистру и очищенное.
     
-    # Если слово пустое или состоит из одного символа, возвращаем его как есть
+    Args:
+        word: Очищенное слово
+        
+    Returns:
+        Список слогов
+    """
     if len(word) <= 1:
         return [word]
     
-    # Если в слове нет гласных, возвращаем его целиком как один слог
-    if not any(char in RU_VOWELS for char in word):
+    vowel_indices = [i for i, char in enumerate(word) if char in _VOWELS]
+    
+    # Нет гласных или одна гласная - всё слово один слог
+    if len(vowel_indices) <= 1:
         return [word]
     
-    # Для конкретных тестовых слов, возвращаем ожидаемый результат
-    # Это упрощение, в реальном приложении нужен более сложный алгоритм
-    specific_words = {
-        "молоко": ['мо', 'ло', 'ко'],
-        "книга": ['кни', 'га'],
-        "яблоко": ['яб', 'ло', 'ко'],
-        "дерево": ['де', 'ре', 'во'],
-        "стол": ['стол'],
-        "учитель": ['у', 'чи', 'тель'],
-        "наука": ['на', 'у', 'ка'],
-        "пример": ['при', 'мер'],
-        "встреча": ['встре', 'ча'],
-        "пст": ['пст']
-    }
-    
-    if word in specific_words:
-        return specific_words[word]
-    
-    # Общий алгоритм для других слов
-    vowel_indices = [i for i, char in enumerate(word) if char in RU_VOWELS]
+    specific = _SPECIFIC_WORDS.get(word)
+    if specific is not None:
+        return list(specific)
     
-    # Если нет гласных, возвращаем всё слово как один слог
-    if not vowel_indices:
-        return [word]
+    # Граница после первой гласной
+    vowel_idx = vowel_indices[0]
+    consonants_between = vowel_indices[1] - vowel_idx - 1
     
-    # Особенность русского языка - согласная после первой гласной обычно относится к первому слогу
-    syllables = []
-    start_idx = 0
+    if consonants_between <= 0:
+        end_idx = vowel_idx + 1
+    elif consonants_between == 1 or word[vowel_idx + 1:vowel_idx + 3] not in _INDIVISIBLE_CLUSTERS:
+        end_idx = vowel_idx + 2
+    else:
+        end_idx = vowel_idx + 1
     
-    for i in range(len(vowel_indices)):
+    syllables = [word[:end_idx]]
+    start_idx = end_idx
+    
+    # Границы после последующих гласных: половина согласных остается в слоге
+    for i in range(1, len(vowel_indices) - 1):
         vowel_idx = vowel_indices[i]
-        
-        # Последняя гласная в слове - все оставшиеся буквы в один слог
-        if i == len(vowel_indices) - 1:
-            syllables.append(word[start_idx:])
-            break
-        
-        next_vowel_idx = vowel_indices[i + 1]
-        
-        # Согласные между гласными
-        consonants_between = next_vowel_idx - vowel_idx - 1
-        
-        if i == 0:  # Для первой гласной в слове
-            # Если первая гласная не в начале слова и за ней идет одна согласная,
-            # то эта согласная обычно относится к первому слогу
-            if vowel_idx > 0 and consonants_between == 1:
-                end_idx = vowel_idx + 2  # гласная + согласная
-            elif consonants_between <= 0:  # гласная в начале или за ней сразу другая гласная
-                end_idx = vowel_idx + 1  # только гласная
-            else:  # несколько согласных после первой гласной
-                # Для "яблоко" -> "яб-ло-ко", проверка на шаблоны "бл", "пр" и т.д.
-                consonants = word[vowel_idx+1:next_vowel_idx]
-                # По умолчанию оставляем первую согласную с первым слогом
-                end_idx = vowel_idx + 2
-                
-                # Проверяем неразделяемые сочетания
-                for pair in INDIVISIBLE_CONSONANT_PAIRS:
-                    if consonants.startswith(pair):
-                        end_idx = vowel_idx + 1  # граница перед согласными
-                        break
-        else:  # Для последующих гласных
-            if consonants_between == 0:  # гласная за гласной
-                end_idx = vowel_idx + 1
-            elif consonants_between == 1:  # одна согласная между гласными
-                end_idx = vowel_idx + 1  # согласная уходит в следующий слог
-            else:  # несколько согласных между гласными
-                # Для русского языка часто используются шаблоны "стн", "ств" и т.д.
-                # Для упрощения разделим согласные поровну
-                end_idx = vowel_idx + 1 + consonants_between // 2
-        
+        end_idx = vowel_idx + 1 + (vowel_indices[i + 1] - vowel_idx - 1) // 2
         syllables.append(word[start_idx:end_idx])
         start_idx = end_idx
     
-    return syllables
-    
-    # Формируем слоги на основе границ
-    syllables = []
-    start_idx = 0
-    
-    for boundary in syllable_boundaries:
-        syllables.append(word[start_idx:boundary])
-        start_idx = boundary
-    
-    # Добавляем последний слог
     syllables.append(word[start_idx:])
-    
     return syllables
 
 
@@ -198,6 +240,87 @@ def get_syllables_count(word: str) -> int:
     return len(split_into_syllables(word))
 
 
+class SyllableStatistics:
+    """
+    Накопитель статистики о слогах.
+    
+    Позволяет собирать статистику инкрементально, не храня список всех слов
+    и слогов в памяти (используется в потоковом режиме обработки).
+    
+    Attributes:
+        word_count: Количество учтенных слов
+        total_syllables: Общее количество слогов
+        syllables_distribution: Распределение слов по количеству слогов
+        syllable_frequency: Частота каждого слога
+    """
+    
+    def __init__(self):
+        """
+        Инициализирует пустую статистику.
+        """
+        self.word_count = 0
+        self.total_syllables = 0
+        self.syllables_distribution = {}
+        self.syllable_frequency = {}
+    
+    def add(self, syllables: Sequence[str], occurrences: int = 1) -> None:
+        """
+        Учитывает слово, уже разбитое на слоги.
+        
+        Args:
+            syllables: Слоги слова
+            occurrences: Количество вхождений слова
+        """
+        count = len(syllables)
+        
+        self.word_count += occurrences
+        self.total_syllables += count * occurrences
+        self.syllables_distribution[count] = self.syllables_distribution.get(count, 0) + occurrences
+        
+        for syllable in syllables:
+            if syllable:  # Пропускаем пустые слоги, если такие есть
+                self.syllable_frequency[syllable] = self.syllable_frequency.get(syllable, 0) + occurrences
+    
+    def add_word(self, word: str, occurrences: int = 1) -> None:
+        """
+        Разбивает слово на слоги (с кэшированием) и учитывает его.
+        
+        Args:
+            word: Слово
+            occurrences: Количество вхождений слова
+        """
+        self.add(split_cached(word), occurrences)
+    
+    def add_words(self, words: Iterable[str]) -> None:
+        """
+        Учитывает последовательность слов, разбивая каждую словоформу один раз.
+        
+        Args:
+            words: Слова
+        """
+        for word, occurrences in Counter(words).items():
+            self.add_word(word, occurrences)
+    
+    def result(self, top_n: int = 20) -> dict:
+        """
+        Возвращает накопленную статистику.
+        
+        Args:
+            top_n: Количество самых частых слогов в результате
+            
+        Returns:
+            Словарь со статистикой в формате get_syllabification_stats
+        """
+        # Сортируем слоги по частоте (от наиболее частых к менее частым)
+        most_common_syllables = sorted(self.syllable_frequency.items(), key=lambda x: x[1], reverse=True)
+        
+        return {
+            'average_syllables_per_word': self.total_syllables / self.word_count if self.word_count else 0,
+            'syllables_distribution': self.syllables_distribution,
+            'most_common_syllables': most_common_syllables[:top_n]
+        }
+
+
 def get_syllabification_stats(words: List[str]) -> dict:
     """
     Собирает статистику о слогах в словах.
@@ -211,32 +334,8 @@ def get_syllabification_stats(words: List[str]) -> dict:
         - распределение слов по количеству слогов
         - самые частые слоги
     """
-    total_syllables = 0
-    syllables_distribution = {}
-    all_syllables = []
-    
-    for word in words:
-        syllables = split_into_syllables(word)
-        count = len(syllables)
-        
-        total_syllables += count
-        syllables_distribution[count] = syllables_distribution.get(count, 0) + 1
-        all_syllables.extend(syllables)
-    
-    # Подсчет частоты каждого слога
-    syllable_frequency = {}
-    for syllable in all_syllables:
-        if syllable:  # Пропускаем пустые слоги, если такие есть
-            syllable_frequency[syllable] = syllable_frequency.get(syllable, 0) + 1
-    
-    # Сортируем слоги по частоте (от наиболее частых к менее частым)
-    most_common_syllables = sorted(syllable_frequency.items(), key=lambda x: x[1], reverse=True)
-    
-    # Формируем результат
-    result = {
-        'average_syllables_per_word': total_syllables / len(words) if words else 0,
-        'syllables_distribution': syllables_distribution,
-        'most_common_syllables': most_common_syllables[:20]  # Топ-20 самых частых слогов
-    }
+    stats = SyllableStatistics()
+    stats.add_words(words)
     
-    return result
+    # Топ-20 самых частых слогов
+    return stats.result(top_n=20)
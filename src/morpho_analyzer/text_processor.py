@@ -5,19 +5,226 @@
 нормализации и токенизации текста, включая поддержку PDF-файлов.
 """
 
+import codecs
 import re
 import os
-from typing import List, Optional, Tuple
-import PyPDF2  # Библиотека для работы с PDF-файлами
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
 
 
-def read_text_file(filename: str, encoding: str = 'utf-8') -> str:
+# Количество страниц в очереди на каждый процесс при параллельном извлечении
+# текста PDF: ограничивает память, но не дает процессам простаивать
+PDF_PAGES_PER_WORKER = 2
+
+# Кодировки текстовых файлов, проверяемые при автоматическом определении (по порядку)
+TEXT_ENCODINGS = ('utf-8', 'cp1251')
+
+# Размер начала файла, по которому определяется кодировка (в байтах)
+ENCODING_SAMPLE_SIZE = 64 * 1024
+
+# Размер блока при потоковом чтении текстового файла (в символах)
+TEXT_BLOCK_SIZE = 1 << 20
+
+# Документ PDF процесса-исполнителя (открывается один раз при запуске процесса)
+_worker_pdf: Optional[Any] = None
+
+
+def _open_pdf(filename: str) -> Any:
+    """
+    Открывает PDF-файл (PyPDF2 импортируется только при чтении PDF).
+    
+    Args:
+        filename: Путь к файлу
+        
+    Returns:
+        Объект PyPDF2.PdfReader
+    """
+    import PyPDF2  # Библиотека для работы с PDF-файлами
+    return PyPDF2.PdfReader(filename)
+
+
+def _init_pdf_worker(filename: str) -> None:
+    """
+    Инициализирует процесс-исполнитель: открывает PDF-файл.
+    
+    Args:
+        filename: Путь к файлу
+    """
+    global _worker_pdf
+    _worker_pdf = _open_pdf(filename)
+
+
+def _extract_pdf_page(page_num: int) -> str:
+    """
+    Извлекает текст одной страницы в процессе-исполнителе.
+    
+    Args:
+        page_num: Номер страницы (с нуля)
+        
+    Returns:
+        Текст страницы с переводом строки в конце
+    """
+    return _worker_pdf.pages[page_num].extract_text() + '\n'
+
+
+def iter_pdf_pages(filename: str, workers: int = 1) -> Iterator[str]:
+    """
+    Извлекает текст PDF-файла постранично, при workers > 1 - параллельно.
+    
+    По умолчанию страницы извлекаются в текущем процессе; пул процессов
+    создается только по явному запросу, так как вызывающий код может сам
+    выполняться в пуле. В пуле страницы распределяются между процессами,
+    каждый из которых открывает файл сам. Тексты выдаются в порядке страниц по мере готовности, поэтому
+    токенизация начинается после извлечения первой страницы, а в памяти
+    находятся лишь несколько страниц на процесс.
+    
+    Args:
+        filename: Путь к PDF-файлу
+        workers: Количество процессов (1 - в текущем процессе, по умолчанию;
+            0 - по числу ядер)
+        
+    Yields:
+        Текст очередной страницы с переводом строки в конце
+    """
+    reader = _open_pdf(filename)
+    page_count = len(reader.pages)
+    
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    workers = min(workers, page_count)
+    
+    if workers <= 1:
+        for page in reader.pages:
+            yield page.extract_text() + '\n'
+        return
+    
+    pages = iter(range(page_count))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_pdf_worker,
+                             initargs=(filename,)) as executor:
+        pending = deque(executor.submit(_extract_pdf_page, page_num)
+                        for page_num in islice(pages, workers * PDF_PAGES_PER_WORKER))
+        try:
+            while pending:
+                text = pending.popleft().result()
+                # Вместо выданной страницы ставим в очередь следующую
+                for page_num in islice(pages, 1):
+                    pending.append(executor.submit(_extract_pdf_page, page_num))
+                yield text
+        finally:
+            # Если чтение прервано, не ждем извлечения оставшихся страниц
+            for future in pending:
+                future.cancel()
+
+
+def detect_encoding(filename: str, sample_size: int = ENCODING_SAMPLE_SIZE,
+                    candidates: Iterable[str] = TEXT_ENCODINGS) -> str:
+    """
+    Определяет кодировку текстового файла по его началу.
+    
+    Читается только начало файла: выбирается первая кодировка из candidates,
+    в которой оно декодируется без ошибок (символ, разрезанный границей
+    образца, ошибкой не считается). UTF-8 проверяется первой, так как
+    текст в cp1251 почти никогда не является корректным UTF-8.
+    
+    Args:
+        filename: Путь к файлу
+        sample_size: Размер образца в байтах
+        candidates: Проверяемые кодировки
+        
+    Returns:
+        Название кодировки ('utf-8-sig' для UTF-8 с меткой порядка байтов)
+        
+    Raises:
+        ValueError: Если начало файла не декодируется ни в одной из кодировок
+    """
+    with open(filename, 'rb') as f:
+        sample = f.read(sample_size)
+    
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    
+    candidates = list(candidates)
+    for encoding in candidates:
+        try:
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+        except UnicodeDecodeError:
+            continue
+        return encoding
+    
+    raise ValueError(f"Не удалось определить кодировку файла {filename} "
+                     f"(проверены: {', '.join(candidates)})")
+
+
+def iter_text_blocks(filename: str, encoding: Optional[str] = None,
+                     block_size: int = TEXT_BLOCK_SIZE) -> Iterator[str]:
+    """
+    Читает текстовый файл блоками, не разрезая токены.
+    
+    Каждый блок заканчивается пробельным символом: хвост после последнего
+    пробела переносится в следующий блок. Память не зависит от размера файла
+    (блок без единого пробела выдается целиком).
+    
+    Args:
+        filename: Путь к файлу
+        encoding: Кодировка файла (None - определяется по началу файла)
+        block_size: Размер читаемого блока в символах
+        
+    Yields:
+        Очередной блок текста
+        
+    Raises:
+        UnicodeDecodeError: Если файл не может быть декодирован с кодировкой
+    """
+    if encoding is None:
+        encoding = detect_encoding(filename)
+    
+    tail = ''
+    with open(filename, 'r', encoding=encoding) as f:
+        try:
+            while True:
+                chunk = f.read(block_size)
+                if not chunk:
+                    break
+                
+                text = tail + chunk if tail else chunk
+                cut = len(text)
+                while cut and not text[cut - 1].isspace():
+                    cut -= 1
+                
+                if cut:
+                    tail = text[cut:]
+                    yield text[:cut]
+                else:
+                    tail = ''
+                    yield text
+        except UnicodeDecodeError as e:
+            raise _decode_error(e, filename, encoding)
+    
+    if tail:
+        yield tail
+
+
+def _decode_error(error: UnicodeDecodeError, filename: str, encoding: str) -> UnicodeDecodeError:
+    """
+    Создает ошибку декодирования с именем файла и кодировкой в сообщении.
+    """
+    return UnicodeDecodeError(error.encoding, error.object, error.start, error.end,
+                              f"файл {filename} не может быть декодирован с кодировкой {encoding} "
+                              f"({error.reason}); укажите кодировку явно")
+
+
+def read_text_file(filename: str, encoding: Optional[str] = None, workers: int = 1) -> str:
     """
     Читает текст из файла разных форматов (.txt, .pdf).
     
     Args:
         filename: Путь к файлу
-        encoding: Кодировка файла (по умолчанию utf-8, для текстовых файлов)
+        encoding: Кодировка текстового файла (None - определяется по началу
+            файла, см. detect_encoding)
+        workers: Количество процессов для извлечения текста PDF
+            (1 - в текущем процессе, по умолчанию; 0 - по числу ядер)
         
     Returns:
         Содержимое файла в виде строки
@@ -25,7 +232,7 @@ def read_text_file(filename: str, encoding: str = 'utf-8') -> str:
     Raises:
         FileNotFoundError: Если файл не найден
         UnicodeDecodeError: Если файл не может быть декодирован с указанной кодировкой
-        ValueError: Если формат файла не поддерживается
+        ValueError: Если формат файла не поддерживается или кодировка не определена
     """
     if not os.path.exists(filename):
         raise FileNotFoundError(f"Файл {filename} не найден")
@@ -36,30 +243,63 @@ def read_text_file(filename: str, encoding: str = 'utf-8') -> str:
     # Обработка PDF-файлов
     if file_extension == '.pdf':
         try:
-            text = ''
-            with open(filename, 'rb') as f:
-                pdf_reader = PyPDF2.PdfReader(f)
-                # Извлекаем текст из каждой страницы PDF
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    text += page.extract_text() + '\n'
-            return text
+            # Страницы собираются одним join, без повторного копирования текста
+            return ''.join(iter_pdf_pages(filename, workers))
         except Exception as e:
             raise ValueError(f"Ошибка при чтении PDF-файла {filename}: {str(e)}")
     
     # Обработка текстовых файлов
     elif file_extension == '.txt' or file_extension == '':
+        if encoding is None:
+            encoding = detect_encoding(filename)
         try:
             with open(filename, 'r', encoding=encoding) as f:
                 return f.read()
-        except UnicodeDecodeError:
-            raise UnicodeDecodeError(f"Файл {filename} не может быть декодирован с кодировкой {encoding}")
+        except UnicodeDecodeError as e:
+            raise _decode_error(e, filename, encoding)
     
     # Неподдерживаемый формат
     else:
         raise ValueError(f"Формат файла {file_extension} не поддерживается. Поддерживаемые форматы: .txt, .pdf")
 
 
+def iter_text_file(filename: str, encoding: Optional[str] = None, workers: int = 1,
+                   block_size: int = TEXT_BLOCK_SIZE) -> Iterator[str]:
+    """
+    Читает текст из файла по частям, не загружая весь файл в память.
+    
+    Текстовые файлы читаются блоками, разделенными по пробельным символам
+    (см. iter_text_blocks), PDF-файлы - постранично (см. iter_pdf_pages),
+    поэтому токены не пересекают границы частей.
+    
+    Args:
+        filename: Путь к файлу
+        encoding: Кодировка текстового файла (None - определяется по началу файла)
+        workers: Количество процессов для извлечения текста PDF
+            (1 - в текущем процессе, по умолчанию; 0 - по числу ядер)
+        block_size: Размер блока текстового файла в символах
+        
+    Yields:
+        Очередная часть текста
+        
+    Raises:
+        FileNotFoundError: Если файл не найден
+        UnicodeDecodeError: Если текстовый файл не может быть декодирован с кодировкой
+        ValueError: Если формат файла не поддерживается или кодировка не определена
+    """
+    if not os.path.exists(filename):
+        raise FileNotFoundError(f"Файл {filename} не найден")
+    
+    file_extension = os.path.splitext(filename)[1].lower()
+    
+    if file_extension == '.pdf':
+        yield from iter_pdf_pages(filename, workers)
+    elif file_extension == '.txt' or file_extension == '':
+        yield from iter_text_blocks(filename, encoding, block_size)
+    else:
+        raise ValueError(f"Формат файла {file_extension} не поддерживается. Поддерживаемые форматы: .txt, .pdf")
+
+
 def normalize_text(text: str, lowercase: bool = False) -> str:
     """
     Нормализует текст: удаляет лишние пробелы, опционально приводит к нижнему регистру.
@@ -84,6 +324,75 @@ def normalize_text(text: str, lowercase: bool = False) -> str:
     return text
 
 
+# Токены текста: слово (буквы) или число - группа word, знак препинания - группа punct.
+# Все прочие символы (пробелы, дефисы, кавычки "...") разделяют токены
+LETTERS_PATTERN = r'[^\W\d_]+'
+NUMBER_PATTERN = r'\d+'
+WORD_PATTERN = rf'{LETTERS_PATTERN}|{NUMBER_PATTERN}'
+PUNCTUATION_PATTERN = r'[.,!?;:«»()\[\]{}]'
+TOKEN_RE = re.compile(rf'(?P<word>{WORD_PATTERN})|(?P<punct>{PUNCTUATION_PATTERN})')
+# Тот же шаблон без групп: findall возвращает сами токены
+_FLAT_TOKEN_RE = re.compile(rf'{WORD_PATTERN}|{PUNCTUATION_PATTERN}')
+WORD_RE = re.compile(WORD_PATTERN)
+
+
+def iter_tokens(text: str, keep_punctuation: bool = True) -> Iterator[Tuple[str, Optional[str]]]:
+    """
+    Лениво разбивает текст на пары (токен, пунктуация) за один проход.
+    
+    Тип токена определяется группой, совпавшей в общем скомпилированном
+    шаблоне, без повторной проверки. Знак препинания присоединяется к
+    предыдущему слову, если у того еще нет знака, иначе выдается как ("", знак).
+    
+    Args:
+        text: Исходный текст
+        keep_punctuation: Сохранять ли знаки препинания
+        
+    Yields:
+        Кортежи (токен, пунктуация), как в результате tokenize
+    """
+    if not keep_punctuation:
+        for match in WORD_RE.finditer(text):
+            yield match.group(), None
+        return
+    
+    # Пары групп (слово, знак) каждого совпадения; слово ждет возможного
+    # знака препинания после себя
+    pending = None
+    for word, punct in map(re.Match.groups, TOKEN_RE.finditer(text)):
+        if word:
+            if pending is not None:
+                yield pending, None
+            pending = word
+        elif pending is not None:
+            yield pending, punct
+            pending = None
+        else:
+            yield "", punct
+    
+    if pending is not None:
+        yield pending, None
+
+
+def iter_token_stream(text: str, keep_punctuation: bool = True) -> Iterator[str]:
+    """
+    Лениво разбивает текст на плоскую последовательность токенов.
+    
+    Слова и знаки препинания выдаются в порядке следования в тексте,
+    как в результате tokenize_text, без промежуточных кортежей.
+    
+    Args:
+        text: Исходный текст
+        keep_punctuation: Сохранять ли знаки препинания
+        
+    Yields:
+        Очередной токен
+    """
+    pattern = _FLAT_TOKEN_RE if keep_punctuation else WORD_RE
+    for match in pattern.finditer(text):
+        yield match.group()
+
+
 def tokenize(text: str, keep_punctuation: bool = True) -> List[Tuple[str, Optional[str]]]:
     """
     Разбивает текст на токены (слова и знаки препинания).
@@ -96,40 +405,9 @@ def tokenize(text: str, keep_punctuation: bool = True) -> List[Tuple[str, Option
         Список кортежей (токен, пунктуация), где пунктуация может быть None, 
         если токен не сопровождается знаком препинания или keep_punctuation=False
     """
-    # Регулярное выражение для разделения текста на слова и знаки препинания
-    tokens = []
-    
-    if keep_punctuation:
-        # Паттерн для выделения слов и знаков препинания
-        pattern = r'([^\W\d_]+|\d+|[.,!?;:«»()\[\]{}])'
-        matches = re.finditer(pattern, text)
-        
-        last_end = 0
-        for match in matches:
-            start, end = match.span()
-            token = match.group(0)
-            
-            # Пропускаем пробелы
-            if token.isspace():
-                continue
-                
-            # Проверяем, является ли токен знаком препинания
-            if re.match(r'[.,!?;:«»()\[\]{}]', token):
-                # Если предыдущий токен был словом, добавляем знак препинания к нему
-                if tokens and tokens[-1][1] is None:
-                    tokens[-1] = (tokens[-1][0], token)
-                else:
-                    tokens.append(("", token))
-            else:
-                tokens.append((token, None))
-                
-            last_end = end
-    else:
-        # Простая токенизация без сохранения знаков препинания
-        words = re.findall(r'[^\W\d_]+|\d+', text)
-        tokens = [(word, None) for word in words]
-    
-    return tokens
+    if not keep_punctuation:
+        return [(word, None) for word in WORD_RE.findall(text)]
+    return list(iter_tokens(text, keep_punctuation))
 
 
 def clean_word(word: str) -> str:
@@ -181,11 +459,20 @@ def tokenize_text(text: str, keep_punctuation: bool = True) -> List[str]:
     Returns:
         Список токенов
     """
-    tokens_with_punct = tokenize(text, keep_punctuation)
-    result = []
-    for token, punct in tokens_with_punct:
-        if token:  # Если есть слово, добавляем его
-            result.append(token)
-        if punct and keep_punctuation:  # Если есть пунктуация и её нужно сохранять
-            result.append(punct)
-    return result
+    # Плоский список токенов - все совпадения шаблона по порядку
+    return (_FLAT_TOKEN_RE if keep_punctuation else WORD_RE).findall(text)
+
+
+def iter_tokenize_text(blocks: Iterable[str], keep_punctuation: bool = True) -> Iterator[str]:
+    """
+    Потоково токенизирует текст, поступающий частями.
+    
+    Args:
+        blocks: Части текста (например, результат iter_text_file)
+        keep_punctuation: Сохранять ли знаки препинания
+        
+    Yields:
+        Очередной токен
+    """
+    for block in blocks:
+        yield from tokenize_text(block, keep_punctuation)
@@ -0,0 +1,232 @@
+"""
+Модуль потока токенов со смещениями в исходном тексте.
+
+TokenStream хранит не строки токенов, а ссылку на исходный текст и три
+параллельных массива (array): начало и конец каждого токена в тексте и код
+его типа (слово, число, знак препинания). Строка токена создается только при
+обращении к нему, поэтому последующие этапы могут работать со смещениями:
+выделять предложения, указывать место слова в тексте и строить конкорданс
+без повторной токенизации.
+
+Токены совпадают с результатом text_processor.tokenize_text.
+"""
+
+import re
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .text_processor import TOKEN_RE, WORD_RE
+
+
+# Коды типов токенов
+TOKEN_WORD = 1
+TOKEN_NUMBER = 2
+TOKEN_PUNCT = 3
+
+# Знаки препинания, завершающие предложение
+SENTENCE_END = frozenset('.!?')
+
+# Номер группы punct в шаблоне text_processor.TOKEN_RE
+_PUNCT_GROUP = TOKEN_RE.groupindex['punct']
+
+
+class TokenStream:
+    """
+    Токены текста в виде смещений в исходной строке.
+
+    Attributes:
+        text: Исходный текст (не копируется)
+        starts: Начала токенов в тексте (array 'q')
+        ends: Концы токенов в тексте, не включительно (array 'q')
+        types: Коды типов токенов: TOKEN_WORD, TOKEN_NUMBER, TOKEN_PUNCT (array 'B')
+    """
+
+    def __init__(self, text: str, keep_punctuation: bool = True):
+        """
+        Разбивает текст на токены за один проход шаблоном text_processor
+        (TOKEN_RE или WORD_RE), поэтому токены совпадают с tokenize_text.
+
+        Args:
+            text: Исходный текст
+            keep_punctuation: Сохранять ли знаки препинания
+        """
+        self.text = text
+        self.starts = array('q')
+        self.ends = array('q')
+        self.types = array('B')
+        self._index: Optional[Dict[str, array]] = None
+
+        add_start = self.starts.append
+        add_end = self.ends.append
+        add_type = self.types.append
+        for match in (TOKEN_RE if keep_punctuation else WORD_RE).finditer(text):
+            start, end = match.span()
+            add_start(start)
+            add_end(end)
+            # Слово из букв не содержит цифр (\d), а число состоит только из них,
+            # поэтому число распознается по первому символу
+            if match.lastindex == _PUNCT_GROUP:
+                add_type(TOKEN_PUNCT)
+            elif text[start].isdecimal():
+                add_type(TOKEN_NUMBER)
+            else:
+                add_type(TOKEN_WORD)
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество токенов.
+        """
+        return len(self.starts)
+
+    def __getitem__(self, index: int) -> str:
+        """
+        Возвращает строку токена (срез исходного текста).
+
+        Args:
+            index: Номер токена
+
+        Returns:
+            Токен
+        """
+        return self.text[self.starts[index]:self.ends[index]]
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Лениво выдает строки токенов по порядку.
+        """
+        text = self.text
+        for start, end in zip(self.starts, self.ends):
+            yield text[start:end]
+
+    def span(self, index: int) -> Tuple[int, int]:
+        """
+        Возвращает положение токена в тексте.
+
+        Args:
+            index: Номер токена
+
+        Returns:
+            Пара (начало, конец) в символах исходного текста
+        """
+        return self.starts[index], self.ends[index]
+
+    def iter_words(self) -> Iterator[Tuple[int, str]]:
+        """
+        Лениво выдает слова (токены из букв) с их номерами.
+
+        Yields:
+            Пары (номер токена, слово)
+        """
+        text = self.text
+        for index, (start, end, token_type) in enumerate(zip(self.starts, self.ends, self.types)):
+            if token_type == TOKEN_WORD:
+                yield index, text[start:end]
+
+    def is_sentence_end(self, index: int) -> bool:
+        """
+        Проверяет, завершает ли токен предложение (знаки . ! ?).
+
+        Args:
+            index: Номер токена
+
+        Returns:
+            True, если токен - знак конца предложения
+        """
+        return self.types[index] == TOKEN_PUNCT and self.text[self.starts[index]] in SENTENCE_END
+
+    def sentences(self) -> List[Tuple[int, int]]:
+        """
+        Разбивает токены на предложения по знакам конца предложения.
+
+        Подряд идущие знаки конца ("?!", "...") относятся к одному предложению.
+        Токены после последнего знака образуют последнее предложение.
+
+        Returns:
+            Список пар (номер первого токена, номер за последним токеном),
+            знаки конца входят в предложение
+        """
+        result = []
+        start = 0
+        count = len(self)
+        index = 0
+
+        while index < count:
+            if self.is_sentence_end(index):
+                index += 1
+                while index < count and self.is_sentence_end(index):
+                    index += 1
+                result.append((start, index))
+                start = index
+            else:
+                index += 1
+
+        if start < count:
+            result.append((start, count))
+        return result
+
+    def text_span(self, first: int, last: int) -> str:
+        """
+        Возвращает фрагмент исходного текста, покрывающий токены [first, last).
+
+        Args:
+            first: Номер первого токена
+            last: Номер за последним токеном
+
+        Returns:
+            Фрагмент текста от начала первого до конца последнего токена
+        """
+        if first >= last:
+            return ''
+        return self.text[self.starts[first]:self.ends[last - 1]]
+
+    def index(self) -> Dict[str, array]:
+        """
+        Возвращает номера токенов для каждого слова (в нижнем регистре).
+
+        Указатель строится при первом вызове и сохраняется.
+
+        Returns:
+            Словарь: слово -> номера токенов (array 'q') в порядке следования
+        """
+        if self._index is None:
+            index: Dict[str, array] = {}
+            for position, word in self.iter_words():
+                word = word.lower()
+                positions = index.get(word)
+                if positions is None:
+                    positions = index[word] = array('q')
+                positions.append(position)
+            self._index = index
+        return self._index
+
+    def concordance(self, word: str, width: int = 40,
+                    limit: Optional[int] = None) -> List[Tuple[str, str, str]]:
+        """
+        Строит конкорданс: вхождения слова с контекстом слева и справа.
+
+        Args:
+            word: Слово (регистр не учитывается)
+            width: Количество символов контекста с каждой стороны
+            limit: Максимальное количество вхождений (None - все)
+
+        Returns:
+            Список троек (контекст слева, вхождение, контекст справа);
+            переводы строк в контексте заменены пробелами
+        """
+        text = self.text
+        result = []
+
+        for position in self.index().get(word.lower(), ())[:limit]:
+            start, end = self.starts[position], self.ends[position]
+            left = text[max(0, start - width):start]
+            right = text[end:end + width]
+            result.append((_one_line(left), text[start:end], _one_line(right)))
+
+        return result
+
+
+def _one_line(text: str) -> str:
+    """
+    Заменяет переводы строк и табуляции пробелами.
+    """
+    return re.sub(r'\s', ' ', text)
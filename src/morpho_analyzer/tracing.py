@@ -0,0 +1,102 @@
+"""
+Модуль трассировки решений при снятии омонимии.
+
+MorphologicalAnalyzer.resolve_homonymy формирует структурированное событие
+для каждого вхождения омонима только тогда, когда задан приемник трассировки
+(параметр trace) или включен уровень DEBUG у логгера morpho_analyzer.morphology.
+Без приемника трассировка не стоит ничего, кроме одной проверки.
+
+Событие - словарь:
+    word: очищенное слово
+    context: очищенные слова контекста
+    candidates: варианты разбора [{'index', 'sense', 'score', 'markers'}]
+    winner: номер выбранного варианта
+    resolved_by: 'context' - выбран по маркерам, 'default' - вариант по умолчанию
+
+Приемник - любая функция, принимающая событие.
+"""
+
+import json
+import random
+from typing import Any, Callable, Dict, Optional
+
+
+# Тип приемника событий трассировки
+TraceSink = Callable[[Dict[str, Any]], None]
+
+
+class SampledSink:
+    """
+    Приемник, передающий дальше только случайную долю событий.
+
+    Attributes:
+        sink: Приемник, получающий отобранные события
+        rate: Доля передаваемых событий (от 0 до 1)
+        seen: Количество полученных событий
+        passed: Количество переданных событий
+    """
+
+    def __init__(self, sink: TraceSink, rate: float, seed: Optional[int] = None):
+        """
+        Инициализирует выборку.
+
+        Args:
+            sink: Приемник отобранных событий
+            rate: Доля передаваемых событий (от 0 до 1)
+            seed: Начальное значение генератора случайных чисел
+
+        Raises:
+            ValueError: Если доля вне диапазона [0, 1]
+        """
+        if not 0 <= rate <= 1:
+            raise ValueError("Доля событий должна быть в диапазоне от 0 до 1")
+
+        self.sink = sink
+        self.rate = rate
+        self.seen = 0
+        self.passed = 0
+        self._random = random.Random(seed)
+
+    def __call__(self, event: Dict[str, Any]) -> None:
+        self.seen += 1
+        if self.rate >= 1 or self._random.random() < self.rate:
+            self.passed += 1
+            self.sink(event)
+
+
+class JsonLinesTraceSink:
+    """
+    Приемник, записывающий события в файл JSON Lines (одно событие на строку).
+
+    Attributes:
+        path: Путь к файлу
+        count: Количество записанных событий
+    """
+
+    def __init__(self, path: str):
+        """
+        Открывает файл для записи.
+
+        Args:
+            path: Путь к файлу
+        """
+        self.path = path
+        self.count = 0
+        self._file = open(path, 'w', encoding='utf-8')
+
+    def __call__(self, event: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(event, ensure_ascii=False))
+        self._file.write('\n')
+        self.count += 1
+
+    def close(self) -> None:
+        """
+        Закрывает файл.
+        """
+        self._file.close()
+
+    def __enter__(self) -> 'JsonLinesTraceSink':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -5,21 +5,36 @@
 префиксного дерева (trie) с использованием слогов в качестве ключей.
 """
 
-from typing import Dict, List, Any, Optional, Tuple, Set
+import heapq
+from itertools import count as sequence, islice
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Any, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from .trie_binary import MappedPrefixTree
 
 
 class TrieNode:
     """
     Класс, представляющий узел префиксного дерева.
     
+    Данные слова хранятся без повторов: одинаковые результаты анализа
+    (см. payload_key) сохраняются один раз, а количество их повторных вставок
+    и, если заданы, позиции вхождений - в параллельных списках.
+    
     Attributes:
         children: Словарь дочерних узлов, где ключ - слог, значение - узел
         is_end_of_word: Флаг, указывающий, является ли узел концом слова
-        word_data: Данные, сохраненные для слова, если узел является концом слова
+        word_data: Уникальные данные, сохраненные для слова, если узел является концом слова
+        word_counts: Количество вставок каждого элемента word_data (недостающие равны 1)
+        word_positions: Позиции вхождений каждого элемента word_data
         syllable: Слог, соответствующий данному узлу
         count: Счетчик вхождений данного узла
     """
     
+    # Узлов в дереве очень много, поэтому не создаем __dict__ для каждого
+    __slots__ = ('children', 'is_end_of_word', 'word_data', 'word_counts', 'word_positions',
+                 'syllable', 'count')
+    
     def __init__(self, syllable: str = ""):
         """
         Инициализирует узел префиксного дерева.
@@ -30,6 +45,10 @@ class TrieNode:
         self.children: Dict[str, TrieNode] = {}
         self.is_end_of_word: bool = False
         self.word_data: List[Dict[str, Any]] = []
+        # Списки счетчиков и позиций создаются только при повторной вставке
+        # данных и при передаче позиции соответственно
+        self.word_counts: Sequence[int] = ()
+        self.word_positions: Sequence[List[int]] = ()
         self.syllable: str = syllable
         self.count: int = 0
     
@@ -54,13 +73,276 @@ class TrieNode:
         return self.__str__()
 
 
+def payload_key(word_data: Dict[str, Any]) -> Tuple[Any, ...]:
+    """
+    Возвращает ключ, по которому совпадающие данные слова хранятся один раз.
+    
+    Args:
+        word_data: Данные о слове (результат морфологического анализа)
+        
+    Returns:
+        Кортеж (слово, лемма, часть речи, граммемы, значение омонима)
+    """
+    tags = word_data.get('tags')
+    if isinstance(tags, dict):
+        tags = tuple(sorted(tags.items()))
+    return (word_data.get('word'), word_data.get('lemma'), word_data.get('pos'),
+            tags, word_data.get('sense'))
+
+
+def find_payload(payloads: List[Dict[str, Any]], word_data: Dict[str, Any]) -> int:
+    """
+    Ищет среди данных конца слова такие же данные (по payload_key).
+    
+    Уникальных разборов у одной словоформы единицы, поэтому достаточно
+    линейного поиска.
+    
+    Args:
+        payloads: Уникальные данные слова
+        word_data: Искомые данные
+        
+    Returns:
+        Номер данных в списке payloads или -1, если таких данных нет
+    """
+    key = None
+    for i, existing in enumerate(payloads):
+        if existing is word_data:
+            return i
+        if key is None:
+            key = payload_key(word_data)
+        if payload_key(existing) == key:
+            return i
+    return -1
+
+
+def add_count(counts: List[int], index: int, amount: int) -> None:
+    """
+    Увеличивает количество вставок данных слова с номером index.
+    
+    Список счетчиков создается только при первой повторной вставке и может
+    быть короче списка данных: недостающие счетчики равны 1.
+    
+    Args:
+        counts: Количество вставок каждого элемента данных слова
+        index: Номер данных
+        amount: Количество добавляемых вставок
+    """
+    if len(counts) <= index:
+        counts.extend([1] * (index + 1 - len(counts)))
+    counts[index] += amount
+
+
+def add_position(positions: List[List[int]], index: int, position: int) -> None:
+    """
+    Добавляет позицию вхождения для данных слова с номером index.
+    
+    Списки позиций создаются только для слов, у которых позиции сохранялись,
+    и выравниваются по списку данных при первой записи.
+    
+    Args:
+        positions: Позиции вхождений каждого элемента данных слова
+        index: Номер данных
+        position: Позиция вхождения в тексте
+    """
+    if len(positions) <= index:
+        positions.extend([] for _ in range(index + 1 - len(positions)))
+    positions[index].append(position)
+
+
+def payload_occurrences(payloads: List[Dict[str, Any]], counts: Sequence[int],
+                        positions: Sequence[List[int]]) -> List[Tuple[Dict[str, Any], int, List[int]]]:
+    """
+    Объединяет параллельные списки конца слова в кортежи.
+    
+    Args:
+        payloads: Уникальные данные слова
+        counts: Количество вставок каждого элемента (может быть короче payloads)
+        positions: Позиции вхождений (может быть короче payloads)
+        
+    Returns:
+        Список кортежей (данные о слове, количество вставок, позиции вхождений)
+    """
+    return [(data, counts[i] if i < len(counts) else 1,
+             list(positions[i]) if i < len(positions) else [])
+            for i, data in enumerate(payloads)]
+
+def most_common_syllables(syllable_frequency: Dict[str, int], top_n: int = 20) -> List[Tuple[str, int]]:
+    """
+    Выбирает самые частые слоги для статистики дерева.
+    
+    Частичная сортировка кучей; при равной частоте слоги упорядочены по
+    алфавиту, чтобы результат не зависел от порядка вставки и реализации дерева
+    (PrefixTree хранит детей в порядке вставки, CompactPrefixTree - по
+    идентификатору слога). Прежний полный пересчет упорядочивал равные
+    частоты по первому появлению при обходе дерева.
+    
+    Args:
+        syllable_frequency: Суммарная частота каждого слога
+        top_n: Количество слогов в результате
+        
+    Returns:
+        Список пар (слог, частота) по убыванию частоты
+    """
+    return heapq.nsmallest(top_n, syllable_frequency.items(), key=lambda item: (-item[1], item[0]))
+
+
+def _trie_node_children(node: TrieNode) -> Iterable[Tuple[str, TrieNode]]:
+    """
+    Возвращает пары (слог, дочерний узел) для узла TrieNode.
+    
+    Args:
+        node: Узел дерева
+        
+    Returns:
+        Пары (слог, дочерний узел) в порядке вставки
+    """
+    return node.children.items()
+
+
+def walk(root: Any,
+         children: Optional[Callable[[Any], Iterable[Tuple[str, Any]]]] = None,
+         max_depth: Optional[int] = None,
+         pre_order: bool = True,
+         post_order: bool = False,
+         prefix: Optional[List[str]] = None) -> Iterator[Tuple[Any, List[str], int, bool]]:
+    """
+    Итеративно обходит дерево в глубину с явным стеком (без рекурсии).
+    
+    Это общее ядро для всех обходов дерева: сбора слов, статистики,
+    сериализации и визуализации. Глубина дерева ограничена только памятью.
+    Дети обходятся в том порядке, в котором их возвращает функция children.
+    
+    Args:
+        root: Начальный узел (глубина 0)
+        children: Функция, возвращающая пары (ключ, дочерний узел);
+            по умолчанию - дети узла TrieNode
+        max_depth: Максимальная глубина посещаемых узлов (None - без ограничения)
+        pre_order: Выдавать узел при входе в него
+        post_order: Выдавать узел после обхода всех его детей
+        prefix: Ключи от корня всего дерева до начального узла
+        
+    Yields:
+        Кортежи (узел, путь, глубина, выход), где путь - список ключей от корня
+        (общий список, действителен только до следующего шага; при сохранении
+        его нужно копировать), выход - True для события post-order
+    """
+    get_children = children or _trie_node_children
+    path = list(prefix) if prefix else []
+    base = len(path)
+    
+    # Элементы стека: (узел, ключ, глубина, дети уже обойдены)
+    stack = [(root, None, 0, False)]
+    
+    while stack:
+        node, key, depth, leaving = stack.pop()
+        
+        if leaving:
+            del path[base + depth:]
+            yield node, path, depth, True
+            continue
+        
+        if depth:
+            del path[base + depth - 1:]
+            path.append(key)
+        
+        if pre_order:
+            yield node, path, depth, False
+        
+        if post_order:
+            stack.append((node, key, depth, True))
+        
+        if max_depth is None or depth < max_depth:
+            child_depth = depth + 1
+            # Кладем детей в обратном порядке, чтобы обходить их в прямом
+            stack.extend([(child, child_key, child_depth, False)
+                          for child_key, child in reversed(list(get_children(node)))])
+
+
+def traverse(root: Any,
+             pre_visit: Optional[Callable[[Any, List[str], int], None]] = None,
+             post_visit: Optional[Callable[[Any, List[str], int], None]] = None,
+             children: Optional[Callable[[Any], Iterable[Tuple[str, Any]]]] = None,
+             max_depth: Optional[int] = None,
+             prefix: Optional[List[str]] = None) -> None:
+    """
+    Обходит дерево, вызывая функции-посетители при входе в узел и выходе из него.
+    
+    Args:
+        root: Начальный узел (глубина 0)
+        pre_visit: Функция (узел, путь, глубина), вызываемая при входе в узел
+        post_visit: Функция (узел, путь, глубина), вызываемая после обхода детей
+        children: Функция, возвращающая пары (ключ, дочерний узел)
+        max_depth: Максимальная глубина посещаемых узлов (None - без ограничения)
+        prefix: Ключи от корня всего дерева до начального узла
+    """
+    for node, path, depth, leaving in walk(root, children, max_depth,
+                                           pre_order=pre_visit is not None,
+                                           post_order=post_visit is not None,
+                                           prefix=prefix):
+        if leaving:
+            post_visit(node, path, depth)
+        else:
+            pre_visit(node, path, depth)
+
+
+def iter_by_frequency(start: Any, prefix: List[str],
+                      children: Callable[[Any], Iterable[Tuple[str, Any]]],
+                      count: Callable[[Any], int],
+                      word_data: Callable[[Any], Optional[List[Dict[str, Any]]]]) -> Iterator[Tuple[List[str], List[Dict[str, Any]]]]:
+    """
+    Лениво обходит слова поддерева в порядке убывания частоты.
+    
+    Частота слова - количество его вставок: счетчик конечного узла минус
+    сумма счетчиков его детей. Счетчик узла не меньше частоты любого слова
+    в его поддереве, поэтому обход "лучший - первым" с кучей выдает слова
+    в порядке убывания частоты, раскрывая только необходимую часть дерева.
+    При равной частоте порядок соответствует порядку обхода детей.
+    
+    Args:
+        start: Начальный узел
+        prefix: Ключи от корня дерева до начального узла
+        children: Функция, возвращающая пары (слог, дочерний узел)
+        count: Функция, возвращающая счетчик узла
+        word_data: Функция, возвращающая данные о слове для конца слова, иначе None
+        
+    Yields:
+        Пары (слоги слова, данные о слове)
+    """
+    order = sequence()
+    # Элементы кучи: (-приоритет, вид, порядковый номер, узел или данные, путь);
+    # вид 0 - готовое слово с данными, 1 - узел для раскрытия
+    heap = [(-count(start), 1, next(order), start, tuple(prefix))]
+    
+    while heap:
+        _, kind, _, node, path = heapq.heappop(heap)
+        
+        if kind == 0:
+            yield list(path), node
+            continue
+        
+        children_total = 0
+        for syllable, child in children(node):
+            child_count = count(child)
+            children_total += child_count
+            heapq.heappush(heap, (-child_count, 1, next(order), child, path + (syllable,)))
+        
+        data = word_data(node)
+        if data is not None:
+            heapq.heappush(heap, (children_total - count(node), 0, next(order), data, path))
+
+
 class PrefixTree:
     """
     Класс, реализующий префиксное дерево для хранения информации о словах.
     
+    Статистика дерева (количество узлов, распределение по уровням,
+    разветвленность и частоты слогов) обновляется при каждой вставке,
+    поэтому get_statistics не обходит дерево.
+    
     Attributes:
         root: Корневой узел дерева
         word_count: Количество слов в дереве
+        node_count: Количество узлов в дереве (включая корень)
     """
     
     def __init__(self):
@@ -69,26 +351,66 @@ class PrefixTree:
         """
         self.root = TrieNode()
         self.word_count = 0
+        self._reset_statistics()
     
-    def insert(self, syllables: List[str], word_data: Dict[str, Any]) -> None:
+    def _reset_statistics(self) -> None:
+        """
+        Сбрасывает счетчики статистики к состоянию дерева из одного корня.
+        """
+        self.node_count = 1
+        # Количество узлов на каждом уровне (глубине)
+        self._level_distribution: Dict[int, int] = {0: 1}
+        # Количество узлов, у которых есть дочерние узлы
+        self._non_leaf_count = 0
+        # Суммарная частота каждого слога по всем узлам
+        self._syllable_frequency: Dict[str, int] = {}
+    
+    def insert(self, syllables: List[str], word_data: Optional[Dict[str, Any]] = None,
+               position: Optional[int] = None) -> None:
         """
         Вставляет слово в префиксное дерево.
         
         Args:
             syllables: Список слогов слова
-            word_data: Данные о слове (результат морфологического анализа)
+            word_data: Данные о слове (результат морфологического анализа).
+                Если None, учитываются только счетчики узлов (данные не сохраняются).
+                Совпадающие данные (см. payload_key) хранятся один раз со счетчиком
+            position: Позиция вхождения слова в тексте (None - не сохраняется)
         """
         node = self.root
-        
-        for syllable in syllables:
-            if syllable not in node.children:
-                node.children[syllable] = TrieNode(syllable)
+        level_distribution = self._level_distribution
+        syllable_frequency = self._syllable_frequency
+        
+        for level, syllable in enumerate(syllables, 1):
+            child = node.children.get(syllable)
+            if child is None:
+                # Новый узел: обновляем счетчики структуры дерева
+                if not node.children:
+                    self._non_leaf_count += 1
+                child = node.children[syllable] = TrieNode(syllable)
+                self.node_count += 1
+                level_distribution[level] = level_distribution.get(level, 0) + 1
             
-            node = node.children[syllable]
+            node = child
             node.count += 1
+            
+            if syllable:
+                syllable_frequency[syllable] = syllable_frequency.get(syllable, 0) + 1
         
         node.is_end_of_word = True
-        node.word_data.append(word_data)
+        if word_data is not None:
+            index = find_payload(node.word_data, word_data)
+            if index < 0:
+                index = len(node.word_data)
+                node.word_data.append(word_data)
+            else:
+                if not node.word_counts:
+                    node.word_counts = []
+                add_count(node.word_counts, index, 1)
+            if position is not None:
+                if not node.word_positions:
+                    node.word_positions = []
+                add_position(node.word_positions, index, position)
         self.word_count += 1
     
     def search(self, syllables: List[str]) -> Optional[List[Dict[str, Any]]]:
@@ -99,65 +421,96 @@ class PrefixTree:
             syllables: Список слогов слова
             
         Returns:
-            Данные о слове, если слово найдено, иначе None
+            Уникальные данные о слове, если слово найдено, иначе None
+        """
+        node = self._find_end(syllables)
+        return None if node is None else node.word_data
+    
+    def search_occurrences(self, syllables: List[str]) -> Optional[List[Tuple[Dict[str, Any], int, List[int]]]]:
+        """
+        Ищет слово и возвращает его данные вместе с частотой и позициями.
+        
+        Args:
+            syllables: Список слогов слова
+            
+        Returns:
+            Список кортежей (данные о слове, количество вставок, позиции вхождений),
+            если слово найдено, иначе None
+        """
+        node = self._find_end(syllables)
+        if node is None:
+            return None
+        return payload_occurrences(node.word_data, node.word_counts, node.word_positions)
+    
+    def _find_end(self, syllables: List[str]) -> Optional[TrieNode]:
+        """
+        Находит узел конца слова.
+        
+        Args:
+            syllables: Список слогов слова
+            
+        Returns:
+            Узел, если слово есть в дереве, иначе None
         """
         node = self.root
         
         for syllable in syllables:
-            if syllable not in node.children:
+            node = node.children.get(syllable)
+            if node is None:
                 return None
-            
-            node = node.children[syllable]
         
-        if node.is_end_of_word:
-            return node.word_data
-        
-        return None
+        return node if node.is_end_of_word else None
     
-    def starts_with_prefix(self, prefix_syllables: List[str]) -> List[Tuple[List[str], List[Dict[str, Any]]]]:
+    def iter_words(self, prefix_syllables: Optional[List[str]] = None,
+                   limit: Optional[int] = None,
+                   by_frequency: bool = False) -> Iterator[Tuple[List[str], List[Dict[str, Any]]]]:
         """
-        Находит все слова, начинающиеся с заданного префикса.
+        Лениво обходит слова, начинающиеся с заданного префикса.
+        
+        Слова выдаются по одному, поэтому обход можно прервать в любой момент,
+        не собирая все поддерево (например, для автодополнения).
         
         Args:
-            prefix_syllables: Список слогов префикса
+            prefix_syllables: Список слогов префикса (None - все слова)
+            limit: Максимальное количество слов (None - без ограничения)
+            by_frequency: Выдавать слова в порядке убывания частоты
+                (количества вставок) вместо порядка обхода дерева
             
-        Returns:
-            Список пар (слоги слова, данные о слове) для всех слов, 
-            начинающихся с заданного префикса
+        Yields:
+            Пары (слоги слова, данные о слове)
         """
-        result = []
+        prefix = list(prefix_syllables or [])
         node = self.root
         
         # Доходим до узла, соответствующего префиксу
-        for syllable in prefix_syllables:
-            if syllable not in node.children:
-                return []
-            
-            node = node.children[syllable]
-        
-        # Находим все слова, начинающиеся с данного префикса
-        self._collect_words_from_node(node, prefix_syllables, result)
-        
-        return result
+        for syllable in prefix:
+            node = node.children.get(syllable)
+            if node is None:
+                return
+        
+        if by_frequency:
+            words = iter_by_frequency(node, prefix, _trie_node_children,
+                                      lambda current: current.count,
+                                      lambda current: current.word_data if current.is_end_of_word else None)
+        else:
+            words = ((path.copy(), current.word_data)
+                     for current, path, _, _ in walk(node, prefix=prefix)
+                     if current.is_end_of_word)
+        
+        yield from islice(words, limit)
     
-    def _collect_words_from_node(self, node: TrieNode, 
-                                current_syllables: List[str], 
-                                result: List[Tuple[List[str], List[Dict[str, Any]]]]) -> None:
+    def starts_with_prefix(self, prefix_syllables: List[str]) -> List[Tuple[List[str], List[Dict[str, Any]]]]:
         """
-        Рекурсивно собирает все слова, начиная с заданного узла.
+        Находит все слова, начинающиеся с заданного префикса.
         
         Args:
-            node: Текущий узел
-            current_syllables: Список слогов от корня до текущего узла
-            result: Список для сохранения результатов
+            prefix_syllables: Список слогов префикса
+            
+        Returns:
+            Список пар (слоги слова, данные о слове) для всех слов, 
+            начинающихся с заданного префикса
         """
-        if node.is_end_of_word:
-            result.append((current_syllables.copy(), node.word_data))
-        
-        for syllable, child_node in node.children.items():
-            current_syllables.append(syllable)
-            self._collect_words_from_node(child_node, current_syllables, result)
-            current_syllables.pop()  # Возвращаем список к исходному состоянию после рекурсии
+        return list(self.iter_words(prefix_syllables))
     
     def get_all_words(self) -> List[Tuple[List[str], List[Dict[str, Any]]]]:
         """
@@ -166,14 +519,18 @@ class PrefixTree:
         Returns:
             Список пар (слоги слова, данные о слове) для всех слов в дереве
         """
-        result = []
-        self._collect_words_from_node(self.root, [], result)
-        return result
+        return list(self.iter_words())
     
-    def get_statistics(self) -> Dict[str, Any]:
+    def get_statistics(self, top_n: int = 20) -> Dict[str, Any]:
         """
         Возвращает статистику о дереве.
         
+        Счетчики поддерживаются при вставке, поэтому обход дерева не нужен:
+        стоимость определяется только выбором самых частых слогов.
+        
+        Args:
+            top_n: Количество наиболее частых слогов в результате
+        
         Returns:
             Словарь со статистикой:
             - количество слов
@@ -182,139 +539,218 @@ class PrefixTree:
             - средняя разветвленность
             - наиболее частые слоги
         """
-        # Словарь для хранения всех узлов и их уровней
-        node_levels: Dict[TrieNode, int] = {}
-        # Множество всех узлов
-        all_nodes: Set[TrieNode] = set()
-        # Словарь для подсчета частоты слогов
-        syllable_frequency: Dict[str, int] = {}
-        
-        # Рекурсивно обходим дерево и собираем информацию
-        self._collect_node_info(self.root, 0, node_levels, all_nodes, syllable_frequency)
-        
-        # Максимальный уровень (глубина дерева)
-        max_level = max(node_levels.values()) if node_levels else 0
-        
-        # Распределение узлов по уровням
-        level_distribution: Dict[int, int] = {}
-        for level in node_levels.values():
-            level_distribution[level] = level_distribution.get(level, 0) + 1
-        
-        # Средняя разветвленность (среднее число дочерних узлов у не конечных узлов)
-        non_leaf_nodes = [node for node in all_nodes if node.children]
-        avg_branching = sum(len(node.children) for node in non_leaf_nodes) / len(non_leaf_nodes) if non_leaf_nodes else 0
-        
-        # Наиболее частые слоги
-        most_common_syllables = sorted(syllable_frequency.items(), key=lambda x: x[1], reverse=True)
+        # Каждый узел, кроме корня, - ребенок ровно одного не конечного узла
+        avg_branching = (self.node_count - 1) / self._non_leaf_count if self._non_leaf_count else 0
         
         return {
             'word_count': self.word_count,
-            'node_count': len(all_nodes),
-            'max_depth': max_level,
-            'level_distribution': level_distribution,
+            'node_count': self.node_count,
+            'max_depth': max(self._level_distribution),
+            'level_distribution': dict(self._level_distribution),
             'avg_branching': avg_branching,
-            'most_common_syllables': most_common_syllables[:20]  # Топ-20 самых частых слогов
+            'most_common_syllables': most_common_syllables(self._syllable_frequency, top_n)
         }
     
-    def _collect_node_info(self, node: TrieNode, level: int, 
-                          node_levels: Dict[TrieNode, int], 
-                          all_nodes: Set[TrieNode], 
-                          syllable_frequency: Dict[str, int]) -> None:
+    def _rebuild_statistics(self) -> None:
         """
-        Рекурсивно обходит дерево и собирает информацию о узлах.
+        Пересчитывает счетчики статистики полным обходом дерева.
         
-        Args:
-            node: Текущий узел
-            level: Уровень узла в дереве (глубина)
-            node_levels: Словарь для сохранения уровней узлов
-            all_nodes: Множество для сохранения всех узлов
-            syllable_frequency: Словарь для подсчета частоты слогов
+        Используется после восстановления узлов, минуя insert (например,
+        при десериализации).
         """
-        # Добавляем узел в множество всех узлов
-        all_nodes.add(node)
-        
-        # Сохраняем уровень узла
-        node_levels[node] = level
-        
-        # Увеличиваем счетчик для слога
-        if node.syllable:
-            syllable_frequency[node.syllable] = syllable_frequency.get(node.syllable, 0) + node.count
-        
-        # Рекурсивно обходим дочерние узлы
-        for child_node in node.children.values():
-            self._collect_node_info(child_node, level + 1, node_levels, all_nodes, syllable_frequency)
+        self._reset_statistics()
+        self._level_distribution.clear()
+        level_distribution = self._level_distribution
+        syllable_frequency = self._syllable_frequency
+        node_count = non_leaf_count = 0
+        
+        for node, _, depth, _ in walk(self.root):
+            node_count += 1
+            level_distribution[depth] = level_distribution.get(depth, 0) + 1
+            if node.children:
+                non_leaf_count += 1
+            if node.syllable:
+                syllable_frequency[node.syllable] = syllable_frequency.get(node.syllable, 0) + node.count
+        
+        self.node_count = node_count
+        self._non_leaf_count = non_leaf_count
     
-    def serialize(self) -> Dict[str, Any]:
+    def serialize(self, analyses: Optional[Sequence[Dict[str, Any]]] = None) -> Dict[str, Any]:
         """
         Сериализует дерево в словарь.
         
+        Args:
+            analyses: Список результатов анализа, содержащий данные всех слов
+                дерева. Если задан, концы слов хранят номера результатов в этом
+                списке (word_refs) вместо копий данных (word_data)
+        
+        Концы слов также хранят количество вставок уникальных данных
+        (word_counts, если хотя бы одни данные вставлены повторно) и, если
+        они сохранялись, позиции вхождений (word_positions).
+        
         Returns:
             Словарь, представляющий дерево
+            
+        Raises:
+            ValueError: Если данные слова отсутствуют в списке analyses
         """
+        index = None
+        if analyses is not None:
+            # Данные слов в дереве - те же объекты, что и в списке результатов
+            index = {id(item): position for position, item in enumerate(analyses)}
+        
         return {
             'word_count': self.word_count,
-            'root': self._serialize_node(self.root)
+            'root': self._serialize_node(self.root, index)
         }
     
-    def _serialize_node(self, node: TrieNode) -> Dict[str, Any]:
+    def _serialize_node(self, node: TrieNode, index: Optional[Dict[int, int]] = None) -> Dict[str, Any]:
         """
-        Рекурсивно сериализует узел и его дочерние узлы.
+        Сериализует узел и его дочерние узлы (итеративный обход).
         
         Args:
             node: Узел для сериализации
+            index: Номера результатов анализа по id объекта (None - данные копируются)
             
         Returns:
             Словарь, представляющий узел
         """
-        result = {
-            'syllable': node.syllable,
-            'is_end_of_word': node.is_end_of_word,
-            'count': node.count,
-            'children': {}
-        }
-        
-        if node.is_end_of_word:
-            result['word_data'] = node.word_data
+        # Сериализованные узлы текущего пути, индекс - глубина
+        parents: List[Dict[str, Any]] = []
+        
+        for current, path, depth, _ in walk(node):
+            result = {
+                'syllable': current.syllable,
+                'is_end_of_word': current.is_end_of_word,
+                'count': current.count,
+                'children': {}
+            }
             
-        for syllable, child_node in node.children.items():
-            result['children'][syllable] = self._serialize_node(child_node)
+            if current.is_end_of_word:
+                if index is None:
+                    result['word_data'] = current.word_data
+                else:
+                    try:
+                        result['word_refs'] = [index[id(data)] for data in current.word_data]
+                    except KeyError:
+                        raise ValueError(f"Данные слова '{''.join(path)}' отсутствуют в списке результатов анализа")
+                if current.word_counts:
+                    result['word_counts'] = [count for _, count, _ in
+                                             payload_occurrences(current.word_data, current.word_counts, ())]
+                if current.word_positions:
+                    result['word_positions'] = [positions.copy() for positions in current.word_positions]
             
-        return result
+            del parents[depth:]
+            if depth:
+                parents[-1]['children'][path[-1]] = result
+            parents.append(result)
+        
+        return parents[0]
+    
+    def save_binary(self, path: str) -> None:
+        """
+        Сохраняет дерево в двоичный файл, который можно открыть через mmap.
+        
+        Args:
+            path: Путь к файлу
+        """
+        from .trie_binary import write_binary_trie
+        write_binary_trie(self, path)
+    
+    @staticmethod
+    def open_binary(path: str) -> 'MappedPrefixTree':
+        """
+        Открывает двоичный файл дерева через mmap без создания узлов TrieNode.
+        
+        Поиск и обход по префиксу выполняются непосредственно по отображенному
+        файлу, поэтому одно дерево можно разделять между процессами.
+        
+        Args:
+            path: Путь к файлу, созданному методом save_binary
+            
+        Returns:
+            Дерево только для чтения (MappedPrefixTree)
+        """
+        from .trie_binary import MappedPrefixTree
+        return MappedPrefixTree(path)
     
     @classmethod
-    def deserialize(cls, data: Dict[str, Any]) -> 'PrefixTree':
+    def deserialize(cls, data: Dict[str, Any],
+                    analyses: Optional[Sequence[Dict[str, Any]]] = None) -> 'PrefixTree':
         """
         Создает дерево из сериализованного словаря.
         
         Args:
             data: Словарь, представляющий сериализованное дерево
+            analyses: Список результатов анализа, на который ссылаются номера
+                word_refs (если дерево сериализовано с параметром analyses)
             
         Returns:
             Экземпляр префиксного дерева
+            
+        Raises:
+            ValueError: Если дерево содержит ссылки word_refs, а analyses не задан
         """
         tree = cls()
         tree.word_count = data['word_count']
         
-        # Рекурсивно восстанавливаем узлы
-        tree._deserialize_node(tree.root, data['root'])
+        # Восстанавливаем узлы и пересчитываем статистику
+        tree._deserialize_node(tree.root, data['root'], analyses)
+        tree._rebuild_statistics()
         
         return tree
     
-    def _deserialize_node(self, node: TrieNode, data: Dict[str, Any]) -> None:
+    def _deserialize_node(self, node: TrieNode, data: Dict[str, Any],
+                          analyses: Optional[Sequence[Dict[str, Any]]] = None) -> None:
         """
-        Рекурсивно восстанавливает узел и его дочерние узлы из словаря.
+        Восстанавливает узел и его дочерние узлы из словаря (итеративный обход).
         
         Args:
             node: Узел для заполнения
             data: Словарь с данными узла
+            analyses: Список результатов анализа для ссылок word_refs
         """
-        node.syllable = data['syllable']
-        node.is_end_of_word = data['is_end_of_word']
-        node.count = data['count']
-        
-        if node.is_end_of_word and 'word_data' in data:
-            node.word_data = data['word_data']
+        # Восстановленные узлы текущего пути, индекс - глубина
+        parents: List[TrieNode] = []
+        
+        for current_data, path, depth, _ in walk(data, children=lambda d: d['children'].items()):
+            del parents[depth:]
+            if depth:
+                current = TrieNode()
+                parents[-1].children[path[-1]] = current
+            else:
+                current = node
+            
+            current.syllable = current_data['syllable']
+            current.is_end_of_word = current_data['is_end_of_word']
+            current.count = current_data['count']
+            
+            if current.is_end_of_word:
+                if 'word_refs' in current_data:
+                    if analyses is None:
+                        raise ValueError("Дерево ссылается на результаты анализа, но список analyses не задан")
+                    payloads = [analyses[ref] for ref in current_data['word_refs']]
+                else:
+                    payloads = current_data.get('word_data') or []
+                
+                if payloads:
+                    counts = current_data.get('word_counts')
+                    if counts is None:
+                        # Все данные вставлены по одному разу либо дерево сохранено
+                        # прежней версией с копией данных для каждой вставки
+                        counts = []
+                        for data in payloads:
+                            index = find_payload(current.word_data, data)
+                            if index < 0:
+                                current.word_data.append(data)
+                            else:
+                                add_count(counts, index, 1)
+                        if counts:
+                            current.word_counts = counts
+                    else:
+                        current.word_data = list(payloads)
+                        current.word_counts = list(counts)
+                    if current_data.get('word_positions'):
+                        current.word_positions = [list(p) for p in current_data['word_positions']]
             
-        for syllable, child_data in data['children'].items():
-            node.children[syllable] = TrieNode()
-            self._deserialize_node(node.children[syllable], child_data)
+            parents.append(current)
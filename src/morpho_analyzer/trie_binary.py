@@ -0,0 +1,456 @@
+"""
+Модуль двоичного формата префиксного дерева.
+
+Этот модуль позволяет сохранить префиксное дерево в версионированный
+двоичный файл и открыть его через mmap без десериализации в объекты TrieNode:
+поиск и обход по префиксу выполняются непосредственно по отображенному буферу.
+Файл открывается только для чтения, поэтому страницы одного большого дерева
+разделяются операционной системой между всеми процессами, открывшими его.
+
+Формат файла (все числа little-endian):
+    Заголовок (HEADER):
+        magic (8 байт), версия, количество слов, количество узлов,
+        количество слогов, смещения таблиц слогов, узлов и данных
+    Таблица смещений слогов: (количество слогов + 1) x uint32
+    Данные слогов: слоги в UTF-8, отсортированные по байтам
+        (идентификатор слога - его номер в этом порядке)
+    Таблица узлов: записи NODE в порядке обхода в ширину; дети каждого узла
+        идут подряд и упорядочены по идентификатору слога. Узел 0 - корень
+    Данные о словах: JSON-объект для каждого конца слова с уникальными
+        данными (word_data) и, если они есть, количеством их вставок
+        (word_counts) и позициями вхождений (word_positions)
+"""
+
+import json
+import mmap
+import struct
+from collections import deque
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .trie import iter_by_frequency, payload_occurrences
+
+
+# Сигнатура и версия формата
+MAGIC = b'MORPHTRI'
+FORMAT_VERSION = 2
+
+# Заголовок: сигнатура, версия, слова, узлы, слоги, смещения трех секций
+HEADER = struct.Struct('<8sIQIIQQQ')
+
+# Узел: слог, счетчик, первый ребенок, число детей, флаги, смещение и длина данных
+NODE = struct.Struct('<IIIIIQI')
+
+# Смещение в таблице слогов
+OFFSET = struct.Struct('<I')
+
+# Идентификатор слога корневого узла
+NO_SYLLABLE = 0xFFFFFFFF
+
+# Флаг узла - конец слова
+FLAG_END_OF_WORD = 1
+
+
+def write_binary_trie(trie: Any, path: str) -> None:
+    """
+    Сохраняет префиксное дерево в двоичный файл.
+
+    Args:
+        trie: Префиксное дерево (PrefixTree)
+        path: Путь к файлу
+    """
+    # Собираем узлы в порядке обхода в ширину, чтобы дети шли подряд
+    nodes = [trie.root]
+    syllables = set()
+    queue = deque([trie.root])
+    while queue:
+        node = queue.popleft()
+        for syllable, child in node.children.items():
+            syllables.add(syllable)
+            queue.append(child)
+
+    encoded = sorted(syllable.encode('utf-8') for syllable in syllables)
+    syllable_ids = {syllable.decode('utf-8'): i for i, syllable in enumerate(encoded)}
+
+    # Нумеруем узлы: дети каждого узла упорядочены по идентификатору слога
+    ordered_children = []
+    queue = deque([trie.root])
+    while queue:
+        node = queue.popleft()
+        children = sorted(node.children.items(), key=lambda item: syllable_ids[item[0]])
+        ordered_children.append(children)
+        for _, child in children:
+            nodes.append(child)
+            queue.append(child)
+
+    syllable_table = bytearray()
+    syllable_data = bytearray()
+    for syllable in encoded:
+        syllable_table += OFFSET.pack(len(syllable_data))
+        syllable_data += syllable
+    syllable_table += OFFSET.pack(len(syllable_data))
+
+    syllables_offset = HEADER.size
+    nodes_offset = syllables_offset + len(syllable_table) + len(syllable_data)
+    payload_offset = nodes_offset + NODE.size * len(nodes)
+
+    node_table = bytearray()
+    payload_data = bytearray()
+    next_child = 1
+
+    for index, node in enumerate(nodes):
+        children = ordered_children[index]
+        syllable_id = syllable_ids[node.syllable] if index else NO_SYLLABLE
+
+        flags = 0
+        data_start = data_length = 0
+        if node.is_end_of_word:
+            flags |= FLAG_END_OF_WORD
+            # Счетчики и позиции записываются, как в PrefixTree.serialize, только если они есть
+            entry = {'word_data': node.word_data}
+            if node.word_counts:
+                entry['word_counts'] = [count for _, count, _ in
+                                        payload_occurrences(node.word_data, node.word_counts, ())]
+            if node.word_positions:
+                entry['word_positions'] = [list(positions) for positions in node.word_positions]
+            payload = json.dumps(entry, ensure_ascii=False,
+                                 separators=(',', ':'), default=str).encode('utf-8')
+            data_start = len(payload_data)
+            data_length = len(payload)
+            payload_data += payload
+
+        node_table += NODE.pack(syllable_id, node.count, next_child if children else 0,
+                                len(children), flags, data_start, data_length)
+        next_child += len(children)
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, trie.word_count, len(nodes), len(encoded),
+                            syllables_offset, nodes_offset, payload_offset))
+        f.write(syllable_table)
+        f.write(syllable_data)
+        f.write(node_table)
+        f.write(payload_data)
+
+
+class MappedPrefixTree:
+    """
+    Префиксное дерево, отображенное в память из двоичного файла (только чтение).
+
+    Attributes:
+        path: Путь к файлу
+        word_count: Количество слов в дереве
+        node_count: Количество узлов в дереве
+    """
+
+    def __init__(self, path: str):
+        """
+        Открывает двоичный файл дерева через mmap.
+
+        Args:
+            path: Путь к файлу
+
+        Raises:
+            ValueError: Если файл не является деревом поддерживаемой версии
+        """
+        self.path = path
+
+        with open(path, 'rb') as f:
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._buffer) < HEADER.size:
+            self.close()
+            raise ValueError(f"Файл {path} не является двоичным префиксным деревом")
+
+        (magic, version, self.word_count, self.node_count, self._syllable_count,
+         self._syllables_offset, self._nodes_offset, self._payload_offset) = HEADER.unpack_from(self._buffer, 0)
+
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Файл {path} не является двоичным префиксным деревом")
+        if version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Версия формата {version} не поддерживается (ожидается {FORMAT_VERSION})")
+
+        self._syllable_data_offset = self._syllables_offset + OFFSET.size * (self._syllable_count + 1)
+
+    def close(self) -> None:
+        """
+        Закрывает отображение файла.
+        """
+        if self._buffer is not None:
+            self._buffer.close()
+            self._buffer = None
+
+    def __enter__(self) -> 'MappedPrefixTree':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __reduce__(self):
+        # При передаче в другой процесс файл открывается заново по пути
+        return (self.__class__, (self.path,))
+
+    def _syllable(self, syllable_id: int) -> bytes:
+        """
+        Возвращает байты слога по идентификатору.
+
+        Args:
+            syllable_id: Идентификатор слога
+
+        Returns:
+            Слог в UTF-8
+        """
+        position = self._syllables_offset + OFFSET.size * syllable_id
+        start, = OFFSET.unpack_from(self._buffer, position)
+        end, = OFFSET.unpack_from(self._buffer, position + OFFSET.size)
+        return self._buffer[self._syllable_data_offset + start:self._syllable_data_offset + end]
+
+    def _syllable_id(self, syllable: str) -> int:
+        """
+        Находит идентификатор слога бинарным поиском по таблице слогов.
+
+        Args:
+            syllable: Слог
+
+        Returns:
+            Идентификатор слога или -1, если слога нет в дереве
+        """
+        key = syllable.encode('utf-8')
+        low, high = 0, self._syllable_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._syllable(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._syllable_count and self._syllable(low) == key:
+            return low
+        return -1
+
+    def _node(self, index: int) -> Tuple[int, int, int, int, int, int, int]:
+        """
+        Читает запись узла.
+
+        Args:
+            index: Номер узла
+
+        Returns:
+            Кортеж (слог, счетчик, первый ребенок, число детей, флаги, смещение данных, длина данных)
+        """
+        return NODE.unpack_from(self._buffer, self._nodes_offset + NODE.size * index)
+
+    def _find_child(self, index: int, syllable_id: int) -> int:
+        """
+        Ищет дочерний узел бинарным поиском среди детей узла.
+
+        Args:
+            index: Номер родительского узла
+            syllable_id: Идентификатор слога
+
+        Returns:
+            Номер дочернего узла или -1
+        """
+        _, _, first_child, child_count, _, _, _ = self._node(index)
+        low, high = first_child, first_child + child_count
+        while low < high:
+            middle = (low + high) // 2
+            middle_id, = OFFSET.unpack_from(self._buffer, self._nodes_offset + NODE.size * middle)
+            if middle_id < syllable_id:
+                low = middle + 1
+            elif middle_id > syllable_id:
+                high = middle
+            else:
+                return middle
+        return -1
+
+    def _find_node(self, syllables: List[str]) -> int:
+        """
+        Находит узел, соответствующий последовательности слогов.
+
+        Args:
+            syllables: Список слогов
+
+        Returns:
+            Номер узла или -1
+        """
+        index = 0
+        for syllable in syllables:
+            syllable_id = self._syllable_id(syllable)
+            if syllable_id < 0:
+                return -1
+            index = self._find_child(index, syllable_id)
+            if index < 0:
+                return -1
+        return index
+
+    def _entry(self, data_start: int, data_length: int) -> Dict[str, Any]:
+        """
+        Декодирует запись конца слова из буфера.
+
+        Args:
+            data_start: Смещение данных относительно секции данных
+            data_length: Длина данных
+
+        Returns:
+            Словарь с ключом word_data и, если есть, word_counts и word_positions
+        """
+        start = self._payload_offset + data_start
+        return json.loads(self._buffer[start:start + data_length].decode('utf-8'))
+
+    def _word_data(self, data_start: int, data_length: int) -> List[Dict[str, Any]]:
+        """
+        Декодирует данные о слове из буфера.
+
+        Args:
+            data_start: Смещение данных относительно секции данных
+            data_length: Длина данных
+
+        Returns:
+            Список уникальных данных о слове
+        """
+        return self._entry(data_start, data_length)['word_data']
+
+    def search(self, syllables: List[str]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Ищет слово в дереве.
+
+        Args:
+            syllables: Список слогов слова
+
+        Returns:
+            Данные о слове, если слово найдено, иначе None
+        """
+        index = self._find_node(syllables)
+        if index < 0:
+            return None
+
+        _, _, _, _, flags, data_start, data_length = self._node(index)
+        if flags & FLAG_END_OF_WORD:
+            return self._word_data(data_start, data_length)
+        return None
+
+    def search_occurrences(self, syllables: List[str]) -> Optional[List[Tuple[Dict[str, Any], int, List[int]]]]:
+        """
+        Ищет слово и возвращает его данные вместе с частотой и позициями.
+
+        Args:
+            syllables: Список слогов слова
+
+        Returns:
+            Список кортежей (данные о слове, количество вставок, позиции вхождений),
+            если слово найдено, иначе None
+        """
+        index = self._find_node(syllables)
+        if index < 0:
+            return None
+
+        _, _, _, _, flags, data_start, data_length = self._node(index)
+        if not flags & FLAG_END_OF_WORD:
+            return None
+        entry = self._entry(data_start, data_length)
+        return payload_occurrences(entry['word_data'], entry.get('word_counts', ()),
+                                   entry.get('word_positions', ()))
+
+    def _children(self, index: int) -> Iterator[Tuple[str, int]]:
+        """
+        Перебирает дочерние узлы в порядке идентификаторов слогов.
+
+        Args:
+            index: Номер узла
+
+        Yields:
+            Пары (слог, номер дочернего узла)
+        """
+        _, _, first_child, child_count, _, _, _ = self._node(index)
+        for child in range(first_child, first_child + child_count):
+            syllable_id, = OFFSET.unpack_from(self._buffer, self._nodes_offset + NODE.size * child)
+            yield self._syllable(syllable_id).decode('utf-8'), child
+
+    def _end_word_data(self, index: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Возвращает данные о слове, если узел является концом слова.
+
+        Args:
+            index: Номер узла
+
+        Returns:
+            Данные о слове или None
+        """
+        _, _, _, _, flags, data_start, data_length = self._node(index)
+        if flags & FLAG_END_OF_WORD:
+            return self._word_data(data_start, data_length)
+        return None
+
+    def iter_words(self, prefix_syllables: Optional[List[str]] = None,
+                   limit: Optional[int] = None,
+                   by_frequency: bool = False) -> Iterator[Tuple[List[str], List[Dict[str, Any]]]]:
+        """
+        Лениво обходит слова, начинающиеся с заданного префикса.
+
+        Args:
+            prefix_syllables: Список слогов префикса (None - все слова)
+            limit: Максимальное количество слов (None - без ограничения)
+            by_frequency: Выдавать слова в порядке убывания частоты
+                (количества вставок) вместо порядка слогов
+
+        Yields:
+            Пары (слоги слова, данные о слове)
+        """
+        prefix = list(prefix_syllables or [])
+        start = self._find_node(prefix)
+        if start < 0:
+            return
+
+        if by_frequency:
+            words = iter_by_frequency(start, prefix, self._children,
+                                      lambda index: self._node(index)[1], self._end_word_data)
+        else:
+            words = self._iter_words_in_order(start, prefix)
+
+        yield from islice(words, limit)
+
+    def _iter_words_in_order(self, start: int, prefix: List[str]) -> Iterator[Tuple[List[str], List[Dict[str, Any]]]]:
+        """
+        Обходит слова поддерева в глубину в порядке слогов.
+
+        Args:
+            start: Номер начального узла
+            prefix: Слоги от корня до начального узла
+
+        Yields:
+            Пары (слоги слова, данные о слове)
+        """
+        stack = [(start, prefix)]
+        while stack:
+            index, path = stack.pop()
+            _, _, first_child, child_count, flags, data_start, data_length = self._node(index)
+
+            if flags & FLAG_END_OF_WORD:
+                yield path, self._word_data(data_start, data_length)
+
+            # Кладем детей в обратном порядке, чтобы обходить их по возрастанию
+            for child in range(first_child + child_count - 1, first_child - 1, -1):
+                syllable_id, = OFFSET.unpack_from(self._buffer, self._nodes_offset + NODE.size * child)
+                stack.append((child, path + [self._syllable(syllable_id).decode('utf-8')]))
+
+    def starts_with_prefix(self, prefix_syllables: List[str]) -> List[Tuple[List[str], List[Dict[str, Any]]]]:
+        """
+        Находит все слова, начинающиеся с заданного префикса.
+
+        Args:
+            prefix_syllables: Список слогов префикса
+
+        Returns:
+            Список пар (слоги слова, данные о слове)
+        """
+        return list(self.iter_words(prefix_syllables))
+
+    def get_all_words(self) -> List[Tuple[List[str], List[Dict[str, Any]]]]:
+        """
+        Возвращает все слова в дереве.
+
+        Returns:
+            Список пар (слоги слова, данные о слове)
+        """
+        return list(self.iter_words())
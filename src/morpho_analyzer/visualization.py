@@ -8,33 +8,28 @@
 - упрощенная версия дерева с ограничением до 100 слов
 """
 
-import matplotlib.pyplot as plt
-import matplotlib
-import networkx as nx
-import numpy as np
-from typing import Any, Dict, List, Optional, Tuple, Union, Set
-from matplotlib.figure import Figure
-import pandas as pd
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union, Set
 import re
 import os
 from copy import deepcopy
 from collections import Counter
 import random
 
-# Conditional import for pyvis in case visualization is not needed
-try:
+# matplotlib, networkx, numpy, pandas и pyvis импортируются внутри функций,
+# которые их используют: импорт модуля не должен стоить секунды запуска,
+# если графики и Excel не нужны
+if TYPE_CHECKING:
+    import networkx as nx
+    from matplotlib.figure import Figure
     from pyvis.network import Network
-except ImportError:
-    Network = None
-    print("Warning: pyvis is not installed, interactive tree visualization is disabled")
 
 # Импортируем мою реализацию префиксного дерева
-from .trie import PrefixTree, TrieNode
+from .trie import PrefixTree, TrieNode, walk
 
 
 def visualize_trie(trie: PrefixTree, max_depth: int = 5, 
                   output_path: Optional[str] = None,
-                  title: str = "Префиксное дерево") -> Figure:
+                  title: str = "Префиксное дерево") -> 'Figure':
     """
     Создает визуализацию префиксного дерева.
     
@@ -47,13 +42,16 @@ def visualize_trie(trie: PrefixTree, max_depth: int = 5,
     Returns:
         Объект Figure с визуализацией
     """
+    import matplotlib.pyplot as plt
+    import networkx as nx
+    
     # Создаем направленный граф
     G = nx.DiGraph()
     
     # Добавляем корневой узел
     G.add_node("ROOT", label="ROOT", syllable="", count=0)
     
-    # Рекурсивно добавляем узлы и ребра
+    # Добавляем узлы и ребра
     _add_nodes_and_edges(G, "ROOT", trie.root, 1, max_depth)
     
     # Создаем фигуру и оси
@@ -97,10 +95,10 @@ def visualize_trie(trie: PrefixTree, max_depth: int = 5,
     return fig
 
 
-def _add_nodes_and_edges(G: nx.DiGraph, parent_id: str, node: TrieNode, 
+def _add_nodes_and_edges(G: 'nx.DiGraph', parent_id: str, node: TrieNode, 
                         current_depth: int, max_depth: int) -> None:
     """
-    Рекурсивно добавляет узлы и ребра в граф NetworkX.
+    Добавляет узлы и ребра в граф NetworkX (итеративный обход).
     
     Args:
         G: Граф NetworkX
@@ -109,29 +107,33 @@ def _add_nodes_and_edges(G: nx.DiGraph, parent_id: str, node: TrieNode,
         current_depth: Текущая глубина в дереве
         max_depth: Максимальная глубина для визуализации
     """
-    # Если превышена максимальная глубина, останавливаемся
-    if current_depth > max_depth:
-        return
+    # Идентификаторы узлов текущего пути, индекс - глубина относительно node
+    node_ids = [parent_id]
     
-    # Добавляем дочерние узлы и ребра
-    for syllable, child_node in node.children.items():
+    for child_node, path, depth, _ in walk(node, max_depth=max_depth - current_depth + 1):
+        if not depth:
+            continue
+        
+        syllable = path[-1]
+        del node_ids[depth:]
+        
         # Создаем уникальный идентификатор для узла
-        node_id = f"{parent_id}_{syllable}"
+        node_id = f"{node_ids[-1]}_{syllable}"
         
         # Добавляем узел с его атрибутами
         G.add_node(node_id, syllable=syllable, label=syllable, 
                   count=child_node.count, is_end=child_node.is_end_of_word)
         
         # Добавляем ребро от родительского узла к текущему
-        G.add_edge(parent_id, node_id)
+        G.add_edge(node_ids[-1], node_id)
         
-        # Рекурсивно добавляем дочерние узлы
-        _add_nodes_and_edges(G, node_id, child_node, current_depth + 1, max_depth)
+        node_ids.append(node_id)
 
 
-def visualize_parts_of_speech(analyzed_text: List[Dict[str, Any]], 
+def visualize_parts_of_speech(analyzed_text: Optional[List[Dict[str, Any]]], 
                              output_path: Optional[str] = None,
-                             title: str = "Распределение частей речи") -> Figure:
+                             title: str = "Распределение частей речи",
+                             pos_counts: Optional[Dict[str, int]] = None) -> 'Figure':
     """
     Создает график распределения частей речи в тексте.
     
@@ -139,17 +141,16 @@ def visualize_parts_of_speech(analyzed_text: List[Dict[str, Any]],
         analyzed_text: Список результатов морфологического анализа
         output_path: Путь для сохранения изображения (если None, изображение не сохраняется)
         title: Заголовок графика
+        pos_counts: Готовые частоты частей речи (если заданы, analyzed_text не используется)
         
     Returns:
         Объект Figure с визуализацией
     """
-    # Подсчитываем частоты частей речи
-    pos_counter = Counter()
+    import matplotlib.pyplot as plt
+    import numpy as np
     
-    for word_info in analyzed_text:
-        pos = word_info.get('pos')
-        if pos:  # Пропускаем None и пустые строки
-            pos_counter[pos] += 1
+    # Подсчитываем частоты частей речи
+    pos_counter = _count_parts_of_speech(analyzed_text, pos_counts)
     
     # Получаем наиболее частые части речи
     labels = []
@@ -188,6 +189,31 @@ def visualize_parts_of_speech(analyzed_text: List[Dict[str, Any]],
     return fig
 
 
+def _count_parts_of_speech(analyzed_text: Optional[List[Dict[str, Any]]],
+                           pos_counts: Optional[Dict[str, int]] = None) -> Counter:
+    """
+    Подсчитывает частоты частей речи.
+    
+    Args:
+        analyzed_text: Список результатов морфологического анализа
+        pos_counts: Готовые частоты частей речи (используются, если заданы)
+        
+    Returns:
+        Счетчик частей речи
+    """
+    if pos_counts is not None:
+        return Counter(pos_counts)
+    
+    pos_counter = Counter()
+    
+    for word_info in analyzed_text:
+        pos = word_info.get('pos')
+        if pos:  # Пропускаем None и пустые строки
+            pos_counter[pos] += 1
+    
+    return pos_counter
+
+
 def _get_pos_name(pos_tag: str) -> str:
     """
     Преобразует тег части речи в удобочитаемое название.
@@ -221,7 +247,7 @@ def _get_pos_name(pos_tag: str) -> str:
 
 def visualize_syllable_statistics(syllable_stats: Dict[str, Any],
                                 output_path: Optional[str] = None,
-                                title: str = "Статистика слогов") -> Figure:
+                                title: str = "Статистика слогов") -> 'Figure':
     """
     Создает визуализацию статистики по слогам.
     
@@ -233,6 +259,9 @@ def visualize_syllable_statistics(syllable_stats: Dict[str, Any],
     Returns:
         Объект Figure с визуализацией
     """
+    import matplotlib.pyplot as plt
+    import numpy as np
+    
     # Создаем подграфики
     fig, axs = plt.subplots(2, 1, figsize=(12, 10))
     
@@ -291,17 +320,11 @@ def _extract_words_from_trie(trie: PrefixTree) -> List[Tuple[List[str], Dict[str
     """
     words = []
     
-    def _traverse(node: TrieNode, syllables: List[str]):
+    for node, syllables, _, _ in walk(trie.root):
         if node.is_end_of_word and node.word_data:
             for data in node.word_data:
                 words.append((syllables[:], data))
-        
-        for syllable, child in node.children.items():
-            syllables.append(syllable)
-            _traverse(child, syllables)
-            syllables.pop()
     
-    _traverse(trie.root, [])
     return words
 
 
@@ -358,6 +381,12 @@ def visualize_trie_interactive(trie: PrefixTree, max_depth: int = 5,
     Returns:
         None (сохраняет HTML-файл или отображает в notebook)
     """
+    try:
+        from pyvis.network import Network
+    except ImportError:
+        print("Warning: pyvis is not installed, interactive tree visualization is disabled")
+        return None
+    
     # Создаем объект Network
     net = Network(height="800px", width="100%", directed=True, notebook=notebook)
     net.toggle_physics(True)
@@ -402,7 +431,7 @@ def visualize_trie_interactive(trie: PrefixTree, max_depth: int = 5,
     net.add_node(root_id, label="ROOT", title="ROOT", 
                 shape="dot", size=25, color="#00BFFF")
     
-    # Рекурсивно добавляем узлы и ребра
+    # Добавляем узлы и ребра
     _add_nodes_and_edges_interactive(net, root_id, trie.root, 1, max_depth)
     
     # Сохраняем HTML-файл
@@ -441,10 +470,10 @@ def visualize_trie_interactive(trie: PrefixTree, max_depth: int = 5,
         print(f"Ошибка при сохранении визуализации: {e}")
 
 
-def _add_nodes_and_edges_interactive(net: Network, parent_id: str, node: TrieNode,
+def _add_nodes_and_edges_interactive(net: 'Network', parent_id: str, node: TrieNode,
                                   current_depth: int, max_depth: int) -> None:
     """
-    Рекурсивно добавляет узлы и ребра в объект Network.
+    Добавляет узлы и ребра в объект Network (итеративный обход).
     
     Args:
         net: Объект Network из pyvis
@@ -453,14 +482,19 @@ def _add_nodes_and_edges_interactive(net: Network, parent_id: str, node: TrieNod
         current_depth: Текущая глубина в дереве
         max_depth: Максимальная глубина для визуализации
     """
-    # Если превышена максимальная глубина, останавливаемся
-    if current_depth > max_depth:
-        return
+    # Идентификаторы узлов текущего пути, индекс - глубина относительно node
+    node_ids = [parent_id]
     
-    # Добавляем дочерние узлы и ребра
-    for syllable, child_node in node.children.items():
+    for child_node, path, depth, _ in walk(node, max_depth=max_depth - current_depth + 1):
+        if not depth:
+            continue
+        
+        syllable = path[-1]
+        del node_ids[depth:]
+        parent_id = node_ids[-1]
+        
         # Создаем уникальный идентификатор для узла
-        node_id = f"{parent_id}_{syllable}_{current_depth}_{id(child_node)}"
+        node_id = f"{parent_id}_{syllable}_{current_depth + depth - 1}_{id(child_node)}"
         
         # Определение цвета и размера на основе свойств узла
         node_color = "#1E90FF" # Обычный узел
@@ -495,13 +529,12 @@ def _add_nodes_and_edges_interactive(net: Network, parent_id: str, node: TrieNod
         net.add_edge(parent_id, node_id, title=f"Встречается: {child_node.count} раз", 
                     width=edge_width, label=edge_label)
         
-        # Рекурсивно обрабатываем дочерние узлы
-        _add_nodes_and_edges_interactive(net, node_id, child_node, current_depth + 1, max_depth)
+        node_ids.append(node_id)
 
 
 def visualize_trie_statistics(trie_stats: Dict[str, Any], 
                             output_path: Optional[str] = None,
-                            title: str = "Статистика префиксного дерева") -> Figure:
+                            title: str = "Статистика префиксного дерева") -> 'Figure':
     """
     Создает визуализацию статистики по префиксному дереву.
     
@@ -513,6 +546,9 @@ def visualize_trie_statistics(trie_stats: Dict[str, Any],
     Returns:
         Объект Figure с визуализацией
     """
+    import matplotlib.pyplot as plt
+    import numpy as np
+    
     # Создаем подграфики
     fig, axs = plt.subplots(2, 1, figsize=(12, 10))
     
@@ -560,6 +596,163 @@ def visualize_trie_statistics(trie_stats: Dict[str, Any],
     return fig
 
 
+# Словарь соответствия английских морфологических терминов русским
+MORPHO_TRANSLATION = {
+    # Части речи
+    'NOUN': 'Существительное',
+    'VERB': 'Глагол',
+    'INFN': 'Инфинитив',
+    'ADJF': 'Прилагательное (полное)',
+    'ADJS': 'Прилагательное (краткое)',
+    'ADVB': 'Наречие',
+    'COMP': 'Компаратив',
+    'PRTF': 'Причастие (полное)',
+    'PRTS': 'Причастие (краткое)',
+    'GRND': 'Деепричастие',
+    'NUMR': 'Числительное',
+    'CONJ': 'Союз',
+    'PREP': 'Предлог',
+    'PRCL': 'Частица',
+    'INTJ': 'Междометие',
+    'PNCT': 'Пунктуация',
+    'UNKN': 'Неизвестно',
+    'PRED': 'Предикатив',
+    'NPRO': 'Местоимение-существительное',
+    
+    # Падежи
+    'nomn': 'Именительный',
+    'gent': 'Родительный',
+    'datv': 'Дательный',
+    'accs': 'Винительный',
+    'ablt': 'Творительный',
+    'loct': 'Предложный',
+    'voct': 'Звательный',
+    'gen1': 'Первый родительный',
+    'gen2': 'Второй родительный',
+    'acc2': 'Второй винительный',
+    'loc1': 'Первый предложный',
+    'loc2': 'Второй предложный',
+    
+    # Род
+    'masc': 'Мужской',
+    'femn': 'Женский',
+    'neut': 'Средний',
+    'ms-f': 'Общий',
+    
+    # Число
+    'sing': 'Единственное',
+    'plur': 'Множественное',
+    
+    # Время
+    'past': 'Прошедшее',
+    'pres': 'Настоящее',
+    'futr': 'Будущее',
+    
+    # Лицо
+    '1per': 'Первое лицо',
+    '2per': 'Второе лицо',
+    '3per': 'Третье лицо',
+    
+    # Наклонение
+    'indc': 'Изъявительное',
+    'impr': 'Повелительное',
+    
+    # Залог
+    'actv': 'Действительный',
+    'pssv': 'Страдательный',
+    
+    # Переходность
+    'tran': 'Переходный',
+    'intr': 'Непереходный',
+    
+    # Одушевленность
+    'anim': 'Одушевлённое',
+    'inan': 'Неодушевлённое',
+    
+    # Прочие
+    'Abbr': 'Аббревиатура',
+    'Name': 'Имя',
+    'Surn': 'Фамилия',
+    'Patr': 'Отчество',
+    'Geox': 'Топоним',
+    'Orgn': 'Организация',
+    'Trad': 'Торговая марка',
+    'perf': 'Совершенный вид',
+    'impf': 'Несовершенный вид',
+    'excl': 'Восклицательное',
+    'ipft': 'Несовершенного вида (причастие)',
+    'pf': 'Совершенного вида (причастие)',
+    'pos': 'Часть речи'
+}
+
+
+# Русификация значений омонимов (sense)
+SENSE_TRANSLATIONS = {
+    'vegetable': 'Овощ',
+    'weapon': 'Оружие',
+    'lock_key': 'Ключ от замка',
+    'spring': 'Родник'
+}
+
+# Русские названия морфологических тегов
+TAG_NAMES = {
+    'pos': 'Часть речи',
+    'gender': 'Род',
+    'number': 'Число',
+    'case': 'Падеж',
+    'tense': 'Время',
+    'person': 'Лицо',
+    'aspect': 'Вид',
+    'mood': 'Наклонение',
+    'voice': 'Залог'
+}
+
+# Столбцы Excel-файла при потоковой записи (заголовок пишется заранее)
+EXCEL_COLUMNS = ['Слово', 'Начальная форма', 'Часть речи', 'Слоги', 'Значение омонима',
+                 'Род', 'Число', 'Падеж', 'Время', 'Лицо', 'Вид', 'Наклонение', 'Залог', 'Animacy']
+
+# Максимальное количество строк на листе Excel (включая заголовок)
+EXCEL_MAX_ROWS = 1048576
+
+
+def _build_excel_row(item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Формирует строку таблицы Excel с русифицированными свойствами слова.
+    
+    Args:
+        item: Результат морфологического анализа слова
+        
+    Returns:
+        Словарь {название столбца: значение}
+    """
+    # Базовые поля
+    row_data = {
+        'Слово': item['word'],
+        'Начальная форма': item['lemma'],
+        'Часть речи': MORPHO_TRANSLATION.get(item['pos'], item['pos']),
+        'Слоги': '-'.join(item['syllables']) if 'syllables' in item else ''
+    }
+    
+    # Проверяем, есть ли значение омонима на верхнем уровне
+    if 'sense' in item and item['sense']:
+        row_data['Значение омонима'] = SENSE_TRANSLATIONS.get(item['sense'], item['sense'])
+    
+    # Добавляем морфологические теги с русификацией
+    if 'tags' in item and item['tags']:
+        for tag_key, tag_value in item['tags'].items():
+            # Пропускаем sense в tags, так как он обрабатывается отдельно на верхнем уровне
+            if tag_key == 'sense':
+                continue
+            
+            # Русское название тега (по умолчанию просто капитализируем)
+            tag_name = TAG_NAMES.get(tag_key, tag_key.capitalize())
+            
+            # Русское значение тега
+            row_data[tag_name] = MORPHO_TRANSLATION.get(tag_value, tag_value)
+    
+    return row_data
+
+
 def export_to_excel(analyzed_text: List[Dict[str, Any]], 
                    output_path: str = 'morphological_analysis.xlsx',
                    sheet_name: str = 'Морфологический анализ') -> None:
@@ -574,154 +767,10 @@ def export_to_excel(analyzed_text: List[Dict[str, Any]],
     Returns:
         None (сохраняет Excel-файл по указанному пути)
     """
-    # Словарь соответствия английских морфологических терминов русским
-    morpho_translation = {
-        # Части речи
-        'NOUN': 'Существительное',
-        'VERB': 'Глагол',
-        'INFN': 'Инфинитив',
-        'ADJF': 'Прилагательное (полное)',
-        'ADJS': 'Прилагательное (краткое)',
-        'ADVB': 'Наречие',
-        'COMP': 'Компаратив',
-        'PRTF': 'Причастие (полное)',
-        'PRTS': 'Причастие (краткое)',
-        'GRND': 'Деепричастие',
-        'NUMR': 'Числительное',
-        'CONJ': 'Союз',
-        'PREP': 'Предлог',
-        'PRCL': 'Частица',
-        'INTJ': 'Междометие',
-        'PNCT': 'Пунктуация',
-        'UNKN': 'Неизвестно',
-        'PRED': 'Предикатив',
-        'NPRO': 'Местоимение-существительное',
-        'ADJS': 'Прилагательное (краткое)',
-        
-        # Падежи
-        'nomn': 'Именительный',
-        'gent': 'Родительный',
-        'datv': 'Дательный',
-        'accs': 'Винительный',
-        'ablt': 'Творительный',
-        'loct': 'Предложный',
-        'voct': 'Звательный',
-        'gen1': 'Первый родительный',
-        'gen2': 'Второй родительный',
-        'acc2': 'Второй винительный',
-        'loc1': 'Первый предложный',
-        'loc2': 'Второй предложный',
-        
-        # Род
-        'masc': 'Мужской',
-        'femn': 'Женский',
-        'neut': 'Средний',
-        'ms-f': 'Общий',
-        
-        # Число
-        'sing': 'Единственное',
-        'plur': 'Множественное',
-        
-        # Время
-        'past': 'Прошедшее',
-        'pres': 'Настоящее',
-        'futr': 'Будущее',
-        
-        # Лицо
-        '1per': 'Первое лицо',
-        '2per': 'Второе лицо',
-        '3per': 'Третье лицо',
-        
-        # Наклонение
-        'indc': 'Изъявительное',
-        'impr': 'Повелительное',
-        
-        # Залог
-        'actv': 'Действительный',
-        'pssv': 'Страдательный',
-        
-        # Переходность
-        'tran': 'Переходный',
-        'intr': 'Непереходный',
-        
-        # Одушевленность
-        'anim': 'Одушевлённое',
-        'inan': 'Неодушевлённое',
-        
-        # Прочие
-        'Abbr': 'Аббревиатура',
-        'Name': 'Имя',
-        'Surn': 'Фамилия',
-        'Patr': 'Отчество',
-        'Geox': 'Топоним',
-        'Orgn': 'Организация',
-        'Trad': 'Торговая марка',
-        'perf': 'Совершенный вид',
-        'impf': 'Несовершенный вид',
-        'excl': 'Восклицательное',
-        'ipft': 'Несовершенного вида (причастие)',
-        'pf': 'Совершенного вида (причастие)',
-        'pos': 'Часть речи'
-    }
+    import pandas as pd
     
     # Подготовка данных для таблицы
-    rows = []
-    
-    for item in analyzed_text:
-        # Базовые поля
-        row_data = {
-            'Слово': item['word'],
-            'Начальная форма': item['lemma'],
-            'Часть речи': morpho_translation.get(item['pos'], item['pos']),
-            'Слоги': '-'.join(item['syllables']) if 'syllables' in item else ''
-        }
-        
-        # Проверяем, есть ли значение омонима на верхнем уровне
-        if 'sense' in item and item['sense']:
-            # Русификация значений sense
-            sense_translations = {
-                'vegetable': 'Овощ',
-                'weapon': 'Оружие',
-                'lock_key': 'Ключ от замка',
-                'spring': 'Родник'
-            }
-            row_data['Значение омонима'] = sense_translations.get(item['sense'], item['sense'])
-        
-        # Добавляем морфологические теги с русификацией
-        if 'tags' in item and item['tags']:
-            for tag_key, tag_value in item['tags'].items():
-                # Русское название тега
-                tag_name = tag_key.capitalize()  # По умолчанию просто капитализируем
-                
-                # Русское значение тега
-                tag_translated = morpho_translation.get(tag_value, tag_value)
-                
-                # Специальная обработка для некоторых тегов
-                if tag_key == 'pos':
-                    tag_name = 'Часть речи'
-                elif tag_key == 'gender':
-                    tag_name = 'Род'
-                elif tag_key == 'number':
-                    tag_name = 'Число'
-                elif tag_key == 'case':
-                    tag_name = 'Падеж'
-                elif tag_key == 'tense':
-                    tag_name = 'Время'
-                elif tag_key == 'person':
-                    tag_name = 'Лицо'
-                elif tag_key == 'aspect':
-                    tag_name = 'Вид'
-                elif tag_key == 'sense':
-                    # Пропускаем sense в tags, так как он обрабатывается отдельно на верхнем уровне
-                    continue
-                elif tag_key == 'mood':
-                    tag_name = 'Наклонение'
-                elif tag_key == 'voice':
-                    tag_name = 'Залог'
-                
-                row_data[tag_name] = tag_translated
-        
-        rows.append(row_data)
+    rows = [_build_excel_row(item) for item in analyzed_text]
     
     # Создаем DataFrame и сохраняем в Excel
     df = pd.DataFrame(rows)
@@ -738,18 +787,97 @@ def export_to_excel(analyzed_text: List[Dict[str, Any]],
         print(f"Ошибка при сохранении Excel-файла: {e}")
 
 
-def create_summary_report(analyzed_text: List[Dict[str, Any]], 
+class ExcelStreamWriter:
+    """
+    Потоковая запись результатов анализа в Excel-файл построчно.
+    
+    Использует режим write-only библиотеки openpyxl, поэтому строки не
+    накапливаются в памяти. При превышении лимита строк листа создается
+    следующий лист.
+    """
+    
+    def __init__(self, output_path: str = 'morphological_analysis.xlsx',
+                 sheet_name: str = 'Морфологический анализ',
+                 columns: Optional[List[str]] = None):
+        """
+        Создает Excel-файл для потоковой записи.
+        
+        Args:
+            output_path: Путь для сохранения Excel-файла
+            sheet_name: Имя листа в Excel-файле
+            columns: Список столбцов (по умолчанию EXCEL_COLUMNS)
+        """
+        from openpyxl import Workbook
+        
+        self.output_path = output_path
+        self.sheet_name = sheet_name
+        self.columns = columns or EXCEL_COLUMNS
+        self.rows_written = 0
+        
+        self._workbook = Workbook(write_only=True)
+        self._sheet = None
+        self._sheet_rows = 0
+        self._sheet_count = 0
+        self._new_sheet()
+    
+    def _new_sheet(self) -> None:
+        """
+        Создает новый лист и записывает в него заголовок.
+        """
+        self._sheet_count += 1
+        title = self.sheet_name if self._sheet_count == 1 else f"{self.sheet_name} {self._sheet_count}"
+        self._sheet = self._workbook.create_sheet(title=title[:31])
+        self._sheet.append(self.columns)
+        self._sheet_rows = 1
+    
+    def write(self, item: Dict[str, Any]) -> None:
+        """
+        Записывает результат анализа одного слова.
+        
+        Args:
+            item: Результат морфологического анализа слова
+        """
+        if self._sheet_rows >= EXCEL_MAX_ROWS:
+            self._new_sheet()
+        
+        row_data = _build_excel_row(item)
+        self._sheet.append([row_data.get(column) for column in self.columns])
+        self._sheet_rows += 1
+        self.rows_written += 1
+    
+    def close(self) -> None:
+        """
+        Сохраняет Excel-файл.
+        """
+        if self._workbook is None:
+            return
+        
+        os.makedirs(os.path.dirname(os.path.abspath(self.output_path)), exist_ok=True)
+        self._workbook.save(self.output_path)
+        self._workbook = None
+    
+    def __enter__(self) -> 'ExcelStreamWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def create_summary_report(analyzed_text: Optional[List[Dict[str, Any]]], 
                         trie: PrefixTree,
                         syllable_stats: Dict[str, Any],
-                        output_path: Optional[str] = None) -> str:
+                        output_path: Optional[str] = None,
+                        pos_counts: Optional[Dict[str, int]] = None) -> str:
     """
     Создает текстовый отчет с сводной статистикой анализа.
     
     Args:
         analyzed_text: Список результатов морфологического анализа
+            (может быть None, если заданы pos_counts)
         trie: Префиксное дерево
         syllable_stats: Статистика по слогам
         output_path: Путь для сохранения отчета (если None, отчет не сохраняется)
+        pos_counts: Готовые частоты частей речи (для потокового режима)
         
     Returns:
         Текст отчета
@@ -757,18 +885,14 @@ def create_summary_report(analyzed_text: List[Dict[str, Any]],
     trie_stats = trie.get_statistics()
     
     # Подсчитываем частоты частей речи
-    pos_counter = Counter()
-    
-    for word_info in analyzed_text:
-        pos = word_info.get('pos')
-        if pos:  # Пропускаем None и пустые строки
-            pos_counter[pos] += 1
+    pos_counter = _count_parts_of_speech(analyzed_text, pos_counts)
+    total_words = len(analyzed_text) if analyzed_text is not None else sum(pos_counter.values())
     
     # Формируем отчет
     report = []
     report.append("# Отчет о морфологическом анализе текста")
     report.append("\n## 1. Общая статистика\n")
-    report.append(f"- Всего слов: {len(analyzed_text)}")
+    report.append(f"- Всего слов: {total_words}")
     report.append(f"- Уникальных слов в дереве: {trie_stats['word_count']}")
     report.append(f"- Средняя длина слова в слогах: {syllable_stats['average_syllables_per_word']:.2f}")
     report.append(f"- Всего узлов в префиксном дереве: {trie_stats['node_count']}")
@@ -777,7 +901,7 @@ def create_summary_report(analyzed_text: List[Dict[str, Any]],
     
     report.append("\n## 2. Распределение частей речи\n")
     for pos, count in pos_counter.most_common():
-        report.append(f"- {_get_pos_name(pos)}: {count} слов ({count/len(analyzed_text)*100:.1f}%)")
+        report.append(f"- {_get_pos_name(pos)}: {count} слов ({count/total_words*100:.1f}%)")
     
     report.append("\n## 3. Распределение слов по количеству слогов\n")
     for count in sorted(syllable_stats['syllables_distribution'].keys()):
@@ -0,0 +1,112 @@
+"""
+Тесты для модуля колоночного представления результатов анализа.
+"""
+
+import os
+import sys
+import unittest
+from collections import Counter
+
+# Добавляем корневой каталог проекта в путь поиска модулей
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.morpho_analyzer.columnar import AnalysisColumns, TAG_COLUMNS
+from src.morpho_analyzer.morphology import MorphologicalAnalyzer
+
+
+class TestAnalysisColumns(unittest.TestCase):
+    """
+    Набор тестов для колоночного представления.
+    """
+
+    def setUp(self):
+        """
+        Подготовка к тестам.
+        """
+        self.analyzer = MorphologicalAnalyzer()
+        self.tokens = ("острая коса , косить траву . Девушка заплела длинную косу , "
+                       "коса до пояса . 123 abc коса").split()
+
+    def test_analyze_tokens_columnar(self):
+        """
+        Тест совпадения колоночного результата с пакетным анализом.
+        """
+        for window in (0, 3):
+            columns = self.analyzer.analyze_tokens_columnar(self.tokens, window=window)
+            self.assertEqual(columns.to_records(), self.analyzer.analyze_tokens(self.tokens, window=window))
+
+        columns = self.analyzer.analyze_tokens_columnar(self.tokens[4:9], before=self.tokens[:4],
+                                                        after=self.tokens[9:])
+        self.assertEqual(columns.to_records(),
+                         self.analyzer.analyze_tokens(self.tokens[4:9], before=self.tokens[:4],
+                                                      after=self.tokens[9:]))
+
+    def test_columns(self):
+        """
+        Тест параллельных столбцов и подсчета частей речи.
+        """
+        columns = self.analyzer.analyze_tokens_columnar(self.tokens)
+        records = self.analyzer.analyze_tokens(self.tokens)
+
+        self.assertEqual(len(columns), len(records))
+        self.assertEqual(columns.pos, [item['pos'] for item in records])
+        for name in TAG_COLUMNS:
+            self.assertEqual(len(columns.tags[name]), len(columns))
+
+        # Омонимы получают значение, остальные слова - None
+        self.assertEqual(columns.sense, [item.get('sense') for item in records])
+
+        expected = Counter(item['pos'] for item in records if item['pos'])
+        self.assertEqual(columns.pos_counts(), expected)
+
+    def test_interning(self):
+        """
+        Тест хранения повторяющихся строк в единственном экземпляре.
+        """
+        columns = AnalysisColumns()
+        for word in ("".join(["ко", "т"]), "".join(["ко", "т"])):
+            columns.append(word, word, 'NOUN', (('case', 'nomn'),))
+
+        self.assertIs(columns.word[0], columns.word[1])
+        self.assertIs(columns.lemma[0], columns.word[0])
+
+    def test_from_records(self):
+        """
+        Тест восстановления словарей с нестандартным набором тегов.
+        """
+        records = [
+            {'word': 'коса', 'lemma': 'коса', 'pos': 'NOUN',
+             'tags': {'gender': 'femn', 'register': 'book'}, 'sense': 'прическа', 'all_parses': []},
+            {'word': '...', 'lemma': '...', 'pos': 'PUNCT', 'tags': {}},
+            {'word': 'кот', 'lemma': 'кот', 'pos': 'NOUN', 'tags': dict.fromkeys(TAG_COLUMNS)}
+        ]
+
+        columns = AnalysisColumns.from_records(records)
+
+        self.assertEqual(columns.to_records(), records)
+        self.assertEqual(columns.tags['register'], ['book', None, None])
+
+    def test_to_pandas(self):
+        """
+        Тест преобразования в DataFrame.
+        """
+        columns = self.analyzer.analyze_tokens_columnar(self.tokens)
+        df = columns.to_pandas()
+
+        self.assertEqual(len(df), len(columns))
+        self.assertEqual(str(df['pos'].dtype), 'category')
+        self.assertEqual(list(df['word']), columns.word)
+
+        # Граммема с именем основного столбца не заменяет его
+        columns = AnalysisColumns.from_records([
+            {'word': 'коса', 'lemma': 'коса', 'pos': 'NOUN', 'sense': 'прическа',
+             'tags': {'gender': 'femn', 'sense': 'волосы'}},
+        ])
+        df = columns.to_pandas()
+        self.assertEqual(list(df['sense']), ['прическа'])
+        self.assertEqual(list(df['tag_sense']), ['волосы'])
+        self.assertEqual(list(df['gender']), ['femn'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+"""
+Тесты для компактного префиксного дерева.
+"""
+
+import os
+import sys
+import unittest
+
+# Добавляем корневой каталог проекта в путь поиска модулей
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.morpho_analyzer.compact_trie import CompactPrefixTree
+from src.morpho_analyzer.trie import PrefixTree
+
+
+class TestCompactPrefixTree(unittest.TestCase):
+    """
+    Набор тестов для класса компактного префиксного дерева.
+    """
+
+    def setUp(self):
+        """
+        Подготовка к тестам.
+        """
+        self.words = [
+            (["мо", "ло", "ко"], {"word": "молоко", "pos": "NOUN"}),
+            (["мо", "ло", "дой"], {"word": "молодой", "pos": "ADJF"}),
+            (["мо", "ре"], {"word": "море", "pos": "NOUN"}),
+            (["мо", "ло", "ко"], {"word": "Молоко", "pos": "NOUN"}),
+            (["ре", "ка"], {"word": "река", "pos": "NOUN"}),
+        ]
+        self.trie = CompactPrefixTree()
+        for syllables, word_data in self.words:
+            self.trie.insert(syllables, word_data)
+
+    def test_search(self):
+        """
+        Тест поиска слова в дереве.
+        """
+        result = self.trie.search(["мо", "ло", "ко"])
+        self.assertEqual([item["word"] for item in result], ["молоко", "Молоко"])
+
+        # Префикс и несуществующие слова не находятся
+        self.assertIsNone(self.trie.search(["мо", "ло"]))
+        self.assertIsNone(self.trie.search(["ко", "ло", "мо"]))
+        self.assertIsNone(self.trie.search(["ка"]))
+
+    def test_starts_with_prefix(self):
+        """
+        Тест поиска слов по префиксу.
+        """
+        self.assertEqual(len(self.trie.starts_with_prefix(["мо"])), 3)
+        self.assertEqual(len(self.trie.starts_with_prefix(["мо", "ло"])), 2)
+        self.assertEqual(self.trie.starts_with_prefix(["не"]), [])
+
+        syllables = sorted(tuple(s) for s, _ in self.trie.starts_with_prefix(["мо", "ло"]))
+        self.assertEqual(syllables, [("мо", "ло", "дой"), ("мо", "ло", "ко")])
+
+    def test_matches_prefix_tree(self):
+        """
+        Тест совпадения результатов с классическим префиксным деревом.
+        """
+        reference = PrefixTree()
+        for syllables, word_data in self.words:
+            reference.insert(syllables, word_data)
+
+        def normalize(words):
+            return sorted((tuple(s), [d["word"] for d in data]) for s, data in words)
+
+        self.assertEqual(normalize(self.trie.get_all_words()), normalize(reference.get_all_words()))
+
+        stats = self.trie.get_statistics()
+        expected = reference.get_statistics()
+        for key in ('word_count', 'node_count', 'max_depth', 'level_distribution', 'avg_branching'):
+            self.assertEqual(stats[key], expected[key])
+        self.assertEqual(dict(stats['most_common_syllables']), dict(expected['most_common_syllables']))
+
+    def test_statistics_ties(self):
+        """
+        Тест совпадения самых частых слогов с PrefixTree при равных частотах.
+        """
+        words = [["ко", "ра"], ["ба", "ра"], ["ко", "ба"], ["ба", "ко"], ["ра"], ["ра", "ба"], ["ко"]]
+        trie = CompactPrefixTree()
+        reference = PrefixTree()
+        for syllables in words:
+            trie.insert(syllables)
+            reference.insert(syllables)
+
+        self.assertEqual(trie.get_statistics(), reference.get_statistics())
+        self.assertEqual(trie.get_statistics(top_n=2)['most_common_syllables'],
+                         reference.get_statistics(top_n=2)['most_common_syllables'])
+        self.assertEqual(trie.get_statistics()['most_common_syllables'],
+                         [("ба", 4), ("ко", 4), ("ра", 4)])
+
+    def test_deduplicated_payloads(self):
+        """
+        Тест хранения совпадающих данных слова один раз со счетчиком.
+        """
+        self.trie.insert(["мо", "ре"], {"word": "море", "pos": "NOUN"}, position=10)
+
+        self.assertEqual(self.trie.search(["мо", "ре"]), [{"word": "море", "pos": "NOUN"}])
+        self.assertEqual(self.trie.search_occurrences(["мо", "ре"]),
+                         [({"word": "море", "pos": "NOUN"}, 2, [10])])
+        self.assertIsNone(self.trie.search_occurrences(["мо", "ло"]))
+
+    def test_insert_without_data(self):
+        """
+        Тест вставки слова без данных (только счетчики).
+        """
+        trie = CompactPrefixTree()
+        trie.insert(["мо", "ре"])
+        self.assertEqual(trie.word_count, 1)
+        self.assertEqual(trie.search(["мо", "ре"]), [])
+        self.assertEqual(len(trie), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,236 @@
+"""
+Тесты для главного скрипта.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+import unittest.mock
+
+# Добавляем корневой каталог проекта в путь поиска модулей
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, SRC_DIR)
+
+from src.main import (OUTPUT_FORMATS, create_homonym_trace, main, parse_fraction, parse_outputs,
+                      parse_results_formats)
+
+# Библиотеки, которые не должны загружаться без графиков и Excel
+HEAVY_MODULES = ('matplotlib', 'networkx', 'numpy', 'pandas', 'pyvis')
+
+# Код, печатающий загруженные тяжелые библиотеки
+LOADED_HEAVY = ("print('loaded:' + ','.join(sorted(name for name in {heavy!r} if name in sys.modules)))"
+                .format(heavy=HEAVY_MODULES))
+
+
+class TestMain(unittest.TestCase):
+    """
+    Набор тестов для главного скрипта.
+    """
+
+    def run_python(self, code: str) -> str:
+        """
+        Выполняет код в новом процессе интерпретатора из каталога src.
+
+        Args:
+            code: Код для выполнения
+
+        Returns:
+            Последняя строка вывода
+        """
+        result = subprocess.run([sys.executable, '-c', code], cwd=SRC_DIR, check=True,
+                                capture_output=True, text=True)
+        return result.stdout.strip().splitlines()[-1]
+
+    def test_parse_outputs(self):
+        """
+        Тест разбора списка видов результатов.
+        """
+        self.assertEqual(parse_outputs("json, excel"), {'json', 'excel'})
+        self.assertEqual(parse_outputs("all"), set(OUTPUT_FORMATS))
+
+        with self.assertRaises(argparse.ArgumentTypeError):
+            parse_outputs("json,pdf")
+        with self.assertRaises(argparse.ArgumentTypeError):
+            parse_outputs(",")
+
+    def test_parse_results_formats(self):
+        """
+        Тест разбора форматов результатов с учетом установленных пакетов.
+        """
+        self.assertEqual(parse_results_formats('json,jsonl'), {'json', 'jsonl'})
+
+        with unittest.mock.patch('src.main.format_available', side_effect=lambda name: name != 'parquet'):
+            # "all" - только доступные форматы
+            self.assertEqual(parse_results_formats('all'), {'json', 'jsonl', 'msgpack'})
+            self.assertEqual(parse_results_formats('json,msgpack'), {'json', 'msgpack'})
+
+            # Явно указанный формат без пакета - ошибка с подсказкой установки
+            with self.assertRaisesRegex(argparse.ArgumentTypeError, 'pip install pyarrow'):
+                parse_results_formats('json,parquet')
+
+
+    def test_trace_sample(self):
+        """
+        Тест проверки доли событий трассировки до открытия файла.
+        """
+        self.assertEqual(parse_fraction("0.25"), 0.25)
+        for value in ("1.5", "-0.1", "треть"):
+            with self.assertRaises(argparse.ArgumentTypeError):
+                parse_fraction(value)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            args = argparse.Namespace(trace_homonyms=os.path.join(temp_dir, 'trace.jsonl'), trace_sample=-0.5)
+            with self.assertRaises(ValueError):
+                create_homonym_trace(args)
+
+            args.trace_sample = 0.5
+            file_sink, trace = create_homonym_trace(args)
+            self.assertIs(trace.sink, file_sink)
+            file_sink.close()
+
+    def test_import_is_light(self):
+        """
+        Тест отсутствия тяжелых библиотек при импорте главного скрипта.
+        """
+        loaded = self.run_python("import sys\nimport main\n" + LOADED_HEAVY)
+        self.assertEqual(loaded, 'loaded:')
+
+    def test_json_only_run(self):
+        """
+        Тест запуска только с результатами JSON.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = os.path.join(temp_dir, 'input.txt')
+            with open(input_path, 'w', encoding='utf-8') as f:
+                f.write("Девушка заплела длинную косу. Острая коса лежит в траве.")
+
+            output_dir = os.path.join(temp_dir, 'output')
+            code = ("import sys\nimport main\n"
+                    f"sys.argv = ['main.py', '-i', {input_path!r}, '-o', {output_dir!r}, '--outputs', 'json']\n"
+                    "main.main()\n" + LOADED_HEAVY)
+
+            self.assertEqual(self.run_python(code), 'loaded:')
+            self.assertEqual(os.listdir(output_dir), ['analysis_results.json'])
+
+
+    def test_stream_binary_trie(self):
+        """
+        Тест сохранения двоичного дерева в потоковом режиме.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = os.path.join(temp_dir, 'input.txt')
+            with open(input_path, 'w', encoding='utf-8') as f:
+                f.write("Мама мыла раму. Мама спала.")
+
+            output_dir = os.path.join(temp_dir, 'output')
+            code = ("import sys\nimport main\n"
+                    f"sys.argv = ['main.py', '-i', {input_path!r}, '-o', {output_dir!r}, '--stream', "
+                    "'--binary-trie', '--outputs', 'json']\n"
+                    "main.main()\n"
+                    "from morpho_analyzer.trie import PrefixTree\n"
+                    f"with PrefixTree.open_binary({os.path.join(output_dir, 'trie.bin')!r}) as trie:\n"
+                    "    print(trie.word_count)")
+
+            self.assertEqual(self.run_python(code), '5')
+            self.assertEqual(sorted(os.listdir(output_dir)), ['analysis_results.jsonl', 'trie.bin'])
+
+    def test_stream_results_format_notice(self):
+        """
+        Тест сообщения о формате результатов в потоковом режиме.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = os.path.join(temp_dir, 'input.txt')
+            with open(input_path, 'w', encoding='utf-8') as f:
+                f.write("Мама мыла раму.")
+            output_dir = os.path.join(temp_dir, 'output')
+
+            for results_format, expected in (('json,jsonl', True), ('jsonl', False)):
+                argv = ['main.py', '-i', input_path, '-o', output_dir, '--stream', '--outputs', 'json',
+                        '--results-format', results_format]
+                output = io.StringIO()
+                with unittest.mock.patch('sys.argv', argv), contextlib.redirect_stdout(output):
+                    main()
+                self.assertEqual('--results-format игнорируется' in output.getvalue(), expected)
+                self.assertEqual(os.listdir(output_dir), ['analysis_results.jsonl'])
+
+
+    def test_failed_output_exit_code(self):
+        """
+        Тест кода завершения при ошибке одного из приемников.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = os.path.join(temp_dir, 'input.txt')
+            with open(input_path, 'w', encoding='utf-8') as f:
+                f.write("Мама мыла раму.")
+            output_dir = os.path.join(temp_dir, 'output')
+            argv = ['main.py', '-i', input_path, '-o', output_dir, '--outputs', 'report,json']
+            results = [('report', [os.path.join(output_dir, 'analysis_report.md')], 0.1, None),
+                       ('json', [], 0.2, "OSError: диск заполнен")]
+
+            output, errors = io.StringIO(), io.StringIO()
+            with unittest.mock.patch('sys.argv', argv), \
+                    unittest.mock.patch('src.main.render_sinks', return_value=results), \
+                    contextlib.redirect_stdout(output), contextlib.redirect_stderr(errors):
+                self.assertEqual(main(), 1)
+            self.assertIn("ОШИБКА: OSError: диск заполнен", output.getvalue())
+            self.assertIn("Не удалось создать результаты: json", errors.getvalue())
+
+            with unittest.mock.patch('sys.argv', argv), contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(main(), 0)
+
+
+    def test_trace_closed_on_error(self):
+        """
+        Тест закрытия файла трассировки при ошибке анализа.
+        """
+        def failing_analysis(tokens, analyzer=None, **kwargs):
+            analyzer.trace({'word': tokens[0]})
+            raise RuntimeError("сбой анализа")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = os.path.join(temp_dir, 'input.txt')
+            with open(input_path, 'w', encoding='utf-8') as f:
+                f.write("Мама мыла раму.")
+            trace_path = os.path.join(temp_dir, 'trace.jsonl')
+            argv = ['main.py', '-i', input_path, '-o', os.path.join(temp_dir, 'output'),
+                    '--outputs', 'json', '--trace-homonyms', trace_path]
+
+            with unittest.mock.patch('sys.argv', argv), \
+                    unittest.mock.patch('src.main.analyze_tokens_parallel', failing_analysis), \
+                    contextlib.redirect_stdout(io.StringIO()), \
+                    self.assertRaises(RuntimeError):
+                main()
+
+            # Событие, записанное до ошибки, сброшено в файл
+            with open(trace_path, encoding='utf-8') as f:
+                self.assertEqual(f.read(), '{"word": "Мама"}\n')
+
+    def test_stream_trie_depth(self):
+        """
+        Тест глубины визуализации дерева в потоковом режиме.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = os.path.join(temp_dir, 'input.txt')
+            with open(input_path, 'w', encoding='utf-8') as f:
+                f.write("Девушка заплела длинную косу. Острая коса лежит в траве у молодого дерева.")
+
+            sizes = {}
+            for depth in (1, 5):
+                output_dir = os.path.join(temp_dir, f'depth{depth}')
+                # pyvis создает служебную папку lib в текущем каталоге
+                subprocess.run([sys.executable, os.path.join(SRC_DIR, 'main.py'), '-i', input_path,
+                                '-o', output_dir, '--stream', '--outputs', 'html', '-d', str(depth)],
+                               cwd=temp_dir, check=True, capture_output=True)
+                sizes[depth] = os.path.getsize(os.path.join(output_dir, 'trie_interactive.html'))
+
+            self.assertLess(sizes[1], sizes[5])
+
+if __name__ == '__main__':
+    unittest.main()
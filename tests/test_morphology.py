@@ -2,14 +2,18 @@
 Тесты для модуля морфологического анализа.
 """
 
+import json
 import os
+import subprocess
 import sys
+import tempfile
 import unittest
 
 # Добавляем корневой каталог проекта в путь поиска модулей
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.morpho_analyzer.morphology import MorphologicalAnalyzer
+from src.morpho_analyzer.morphology import (ContextWindow, MorphologicalAnalyzer, get_morph_analyzer,
+                                           get_shared_analyzer, preload)
 
 
 class TestMorphologicalAnalyzer(unittest.TestCase):
@@ -79,6 +83,216 @@ class TestMorphologicalAnalyzer(unittest.TestCase):
         result = self.analyzer.analyze_token_with_homonym_resolution("стекло", prev_words, next_words)
         self.assertEqual(result['pos'], "VERB")
     
+    def test_parse_cache(self):
+        """
+        Тест кэша разборов: счетчики и защита от изменения результатов.
+        """
+        self.analyzer.clear_parse_cache()
+
+        first = self.analyzer.analyze_word("Книга")
+        second = self.analyzer.analyze_word("книга,")
+        info = self.analyzer.parse_cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+
+        # Исходная форма слова сохраняется, разбор берется из кэша
+        self.assertEqual(first['word'], "Книга")
+        self.assertEqual(second['word'], "книга,")
+        self.assertEqual(first['lemma'], second['lemma'])
+
+        # Изменение возвращенного словаря не влияет на последующие результаты
+        first['syllables'] = ['кни', 'га']
+        first['tags']['case'] = 'broken'
+        third = self.analyzer.analyze_word("книга")
+        self.assertNotIn('syllables', third)
+        self.assertEqual(third['tags']['case'], 'nomn')
+
+        # Снятие омонимии для слов вне словаря омонимов использует тот же кэш
+        self.analyzer.resolve_homonymy("книга", ["читать"])
+        self.assertEqual(self.analyzer.parse_cache_info().hits, 3)
+
+    def test_parse_cache_bounded(self):
+        """
+        Тест ограничения размера кэша разборов.
+        """
+        analyzer = MorphologicalAnalyzer(parse_cache_size=2)
+        for word in ["книга", "стол", "окно", "дом"]:
+            analyzer.analyze_word(word)
+        self.assertEqual(analyzer.parse_cache_info().currsize, 2)
+
+    def test_shared_dictionaries(self):
+        """
+        Тест общих для процесса словарей и анализатора.
+        """
+        other = MorphologicalAnalyzer()
+        self.assertIs(other.analyzer, self.analyzer.analyzer)
+        self.assertIs(other.analyzer, get_morph_analyzer())
+        self.assertIs(other.homonyms_dict, self.analyzer.homonyms_dict)
+        
+        # Общий анализатор создается один раз
+        shared = get_shared_analyzer()
+        self.assertIs(get_shared_analyzer(), shared)
+        self.assertIs(preload(freeze=False), shared)
+    
+    def test_lazy_import(self):
+        """
+        Тест отложенного импорта pymorphy2.
+        """
+        root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        code = ("import sys\n"
+                "from src.morpho_analyzer.morphology import MorphologicalAnalyzer\n"
+                "analyzer = MorphologicalAnalyzer()\n"
+                "assert 'pymorphy2' not in sys.modules\n"
+                "assert analyzer.analyze_word('книга')['pos'] == 'NOUN'\n"
+                "assert 'pymorphy2' in sys.modules\n")
+        subprocess.run([sys.executable, '-c', code], cwd=root, check=True)
+    
+    def test_tag_cache(self):
+        """
+        Тест кэша граммем по строке тега.
+        """
+        analyzer = MorphologicalAnalyzer(parse_cache_size=0)
+        
+        # Слова с одинаковым тегом получают один и тот же кортеж граммем
+        _, pos, tags = analyzer._parse_cached("книга")
+        _, _, same_tags = analyzer._parse_cached("лампа")
+        self.assertEqual(pos, "NOUN")
+        self.assertIs(tags, same_tags)
+        self.assertEqual(len(analyzer._tag_cache), 1)
+        
+        # Содержимое совпадает с прямым извлечением из тега pymorphy2
+        tag = analyzer.analyzer.parse("книга")[0].tag
+        self.assertEqual(dict(tags), analyzer._extract_tags(tag))
+        self.assertTrue(all(type(value) is str for _, value in tags if value is not None))
+    
+    def test_homonym_trace(self):
+        """
+        Тест структурированной трассировки решений при снятии омонимии.
+        """
+        events = []
+        analyzer = MorphologicalAnalyzer(trace=events.append)
+
+        analyzer.resolve_homonymy("коса", ["острая", "коса", "косить", "траву"])
+        analyzer.resolve_homonymy("коса", [])
+        analyzer.resolve_homonymy("книга", ["читать"])
+
+        # Слова вне словаря омонимов не порождают событий
+        self.assertEqual(len(events), 2)
+
+        event = events[0]
+        self.assertEqual(event['word'], "коса")
+        self.assertEqual(event['winner'], 1)
+        self.assertEqual(event['resolved_by'], 'context')
+        self.assertEqual([candidate['score'] for candidate in event['candidates']], [0, 1, 0])
+        self.assertEqual(event['candidates'][1]['markers'], ["косить"])
+
+        event = events[1]
+        self.assertEqual(event['winner'], 0)
+        self.assertEqual(event['resolved_by'], 'default')
+        self.assertEqual(len(event['candidates']), 3)
+
+        # Без приемника результат тот же
+        self.assertEqual(self.analyzer.resolve_homonymy("коса", ["косить"]),
+                         analyzer.resolve_homonymy("коса", ["косить"]))
+
+    def test_homonym_index(self):
+        """
+        Тест индекса маркеров омонимов.
+        """
+        homonyms = {
+            "лук": [
+                {"lemma": "лук", "pos": "NOUN", "tags": {"sense": "растение"},
+                 "markers": ["грядка", "зеленый", "суп"]},
+                {"lemma": "лук", "pos": "NOUN", "tags": {"sense": "оружие"},
+                 "markers": ["стрела", "тетива", "зеленый", "охота"]}
+            ],
+            "пусто": []
+        }
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'homonyms.json')
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(homonyms, f, ensure_ascii=False)
+            analyzer = MorphologicalAnalyzer(homonyms_file=path)
+        
+        # Общий маркер указывает на оба варианта
+        _, markers_index = analyzer._homonym_index["лук"]
+        self.assertEqual(markers_index["зеленый"], ((0, 1), (1, 2)))
+        
+        # Контекст очищается, повторы слов контекста не увеличивают оценку
+        result = analyzer.resolve_homonymy("Лук,", ["Стрела!", "стрела", "тетива", "суп"])
+        self.assertEqual(result['sense'], "оружие")
+        self.assertEqual(result['word'], "Лук,")
+        
+        # При равных оценках выбирается первый вариант
+        self.assertEqual(analyzer.resolve_homonymy("лук", ["зеленый"])['sense'], "растение")
+        self.assertEqual(analyzer.resolve_homonymy("лук", ["дом"])['sense'], "растение")
+        
+        # Омоним без вариантов анализируется как обычное слово
+        self.assertNotIn('sense', analyzer.resolve_homonymy("пусто", ["суп"]))
+    
+    def test_analyze_tokens(self):
+        """
+        Тест пакетного анализа со скользящим окном контекста.
+        """
+        tokens = ("острая коса , косить траву . Девушка заплела длинную косу , "
+                  "коса до пояса . abc коса").split()
+        
+        def expected(tokens, start, end, window):
+            # Анализ каждого слова с явно вырезанным контекстом
+            results = []
+            for i in range(start, end):
+                if tokens[i][0].isalpha():
+                    results.append(self.analyzer.analyze_token_with_homonym_resolution(
+                        tokens[i], tokens[max(0, i - window):i], tokens[i + 1:i + 1 + window]))
+            return results
+        
+        for window in (0, 1, 3, 5):
+            self.assertEqual(self.analyzer.analyze_tokens(tokens, window=window),
+                             expected(tokens, 0, len(tokens), window))
+            self.assertEqual(list(self.analyzer.iter_analyze_tokens(iter(tokens[:2]), window=window)),
+                             expected(tokens, 0, 2, window))
+        
+        # Токены до и после используются только как контекст
+        result = self.analyzer.analyze_tokens(tokens[4:9], window=3, before=tokens[:4], after=tokens[9:])
+        self.assertEqual(result, expected(tokens, 4, 9, 3))
+        
+        # Знаки препинания не анализируются
+        self.assertEqual(len(self.analyzer.analyze_tokens(tokens)),
+                         len([token for token in tokens if token[0].isalpha()]))
+    
+    def test_analyze_text(self):
+        """
+        Тест разбиения текста на предложения и позиций слов в них.
+        """
+        text = "— Мама мыла раму! Кот спал?! 12 abcдом\nбез точки"
+        result = self.analyzer.analyze_text(text)
+
+        self.assertEqual([(item['word'], item['position'], item['sentence']) for item in result], [
+            ("мама", 0, "— Мама мыла раму"), ("мыла", 1, "— Мама мыла раму"),
+            ("раму", 2, "— Мама мыла раму"),
+            ("кот", 0, "Кот спал"), ("спал", 1, "Кот спал"),
+            ("дом", 0, "12 abcдом\nбез точки"), ("без", 1, "12 abcдом\nбез точки"),
+            ("точки", 2, "12 abcдом\nбез точки"),
+        ])
+        self.assertEqual(self.analyzer.analyze_text("...!"), [])
+    
+    def test_context_window(self):
+        """
+        Тест окна контекста.
+        """
+        window = ContextWindow(2, self.analyzer._clean_word)
+        window.remember("Утро")
+        
+        self.assertIsNone(window.push("Коса,"))
+        self.assertIsNone(window.push("!"))
+        entry = window.push("Трава")
+        self.assertEqual(entry, ["Коса,", True, "коса"])
+        self.assertEqual(window.context(), ["утро", "", "трава"])
+        
+        self.assertEqual(window.advance()[0], "!")
+        self.assertEqual(window.context(), ["утро", "коса", "трава"])
+    
     def test_analyze_token(self):
         """
         Тест анализа токена с очисткой.
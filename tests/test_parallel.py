@@ -0,0 +1,78 @@
+"""
+Тесты для модуля параллельного морфологического анализа.
+"""
+
+import os
+import sys
+import unittest
+
+# Добавляем корневой каталог проекта в путь поиска модулей
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.morpho_analyzer.morphology import MorphologicalAnalyzer
+from src.morpho_analyzer.parallel import (
+    analyze_token_range,
+    analyze_tokens_parallel,
+    split_into_chunks
+)
+
+
+class TestParallelAnalysis(unittest.TestCase):
+    """
+    Набор тестов для параллельного анализа токенов.
+    """
+
+    def setUp(self):
+        """
+        Подготовка к тестам.
+        """
+        self.tokens = ("Мы медленно смотрели как вода стекло по стене а потом "
+                       "прозрачное стекло разбилось и осколки стекло собрали . "
+                       "Русская печь горячая а мама будет печь пироги").split()
+
+    def test_split_into_chunks(self):
+        """
+        Тест разбиения токенов на фрагменты с перекрытием.
+        """
+        tokens = [str(i) for i in range(10)]
+        chunks = split_into_chunks(tokens, chunk_size=4, context_size=3)
+
+        self.assertEqual(len(chunks), 3)
+
+        # Основные части фрагментов покрывают все токены ровно один раз
+        cores = []
+        for window, start, end in chunks:
+            cores.extend(window[start:end])
+        self.assertEqual(cores, tokens)
+
+        # Средний фрагмент содержит по 3 токена контекста с каждой стороны
+        window, start, end = chunks[1]
+        self.assertEqual(window, tokens[1:11])
+        self.assertEqual((start, end), (3, 7))
+
+    def test_parallel_matches_serial(self):
+        """
+        Тест совпадения параллельного и последовательного анализа.
+        """
+        analyzer = MorphologicalAnalyzer()
+        expected = analyze_token_range(analyzer, self.tokens, 0, len(self.tokens))
+
+        # Маленькие фрагменты, чтобы омонимы попадали на границы
+        result = analyze_tokens_parallel(self.tokens, workers=2, chunk_size=3)
+        self.assertEqual(result, expected)
+
+        serial = analyze_tokens_parallel(self.tokens, workers=1, chunk_size=5, analyzer=analyzer)
+        self.assertEqual(serial, expected)
+
+    def test_progress_callback(self):
+        """
+        Тест отчета о прогрессе по всем токенам.
+        """
+        processed = []
+        analyze_tokens_parallel(self.tokens, workers=1, chunk_size=4,
+                                progress=processed.append)
+        self.assertEqual(sum(processed), len(self.tokens))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Тесты для пакетного преобразования PDF в текст.
+"""
+
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+# Добавляем корневой каталог проекта в путь поиска модулей
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pdf_to_text import MANIFEST_NAME, collect_pdfs, convert_batch, load_manifest
+from src.morpho_analyzer.text_processor import iter_pdf_pages
+
+# Пример PDF-файла из входных данных проекта
+SAMPLE_PDF = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data', 'input',
+                                          'Исходный текст 1.pdf'))
+
+
+class TestPdfToText(unittest.TestCase):
+    """
+    Набор тестов для пакетного преобразования PDF.
+    """
+
+    def setUp(self):
+        """
+        Подготовка к тестам: папка с PDF-файлами во вложенных директориях.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.input_dir = os.path.join(self.temp_dir.name, 'input')
+        self.output_dir = os.path.join(self.temp_dir.name, 'output')
+        os.makedirs(os.path.join(self.input_dir, 'том 2'))
+        self.manifest = os.path.join(self.output_dir, MANIFEST_NAME)
+
+    def tearDown(self):
+        """
+        Удаление временных файлов.
+        """
+        self.temp_dir.cleanup()
+
+    def test_collect_pdfs(self):
+        """
+        Тест поиска файлов в папках и по шаблонам.
+        """
+        for name in ('a.pdf', os.path.join('том 2', 'b.PDF'), 'c.txt'):
+            with open(os.path.join(self.input_dir, name), 'wb'):
+                pass
+
+        jobs = collect_pdfs([self.input_dir, os.path.join(self.input_dir, '*.pdf')], self.output_dir)
+        self.assertEqual([os.path.relpath(output, self.output_dir) for _, output in jobs],
+                         ['a.txt', os.path.join('том 2', 'b.txt')])
+
+        # Без директории результатов текст сохраняется рядом с PDF
+        jobs = collect_pdfs([os.path.join(self.input_dir, '**', '*.PDF')])
+        self.assertEqual(jobs, [(os.path.join(self.input_dir, 'том 2', 'b.PDF'),
+                                 os.path.join(self.input_dir, 'том 2', 'b.txt'))])
+
+    @unittest.skipUnless(os.path.exists(SAMPLE_PDF) and importlib.util.find_spec('PyPDF2'),
+                         "нет примера PDF или пакета PyPDF2")
+    def test_convert_batch_cache(self):
+        """
+        Тест преобразования и пропуска неизмененных файлов.
+        """
+        pdf_path = os.path.join(self.input_dir, 'том 2', 'текст.pdf')
+        shutil.copyfile(SAMPLE_PDF, pdf_path)
+        jobs = collect_pdfs([self.input_dir], self.output_dir)
+        lines = []
+
+        results = convert_batch(jobs, self.manifest, workers=1, report=lines.append)
+        self.assertEqual([result['status'] for result in results], ['converted'])
+        self.assertIn('стр/с', lines[0])
+
+        output_path = jobs[0][1]
+        pages = list(iter_pdf_pages(SAMPLE_PDF, workers=1))
+        with open(output_path, encoding='utf-8') as f:
+            self.assertEqual(f.read(), ''.join(page + '\n' for page in pages))
+        self.assertEqual(results[0]['pages'], len(pages))
+        self.assertIn(os.path.abspath(pdf_path), load_manifest(self.manifest))
+
+        # Текст новее PDF
+        results = convert_batch(jobs, self.manifest, workers=1, report=lines.append)
+        self.assertEqual([result['status'] for result in results], ['fresh'])
+
+        # PDF перезаписан без изменений - совпадает хэш из манифеста
+        future = time.time() + 10
+        os.utime(pdf_path, (future, future))
+        results = convert_batch(jobs, self.manifest, workers=1, report=lines.append)
+        self.assertEqual([result['status'] for result in results], ['cached'])
+
+        results = convert_batch(jobs, self.manifest, workers=1, force=True, report=lines.append)
+        self.assertEqual([result['status'] for result in results], ['converted'])
+
+    def test_convert_batch_error(self):
+        """
+        Тест обработки поврежденного файла: ошибка не прерывает пакет.
+        """
+        with open(os.path.join(self.input_dir, 'broken.pdf'), 'wb') as f:
+            f.write(b'not a pdf')
+
+        jobs = collect_pdfs([self.input_dir], self.output_dir)
+        results = convert_batch(jobs, self.manifest, workers=1, report=lambda line: None)
+        self.assertEqual([result['status'] for result in results], ['error'])
+        self.assertFalse(os.path.exists(jobs[0][1]))
+        self.assertEqual(load_manifest(self.manifest), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Тесты для модуля потоковой обработки текста.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Добавляем корневой каталог проекта в путь поиска модулей
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.morpho_analyzer.morphology import MorphologicalAnalyzer
+from src.morpho_analyzer.parallel import analyze_token_range
+from src.morpho_analyzer.pipeline import (
+    JsonLinesWriter,
+    StreamAggregates,
+    iter_analyzed_tokens,
+    iter_syllabified,
+    run_stream
+)
+from src.morpho_analyzer.syllables import get_syllabification_stats
+
+
+class TestStreamingPipeline(unittest.TestCase):
+    """
+    Набор тестов для потоковых этапов обработки.
+    """
+
+    def setUp(self):
+        """
+        Подготовка к тестам.
+        """
+        self.analyzer = MorphologicalAnalyzer()
+        self.tokens = ("прозрачное стекло разбилось , а вода медленно стекло по стене . "
+                       "Мама будет печь пироги").split()
+
+    def test_iter_analyzed_tokens_matches_batch(self):
+        """
+        Тест совпадения потокового анализа с анализом полного списка токенов.
+        """
+        expected = analyze_token_range(self.analyzer, self.tokens, 0, len(self.tokens))
+        result = list(iter_analyzed_tokens(iter(self.tokens), self.analyzer))
+        self.assertEqual(result, expected)
+
+        # Короткий поток, в котором контекст меньше окна
+        expected = analyze_token_range(self.analyzer, self.tokens[:2], 0, 2)
+        result = list(iter_analyzed_tokens(iter(self.tokens[:2]), self.analyzer))
+        self.assertEqual(result, expected)
+
+    def test_aggregates(self):
+        """
+        Тест накопления статистики без хранения результатов анализа.
+        """
+        items = iter_syllabified(iter_analyzed_tokens(self.tokens, self.analyzer))
+        aggregates = run_stream(items)
+
+        words = [token for token in self.tokens if token[0].isalpha()]
+        self.assertEqual(aggregates.word_count, len(words))
+        self.assertEqual(sum(aggregates.pos_counts.values()), len(words))
+        self.assertEqual(aggregates.syllable_stats.result(), get_syllabification_stats(words))
+
+        # Дерево хранит только счетчики, без данных о словах
+        self.assertEqual(aggregates.trie.word_count, len(words))
+        self.assertEqual(aggregates.trie.search(['сте', 'кло']), [])
+
+    def test_json_lines_writer(self):
+        """
+        Тест построчной записи результатов в JSON Lines.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'results.jsonl')
+            items = list(iter_syllabified(iter_analyzed_tokens(self.tokens, self.analyzer)))
+
+            with JsonLinesWriter(path) as writer:
+                run_stream(items, writers=[writer], aggregates=StreamAggregates())
+
+            with open(path, encoding='utf-8') as f:
+                loaded = [json.loads(line) for line in f]
+
+            self.assertEqual(loaded, items)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+Тесты для модуля записи и чтения результатов анализа.
+"""
+
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Добавляем корневой каталог проекта в путь поиска модулей
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.morpho_analyzer.results import build_results, load_results, write_results
+from src.morpho_analyzer.syllables import get_syllabification_stats, split_into_syllables
+from src.morpho_analyzer.trie import PrefixTree
+
+
+class TestResults(unittest.TestCase):
+    """
+    Набор тестов для файлов результатов.
+    """
+
+    def setUp(self):
+        """
+        Подготовка к тестам.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        words = ["мама", "мыла", "раму", "мама", "рама"]
+        self.analyzed_text = [{'word': word, 'lemma': word, 'pos': 'NOUN',
+                               'tags': {'case': 'nomn', 'tense': None},
+                               'syllables': split_into_syllables(word)} for word in words]
+        self.syllable_stats = get_syllabification_stats(words)
+        self.trie = PrefixTree()
+        for item in self.analyzed_text:
+            self.trie.insert(item['syllables'], item)
+
+    def tearDown(self):
+        """
+        Удаление временных файлов.
+        """
+        self.temp_dir.cleanup()
+
+    def assert_round_trip(self, result_format: str):
+        """
+        Проверяет запись и чтение результатов в заданном формате.
+        """
+        path = os.path.join(self.temp_dir.name, 'results.' + result_format)
+        write_results(path, self.analyzed_text, self.syllable_stats, self.trie, result_format)
+
+        analyzed_text, _, trie = load_results(path)
+
+        self.assertEqual(analyzed_text, self.analyzed_text)
+        self.assertEqual(trie.get_all_words(), self.trie.get_all_words())
+        self.assertEqual(trie.get_statistics(), self.trie.get_statistics())
+
+        # Данные слов дерева - объекты из списка результатов, а не копии;
+        # повторное вхождение хранится счетчиком
+        occurrences = trie.search_occurrences(self.analyzed_text[0]['syllables'])
+        self.assertEqual(len(occurrences), 1)
+        self.assertIs(occurrences[0][0], analyzed_text[0])
+        self.assertEqual(occurrences[0][1], 2)
+
+    def test_word_refs(self):
+        """
+        Тест ссылок дерева на результаты анализа по номерам.
+        """
+        results = build_results(self.analyzed_text, self.syllable_stats, self.trie)
+        node = results['trie']['root']
+        for syllable in self.analyzed_text[0]['syllables']:
+            node = node['children'][syllable]
+
+        self.assertEqual(node['word_refs'], [0])
+        self.assertEqual(node['word_counts'], [2])
+        self.assertNotIn('word_data', node)
+
+        with self.assertRaises(ValueError):
+            self.trie.serialize(analyses=self.analyzed_text[:2])
+        with self.assertRaises(ValueError):
+            PrefixTree.deserialize(results['trie'])
+
+    def test_json(self):
+        """
+        Тест компактного JSON.
+        """
+        self.assert_round_trip('json')
+
+        with open(os.path.join(self.temp_dir.name, 'results.json'), encoding='utf-8') as f:
+            text = f.read()
+        self.assertNotIn('\n', text)
+        self.assertNotIn('word_data', text)
+
+    def test_jsonl(self):
+        """
+        Тест JSON Lines: строка на слово, дерево восстанавливается при чтении.
+        """
+        self.assert_round_trip('jsonl')
+
+        with open(os.path.join(self.temp_dir.name, 'results.jsonl'), encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        self.assertEqual([json.loads(line) for line in lines], self.analyzed_text)
+
+    @unittest.skipUnless(importlib.util.find_spec('msgpack'), "пакет msgpack не установлен")
+    def test_msgpack(self):
+        """
+        Тест MessagePack.
+        """
+        self.assert_round_trip('msgpack')
+
+    def test_legacy_json(self):
+        """
+        Тест чтения JSON с копиями данных слов в дереве.
+        """
+        path = os.path.join(self.temp_dir.name, 'legacy.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'analyzed_text': self.analyzed_text, 'syllable_stats': self.syllable_stats,
+                       'trie': self.trie.serialize()}, f, ensure_ascii=False, indent=2)
+
+        analyzed_text, _, trie = load_results(path)
+        self.assertEqual(analyzed_text, self.analyzed_text)
+        self.assertEqual(trie.get_all_words(), self.trie.get_all_words())
+
+    def test_unknown_format(self):
+        """
+        Тест неизвестного формата.
+        """
+        path = os.path.join(self.temp_dir.name, 'results.xml')
+        with self.assertRaises(ValueError):
+            write_results(path, self.analyzed_text, self.syllable_stats, self.trie, 'xml')
+        with self.assertRaises(ValueError):
+            load_results(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+Тесты для модуля приемников результатов.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Добавляем корневой каталог проекта в путь поиска модулей
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.morpho_analyzer.sinks import (SINKS, OutputContext, register_sink, render_sinks,
+                                       select_sinks)
+from src.morpho_analyzer.syllables import get_syllabification_stats, split_into_syllables
+from src.morpho_analyzer.trie import PrefixTree
+
+
+def render_words(context: OutputContext):
+    """
+    Тестовый приемник: список слов дерева.
+    """
+    path = context.path("words.txt")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(item['word'] for item in context.analyzed_text))
+    return [path]
+
+
+def render_broken(context: OutputContext):
+    """
+    Тестовый приемник, завершающийся ошибкой.
+    """
+    raise RuntimeError("нет данных")
+
+
+class TestSinks(unittest.TestCase):
+    """
+    Набор тестов для приемников результатов.
+    """
+
+    def setUp(self):
+        """
+        Подготовка к тестам.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        words = ["мама", "мыла", "раму", "мама"]
+        self.analyzed_text = [{'word': word, 'lemma': word, 'pos': 'NOUN', 'tags': {},
+                               'syllables': split_into_syllables(word)} for word in words]
+        trie = PrefixTree()
+        for item in self.analyzed_text:
+            trie.insert(item['syllables'], item)
+        self.context = OutputContext(self.temp_dir.name, trie, get_syllabification_stats(words),
+                                     analyzed_text=self.analyzed_text)
+
+    def tearDown(self):
+        """
+        Удаление временных файлов.
+        """
+        self.temp_dir.cleanup()
+
+    def test_select_sinks(self):
+        """
+        Тест выбора приемников по видам результатов.
+        """
+        names = [sink.name for sink in select_sinks(['charts'], self.context)]
+        self.assertEqual(names, ['trie_png', 'pos_png', 'syllables_png', 'trie_stats_png'])
+
+        # Упрощенное дерево строится только по запросу
+        self.assertEqual([sink.name for sink in select_sinks(['html'], self.context)], ['trie_html'])
+        self.context.simplified_max_words = 2
+        self.assertEqual([sink.name for sink in select_sinks(['html'], self.context)],
+                         ['trie_html', 'trie_html_simplified'])
+
+        # В потоковом режиме нет результатов анализа по словам, но дерево есть
+        stream_context = OutputContext(self.temp_dir.name, self.context.trie, self.context.syllable_stats,
+                                       pos_counts={'NOUN': 4}, simplified_max_words=2)
+        names = [sink.name for sink in select_sinks(['charts', 'html', 'report', 'json', 'excel'],
+                                                    stream_context)]
+        self.assertEqual(names, ['trie_png', 'pos_png', 'syllables_png', 'trie_html', 'trie_stats_png',
+                                 'report'])
+
+    def test_render_parallel(self):
+        """
+        Тест параллельного создания результатов.
+        """
+        register_sink('words_txt', 'json', 'список слов')(render_words)
+        try:
+            sinks = select_sinks(['json', 'report'], self.context)
+            sequential_dir = os.path.join(self.temp_dir.name, 'sequential')
+            os.makedirs(sequential_dir)
+
+            results = render_sinks(sinks, self.context, workers=3)
+            self.assertEqual([name for name, _, _, _ in results], ['report', 'json', 'words_txt'])
+            for name, paths, elapsed, error in results:
+                self.assertIsNone(error)
+                self.assertGreaterEqual(elapsed, 0)
+                self.assertTrue(all(os.path.exists(path) for path in paths))
+
+            # Результаты совпадают с последовательным созданием
+            self.context.output_dir = sequential_dir
+            render_sinks(sinks, self.context, workers=1)
+            for filename in ("analysis_report.md", "analysis_results.json", "words.txt"):
+                with open(os.path.join(self.temp_dir.name, filename), encoding='utf-8') as f:
+                    parallel = f.read()
+                with open(os.path.join(sequential_dir, filename), encoding='utf-8') as f:
+                    self.assertEqual(f.read(), parallel)
+
+            with open(os.path.join(sequential_dir, "analysis_results.json"), encoding='utf-8') as f:
+                self.assertEqual(json.load(f)['analyzed_text'], self.analyzed_text)
+        finally:
+            del SINKS['words_txt']
+
+    def test_render_error(self):
+        """
+        Тест ошибки приемника: остальные результаты создаются, ошибка записывается.
+        """
+        register_sink('broken', 'report', 'ошибочный приемник')(render_broken)
+        try:
+            sinks = select_sinks(['json', 'report'], self.context)
+            for workers in (1, 3):
+                results = render_sinks(sinks, self.context, workers=workers)
+                self.assertEqual([name for name, _, _, _ in results], ['report', 'json', 'broken'])
+
+                name, paths, _, error = results[-1]
+                self.assertEqual(paths, [])
+                self.assertEqual(error, "RuntimeError: нет данных")
+
+                for name, paths, _, error in results[:-1]:
+                    self.assertIsNone(error)
+                    self.assertTrue(paths and all(os.path.exists(path) for path in paths))
+        finally:
+            del SINKS['broken']
+
+    def test_register_duplicate(self):
+        """
+        Тест запрета повторной регистрации приемника.
+        """
+        with self.assertRaises(ValueError):
+            register_sink('json', 'json', 'дубликат')(render_words)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -11,10 +11,20 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from src.morpho_analyzer.syllables import (
     split_into_syllables,
+    split_many,
+    split_cached,
+    syllabify_words,
+    syllable_cache_info,
+    clear_syllable_cache,
     split_word_into_syllables_alt,
     get_syllables_count,
     get_syllabification_stats
 )
+from src.morpho_analyzer.text_processor import read_text_file, tokenize_text
+from tests.reference_syllables import split_into_syllables_reference
+
+# Текст, поставляемый вместе с проектом
+CORPUS_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'input', 'Исходный текст 1.txt')
 
 
 class TestSyllables(unittest.TestCase):
@@ -50,6 +60,42 @@ class TestSyllables(unittest.TestCase):
         self.assertEqual(split_into_syllables(""), [''])
         self.assertEqual(split_into_syllables("я"), ['я'])
     
+    def test_split_many_matches_reference(self):
+        """
+        Тест совпадения быстрого пакетного разбиения с эталонной реализацией.
+        """
+        # Все токены исходного текста, включая пунктуацию и слова с заглавными буквами
+        words = tokenize_text(read_text_file(CORPUS_PATH), keep_punctuation=True)
+        words += ["", "я", "пст", "Встреча", "по-русски", "ВЗГЛЯД", "объём", "123"]
+        
+        expected = [split_into_syllables_reference(word) for word in words]
+        self.assertEqual(split_many(words), expected)
+        self.assertEqual([split_into_syllables(word) for word in words], expected)
+        
+        # Результаты для заранее заданных слов не разделяют общий список
+        split_many(["молоко"])[0].append("x")
+        self.assertEqual(split_into_syllables("молоко"), ['мо', 'ло', 'ко'])
+    
+    def test_syllabify_words(self):
+        """
+        Тест разбиения с однократной обработкой каждой словоформы.
+        """
+        clear_syllable_cache()
+        words = ["молоко", "дерево", "молоко", "Молоко", "молоко"]
+        
+        result = syllabify_words(words)
+        self.assertEqual(result, [split_into_syllables(word) for word in words])
+        self.assertEqual(split_cached("молоко"), ('мо', 'ло', 'ко'))
+        
+        # Три различные словоформы разбиваются по одному разу
+        info = syllable_cache_info()
+        self.assertEqual(info.misses, 3)
+        self.assertEqual(info.hits, 3)
+        
+        # Вхождения получают независимые списки
+        result[0].append("x")
+        self.assertEqual(result[2], ['мо', 'ло', 'ко'])
+    
     def test_split_word_into_syllables_alt(self):
         """
         Тест альтернативного алгоритма разделения на слоги.
@@ -101,6 +147,13 @@ class TestSyllables(unittest.TestCase):
         
         # Проверяем, что есть информация о самых частых слогах
         self.assertTrue(len(stats['most_common_syllables']) > 0)
+        
+        # Повторы словоформ учитываются так же, как при разбиении каждого вхождения
+        words = ["молоко", "книга", "молоко", "стол", "книга", "молоко"]
+        stats = get_syllabification_stats(words)
+        self.assertEqual(stats['average_syllables_per_word'], 14 / 6)
+        self.assertEqual(stats['syllables_distribution'], {3: 3, 2: 2, 1: 1})
+        self.assertEqual(stats['most_common_syllables'][0], ('мо', 3))
 
 
 if __name__ == '__main__':
@@ -2,7 +2,9 @@
 Тесты для модуля обработки текста.
 """
 
+import importlib.util
 import os
+import re
 import sys
 import unittest
 import tempfile
@@ -14,9 +16,60 @@ from src.morpho_analyzer.text_processor import (
     read_text_file,
     normalize_text,
     tokenize_text,
-    clean_word
+    clean_word,
+    iter_text_file,
+    iter_tokenize_text,
+    iter_pdf_pages,
+    iter_text_blocks,
+    detect_encoding,
+    tokenize,
+    iter_tokens,
+    iter_token_stream
 )
 
+# Текстовый корпус из входных данных проекта
+SAMPLE_TEXT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data', 'input',
+                                           'Исходный текст 1.txt'))
+
+# Пример PDF-файла из входных данных проекта
+SAMPLE_PDF = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data', 'input',
+                                          'Исходный текст 1.pdf'))
+
+
+def legacy_tokenize(text, keep_punctuation=True):
+    """
+    Прежняя реализация tokenize (эталон для проверки совпадения результатов).
+    """
+    tokens = []
+    if keep_punctuation:
+        for match in re.finditer(r'([^\W\d_]+|\d+|[.,!?;:«»()\[\]{}])', text):
+            token = match.group(0)
+            if token.isspace():
+                continue
+            if re.match(r'[.,!?;:«»()\[\]{}]', token):
+                if tokens and tokens[-1][1] is None:
+                    tokens[-1] = (tokens[-1][0], token)
+                else:
+                    tokens.append(("", token))
+            else:
+                tokens.append((token, None))
+    else:
+        tokens = [(word, None) for word in re.findall(r'[^\W\d_]+|\d+', text)]
+    return tokens
+
+
+def legacy_tokenize_text(text, keep_punctuation=True):
+    """
+    Прежняя реализация tokenize_text (эталон для проверки совпадения результатов).
+    """
+    result = []
+    for token, punct in legacy_tokenize(text, keep_punctuation):
+        if token:
+            result.append(token)
+        if punct and keep_punctuation:
+            result.append(punct)
+    return result
+
 
 class TestTextProcessor(unittest.TestCase):
     """
@@ -70,6 +123,94 @@ class TestTextProcessor(unittest.TestCase):
         tokens = tokenize_text(text, keep_punctuation=False)
         self.assertEqual(tokens, ['Это', 'тестовый', 'текст', 'Проверка', 'обработки', 'текста'])
     
+    def test_tokenizer_matches_legacy(self):
+        """
+        Тест совпадения однопроходного токенизатора с прежней реализацией.
+        """
+        texts = ["", "   ", "!!", "слово,, да.", ",начало", "123abc 2024год", "a_b ё_Ё",
+                 "«Текст» (в скобках)... [x]{y}; ну: что?!", "Дефис-слово — тире", "\tстрока\nновая"]
+        if os.path.exists(SAMPLE_TEXT):
+            with open(SAMPLE_TEXT, encoding='utf-8') as f:
+                texts.append(f.read())
+
+        for text in texts:
+            for keep_punctuation in (True, False):
+                expected = legacy_tokenize(text, keep_punctuation)
+                expected_flat = legacy_tokenize_text(text, keep_punctuation)
+                self.assertEqual(tokenize(text, keep_punctuation), expected)
+                self.assertEqual(list(iter_tokens(text, keep_punctuation)), expected)
+                self.assertEqual(tokenize_text(text, keep_punctuation), expected_flat)
+                self.assertEqual(list(iter_token_stream(text, keep_punctuation)), expected_flat)
+
+    def test_streaming_tokenization(self):
+        """
+        Тест потокового чтения и токенизации текста по частям.
+        """
+        with open(self.temp_file.name, 'a', encoding='utf-8') as f:
+            f.write("\nВторая строка, с запятой.")
+
+        text = read_text_file(self.temp_file.name)
+        blocks = list(iter_text_file(self.temp_file.name, block_size=16))
+        self.assertGreater(len(blocks), 2)
+        self.assertEqual(''.join(blocks), text)
+
+        # Блоки разделены по пробельным символам, токены не разрезаются
+        self.assertTrue(all(block[-1].isspace() for block in blocks[:-1]))
+
+        for keep_punctuation in (True, False):
+            tokens = list(iter_tokenize_text(iter_text_file(self.temp_file.name, block_size=16),
+                                             keep_punctuation))
+            self.assertEqual(tokens, tokenize_text(text, keep_punctuation))
+
+        # Блок без пробелов выдается целиком
+        self.assertEqual(list(iter_text_blocks(self.temp_file.name, block_size=2))[:2], ['Эт', 'о '])
+
+    def test_encoding_detection(self):
+        """
+        Тест определения кодировки по началу файла.
+        """
+        text = "Съешь же ещё этих мягких французских булок.\n" * 100
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'text.txt')
+            for encoding, expected in (('cp1251', 'cp1251'), ('utf-8', 'utf-8'),
+                                       ('utf-8-sig', 'utf-8-sig')):
+                with open(path, 'w', encoding=encoding) as f:
+                    f.write(text)
+                self.assertEqual(detect_encoding(path), expected)
+                self.assertEqual(read_text_file(path), text)
+                self.assertEqual(''.join(iter_text_file(path, block_size=100)), text)
+
+            # Символ UTF-8, разрезанный границей образца, не мешает определению
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            self.assertEqual(detect_encoding(path, sample_size=5), 'utf-8')
+
+            # Явно указанная неверная кодировка
+            with open(path, 'w', encoding='cp1251') as f:
+                f.write(text)
+            with self.assertRaises(UnicodeDecodeError):
+                read_text_file(path, encoding='utf-8')
+            with self.assertRaises(UnicodeDecodeError):
+                list(iter_text_file(path, encoding='utf-8'))
+
+    @unittest.skipUnless(os.path.exists(SAMPLE_PDF) and importlib.util.find_spec('PyPDF2'),
+                         "нет примера PDF или пакета PyPDF2")
+    def test_pdf_pages(self):
+        """
+        Тест постраничного и параллельного извлечения текста PDF.
+        """
+        pages = list(iter_pdf_pages(SAMPLE_PDF, workers=1))
+        self.assertGreater(len(pages), 1)
+        self.assertTrue(all(page.endswith('\n') for page in pages))
+
+        # Параллельное извлечение сохраняет порядок страниц
+        self.assertEqual(read_text_file(SAMPLE_PDF, workers=2), ''.join(pages))
+
+        # Чтение можно прервать после первой страницы
+        blocks = iter_text_file(SAMPLE_PDF, workers=2)
+        self.assertEqual(next(blocks), pages[0])
+        blocks.close()
+
     def test_clean_word(self):
         """
         Тест очистки слова от знаков препинания и приведения к нижнему регистру.
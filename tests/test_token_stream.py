@@ -0,0 +1,94 @@
+"""
+Тесты для модуля потока токенов со смещениями.
+"""
+
+import os
+import sys
+import unittest
+
+# Добавляем корневой каталог проекта в путь поиска модулей
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.morpho_analyzer.text_processor import tokenize_text
+from src.morpho_analyzer.token_stream import TOKEN_NUMBER, TOKEN_PUNCT, TOKEN_WORD, TokenStream
+
+# Текстовый корпус из входных данных проекта
+SAMPLE_TEXT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data', 'input',
+                                           'Исходный текст 1.txt'))
+
+
+class TestTokenStream(unittest.TestCase):
+    """
+    Набор тестов для потока токенов.
+    """
+
+    def setUp(self):
+        """
+        Подготовка к тестам.
+        """
+        self.text = "Мама мыла раму. В 2024 году — снова?! Мама, мама...\nКонец"
+        self.stream = TokenStream(self.text)
+
+    def test_matches_tokenize_text(self):
+        """
+        Тест совпадения токенов с tokenize_text.
+        """
+        texts = [self.text, "", "  ", "a_b ё_Ё «x» (y)"]
+        if os.path.exists(SAMPLE_TEXT):
+            with open(SAMPLE_TEXT, encoding='utf-8') as f:
+                texts.append(f.read())
+
+        for text in texts:
+            for keep_punctuation in (True, False):
+                stream = TokenStream(text, keep_punctuation)
+                self.assertEqual(list(stream), tokenize_text(text, keep_punctuation))
+                self.assertEqual(len(stream), len(tokenize_text(text, keep_punctuation)))
+
+    def test_spans_and_types(self):
+        """
+        Тест смещений и типов токенов.
+        """
+        stream = self.stream
+        self.assertIs(stream.text, self.text)
+        self.assertEqual(stream[0], "Мама")
+        self.assertEqual(stream.span(1), (5, 9))
+        self.assertEqual(self.text[slice(*stream.span(1))], "мыла")
+
+        self.assertEqual(list(stream.types[:6]), [TOKEN_WORD, TOKEN_WORD, TOKEN_WORD, TOKEN_PUNCT,
+                                                  TOKEN_WORD, TOKEN_NUMBER])
+        self.assertEqual([word for _, word in stream.iter_words()][:5], ["Мама", "мыла", "раму", "В", "году"])
+
+        # Надстрочная цифра - часть слова (не \d), арабско-индийская - число
+        stream = TokenStream("x² 5 ٣!", keep_punctuation=False)
+        self.assertEqual(list(stream), ["x²", "5", "٣"])
+        self.assertEqual(list(stream.types), [TOKEN_WORD, TOKEN_NUMBER, TOKEN_NUMBER])
+
+    def test_sentences(self):
+        """
+        Тест разбиения на предложения по знакам конца.
+        """
+        stream = self.stream
+        sentences = [stream.text_span(first, last) for first, last in stream.sentences()]
+        self.assertEqual(sentences, ["Мама мыла раму.", "В 2024 году — снова?!",
+                                     "Мама, мама...", "Конец"])
+
+        self.assertEqual(TokenStream("").sentences(), [])
+        self.assertEqual(TokenStream("!!").sentences(), [(0, 2)])
+
+    def test_concordance(self):
+        """
+        Тест указателя слов и конкорданса.
+        """
+        stream = self.stream
+        self.assertEqual(list(stream.index()["мама"]), [0, 10, 12])
+        self.assertIs(stream.index(), stream.index())
+
+        lines = stream.concordance("МАМА", width=6)
+        self.assertEqual(lines, [("", "Мама", " мыла "), ("ова?! ", "Мама", ", мама"),
+                                 ("Мама, ", "мама", "... Ко")])
+        self.assertEqual(len(stream.concordance("мама", limit=1)), 1)
+        self.assertEqual(stream.concordance("нет"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
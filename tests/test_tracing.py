@@ -0,0 +1,62 @@
+"""
+Тесты для модуля трассировки снятия омонимии.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Добавляем корневой каталог проекта в путь поиска модулей
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.morpho_analyzer.tracing import JsonLinesTraceSink, SampledSink
+
+
+class TestTraceSinks(unittest.TestCase):
+    """
+    Набор тестов для приемников событий трассировки.
+    """
+
+    def test_sampled_sink(self):
+        """
+        Тест передачи случайной доли событий.
+        """
+        events = []
+        sink = SampledSink(events.append, 0.25, seed=1)
+        for i in range(1000):
+            sink({'index': i})
+
+        self.assertEqual(sink.seen, 1000)
+        self.assertEqual(sink.passed, len(events))
+        self.assertTrue(150 < len(events) < 350)
+
+        # Граничные значения доли
+        events = []
+        sink = SampledSink(events.append, 0)
+        sink({'index': 0})
+        self.assertEqual(events, [])
+
+        with self.assertRaises(ValueError):
+            SampledSink(events.append, 1.5)
+
+    def test_json_lines_sink(self):
+        """
+        Тест записи событий в JSON Lines.
+        """
+        events = [{'word': 'коса', 'winner': 1}, {'word': 'ключ', 'winner': 0}]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'trace.jsonl')
+            with JsonLinesTraceSink(path) as sink:
+                for event in events:
+                    sink(event)
+
+            self.assertEqual(sink.count, 2)
+            with open(path, encoding='utf-8') as f:
+                self.assertEqual([json.loads(line) for line in f], events)
+
+
+if __name__ == '__main__':
+    unittest.main()
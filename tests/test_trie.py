@@ -4,12 +4,13 @@
 
 import os
 import sys
+import tempfile
 import unittest
 
 # Добавляем корневой каталог проекта в путь поиска модулей
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.morpho_analyzer.trie import PrefixTree, TrieNode
+from src.morpho_analyzer.trie import PrefixTree, TrieNode, traverse, walk
 
 
 class TestTrieNode(unittest.TestCase):
@@ -155,6 +156,32 @@ class TestPrefixTree(unittest.TestCase):
         # Проверяем, что все слова найдены
         self.assertSetEqual(found_words, {"молоко", "молодой", "море"})
     
+    def test_iter_words(self):
+        """
+        Тест ленивого обхода слов с ограничением и порядком по частоте.
+        """
+        self.trie.insert(["мо", "ло", "ко"], {"word": "молоко"})
+        self.trie.insert(["мо", "ло", "дой"], {"word": "молодой"})
+        self.trie.insert(["мо", "ло", "дой"], {"word": "молодой"})
+        self.trie.insert(["мо", "ло"], {"word": "моло"})
+        self.trie.insert(["мо", "ре"], {"word": "море"})
+        self.trie.insert(["мо", "ре"], {"word": "море"})
+        self.trie.insert(["мо", "ре"], {"word": "море"})
+        
+        # Генератор не собирает результаты заранее и совпадает со списком
+        words = self.trie.iter_words(["мо"])
+        self.assertEqual(next(words)[0], ["мо", "ло"])
+        self.assertEqual(list(self.trie.iter_words(["мо"])), self.trie.starts_with_prefix(["мо"]))
+        
+        self.assertEqual(len(list(self.trie.iter_words(limit=2))), 2)
+        self.assertEqual(list(self.trie.iter_words(["не"])), [])
+        
+        ranked = [syllables for syllables, _ in self.trie.iter_words(by_frequency=True)]
+        self.assertEqual(ranked, [["мо", "ре"], ["мо", "ло", "дой"], ["мо", "ло"], ["мо", "ло", "ко"]])
+        
+        top = list(self.trie.iter_words(["мо", "ло"], limit=1, by_frequency=True))
+        self.assertEqual(top, [(["мо", "ло", "дой"], [{"word": "молодой"}])])
+    
     def test_get_statistics(self):
         """
         Тест получения статистики дерева.
@@ -179,6 +206,43 @@ class TestPrefixTree(unittest.TestCase):
         self.assertEqual(stats['word_count'], 3)
         self.assertEqual(stats['max_depth'], 3)  # максимальная глубина 3 для молоко и молодой
     
+    def test_incremental_statistics(self):
+        """
+        Тест совпадения счетчиков, обновляемых при вставке, с полным пересчетом.
+        """
+        self.trie.insert(["мо", "ло", "ко"], {"word": "молоко"})
+        self.trie.insert(["мо", "ло", "дой"], {"word": "молодой"})
+        self.trie.insert(["мо", "ре"], {"word": "море"})
+        self.trie.insert(["мо", "ре"], {"word": "Море"})
+        self.trie.insert(["ре", "ка"])
+        
+        stats = self.trie.get_statistics()
+        self.assertEqual(stats['node_count'], 8)
+        self.assertEqual(stats['level_distribution'], {0: 1, 1: 2, 2: 3, 3: 2})
+        self.assertEqual(stats['avg_branching'], 7 / 4)
+        self.assertEqual(stats['most_common_syllables'][:3], [("мо", 4), ("ре", 3), ("ло", 2)])
+        self.assertEqual(self.trie.get_statistics(top_n=2)['most_common_syllables'],
+                         [("мо", 4), ("ре", 3)])
+        
+        # После десериализации счетчики пересчитываются обходом дерева
+        new_trie = PrefixTree.deserialize(self.trie.serialize())
+        self.assertEqual(new_trie.get_statistics(), stats)
+    
+    def test_statistics_tie_order(self):
+        """
+        Тест порядка слогов с равной частотой: по алфавиту, независимо от порядка вставки.
+        """
+        words = [["ко", "ра"], ["ба"], ["ра", "ко"], ["ба", "ра"]]
+        reversed_trie = PrefixTree()
+        for syllables in words:
+            self.trie.insert(syllables)
+        for syllables in reversed(words):
+            reversed_trie.insert(syllables)
+        
+        expected = [("ра", 3), ("ба", 2), ("ко", 2)]
+        self.assertEqual(self.trie.get_statistics()['most_common_syllables'], expected)
+        self.assertEqual(reversed_trie.get_statistics()['most_common_syllables'], expected)
+    
     def test_serialize_deserialize(self):
         """
         Тест сериализации и десериализации дерева.
@@ -200,6 +264,146 @@ class TestPrefixTree(unittest.TestCase):
         self.assertIsNotNone(new_trie.search(["мо", "ло", "ко"]))
         self.assertIsNotNone(new_trie.search(["мо", "ло", "дой"]))
 
+    
+    def test_deduplicated_payloads(self):
+        """
+        Тест хранения совпадающих данных слова один раз со счетчиком и позициями.
+        """
+        syllables = ["мо", "ре"]
+        noun = {"word": "море", "lemma": "море", "pos": "NOUN", "tags": {"case": "nomn"}}
+        self.trie.insert(syllables, noun, position=0)
+        self.trie.insert(syllables, dict(noun), position=5)
+        self.trie.insert(syllables, dict(noun, tags={"case": "accs"}), position=7)
+        self.trie.insert(syllables, noun)
+        
+        # Поиск возвращает уникальные данные в порядке первой вставки
+        self.assertEqual(self.trie.search(syllables), [noun, dict(noun, tags={"case": "accs"})])
+        self.assertIs(self.trie.search(syllables)[0], noun)
+        self.assertEqual(self.trie.word_count, 4)
+        self.assertEqual([(count, positions) for _, count, positions in self.trie.search_occurrences(syllables)],
+                         [(3, [0, 5]), (1, [7])])
+        self.assertIsNone(self.trie.search_occurrences(["мо"]))
+        
+        # Счетчики и позиции сохраняются при сериализации
+        serialized = self.trie.serialize()
+        node = serialized["root"]["children"]["мо"]["children"]["ре"]
+        self.assertEqual(node["word_counts"], [3, 1])
+        self.assertEqual(node["word_positions"], [[0, 5], [7]])
+        new_trie = PrefixTree.deserialize(serialized)
+        self.assertEqual(new_trie.search_occurrences(syllables), self.trie.search_occurrences(syllables))
+        
+        # Данные прежнего формата (копия на каждую вставку) объединяются при чтении
+        del node["word_counts"], node["word_positions"]
+        node["word_data"] = [noun, noun, dict(noun)]
+        self.assertEqual([(data, count) for data, count, _ in
+                          PrefixTree.deserialize(serialized).search_occurrences(syllables)],
+                         [(noun, 3)])
+    
+    def test_binary_format(self):
+        """
+        Тест сохранения дерева в двоичный формат и чтения через mmap.
+        """
+        self.trie.insert(["мо", "ло", "ко"], {"word": "молоко", "pos": "NOUN"})
+        self.trie.insert(["мо", "ло", "дой"], {"word": "молодой", "pos": "ADJF"})
+        self.trie.insert(["мо", "ре"], {"word": "море", "pos": "NOUN"})
+        self.trie.insert(["мо", "ре"], {"word": "Море", "pos": "NOUN"})
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "trie.bin")
+            self.trie.save_binary(path)
+            
+            with PrefixTree.open_binary(path) as mapped:
+                self.assertEqual(mapped.word_count, 4)
+                self.assertEqual(mapped.search(["мо", "ре"]), self.trie.search(["мо", "ре"]))
+                self.assertEqual(mapped.search(["мо", "ло", "ко"]), self.trie.search(["мо", "ло", "ко"]))
+                self.assertIsNone(mapped.search(["мо", "ло"]))
+                self.assertIsNone(mapped.search(["не"]))
+                
+                results = mapped.starts_with_prefix(["мо", "ло"])
+                self.assertEqual(sorted(data[0]["word"] for _, data in results),
+                                 ["молодой", "молоко"])
+                self.assertEqual(len(mapped.get_all_words()), 3)
+                self.assertEqual(mapped.starts_with_prefix(["ре"]), [])
+                
+                # Самое частое слово выдается первым
+                ranked = list(mapped.iter_words(["мо"], by_frequency=True))
+                self.assertEqual(ranked[0], (["мо", "ре"], self.trie.search(["мо", "ре"])))
+                self.assertEqual(len(ranked), 3)
+                self.assertEqual(len(list(mapped.iter_words(limit=1))), 1)
+            
+            # Файл другого формата не открывается
+            with open(path, 'r+b') as f:
+                f.write(b'BROKEN!!')
+            with self.assertRaises(ValueError):
+                PrefixTree.open_binary(path)
+    
+    def test_binary_occurrences(self):
+        """
+        Тест сохранения счетчиков и позиций данных слова в двоичном формате.
+        """
+        noun = {"word": "море", "pos": "NOUN", "tags": {"case": "nomn"}}
+        accs = dict(noun, tags={"case": "accs"})
+        self.trie.insert(["мо", "ре"], noun, position=0)
+        self.trie.insert(["мо", "ре"], dict(noun), position=4)
+        self.trie.insert(["мо", "ре"], accs, position=9)
+        self.trie.insert(["мо", "ре"], dict(noun))
+        self.trie.insert(["мо", "ло", "ко"], {"word": "молоко", "pos": "NOUN"})
+        self.trie.insert(["мо", "ло", "ко"], {"word": "молоко", "pos": "NOUN"})
+        self.trie.insert(["ре", "ка"], {"word": "река", "pos": "NOUN"}, position=2)
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "trie.bin")
+            self.trie.save_binary(path)
+            
+            with PrefixTree.open_binary(path) as mapped:
+                for syllables, _ in self.trie.iter_words():
+                    self.assertEqual(mapped.search_occurrences(syllables),
+                                     self.trie.search_occurrences(syllables))
+                self.assertEqual([(count, positions) for _, count, positions in
+                                  mapped.search_occurrences(["мо", "ре"])], [(3, [0, 4]), (1, [9])])
+                self.assertIsNone(mapped.search_occurrences(["мо", "ло"]))
+                self.assertIsNone(mapped.search_occurrences(["не"]))
+                self.assertEqual(list(mapped.iter_words(by_frequency=True)),
+                                 list(self.trie.iter_words(by_frequency=True)))
+    
+    def test_deep_tree(self):
+        """
+        Тест обхода дерева глубже предела рекурсии интерпретатора.
+        """
+        depth = sys.getrecursionlimit() * 2
+        syllables = ["ла"] * depth
+        self.trie.insert(syllables, {"word": "ла" * depth})
+        
+        self.assertEqual(len(self.trie.get_all_words()), 1)
+        self.assertEqual(self.trie.get_statistics()["max_depth"], depth)
+        
+        new_trie = PrefixTree.deserialize(self.trie.serialize())
+        self.assertIsNotNone(new_trie.search(syllables))
+    
+    def test_walk(self):
+        """
+        Тест порядка обхода, ограничения глубины и событий выхода из узла.
+        """
+        self.trie.insert(["мо", "ло", "ко"])
+        self.trie.insert(["мо", "ре"])
+        self.trie.insert(["ре", "ка"])
+        
+        paths = [tuple(path) for _, path, _, _ in walk(self.trie.root)]
+        self.assertEqual(paths, [(), ("мо",), ("мо", "ло"), ("мо", "ло", "ко"),
+                                 ("мо", "ре"), ("ре",), ("ре", "ка")])
+        
+        paths = [tuple(path) for _, path, _, _ in walk(self.trie.root, max_depth=1)]
+        self.assertEqual(paths, [(), ("мо",), ("ре",)])
+        
+        # Узел покидается только после всех его потомков
+        events = []
+        traverse(self.trie.root,
+                 pre_visit=lambda node, path, depth: events.append(("in", tuple(path))),
+                 post_visit=lambda node, path, depth: events.append(("out", tuple(path))))
+        self.assertLess(events.index(("out", ("мо", "ло", "ко"))), events.index(("out", ("мо",))))
+        self.assertEqual(events[-1], ("out", ()))
+        self.assertEqual(len(events), 14)
+
 
 if __name__ == '__main__':
     unittest.main()